@@ -178,6 +178,31 @@ class MetaAST(type):
 
         cls._fields = fields
 
+        # Field layout used by AST.__init__ to populate the instance
+        # dict directly, unless runtime type checking is enabled.
+        static_defaults = {}
+        default_factories = []
+        descriptor_fields = []
+        for field_name, field in fields.items():
+            if _is_data_descriptor(getattr(cls, field_name, None)):
+                # Field overriden as a property in a subclass.
+                descriptor_fields.append(field)
+            elif callable(field.default):
+                default_factories.append((field_name, field.default))
+            else:
+                static_defaults[field_name] = field.default
+
+        cls._ast_field_names = frozenset(fields)
+        cls._ast_nonmeta_fields = tuple(
+            field_name for field_name, field in fields.items()
+            if not field.meta)
+        cls._ast_static_defaults = static_defaults
+        cls._ast_default_factories = tuple(default_factories)
+        cls._ast_descriptor_fields = tuple(descriptor_fields)
+
+        if __debug__ and any(isinstance(base, MetaAST) for base in bases):
+            _install_setattr(cls)
+
     def get_field(cls, name):
         return cls._fields.get(name)
 
@@ -187,32 +212,52 @@ class AST(object, metaclass=MetaAST):
     __ast_frozen_fields__ = frozenset()
 
     def __init__(self, **kwargs):
-        if type(self).__abstract_node__:
+        cls = type(self)
+        if cls.__abstract_node__:
             raise ASTError(
                 f'cannot instantiate abstract AST node '
                 f'{self.__class__.__name__!r}')
 
-        should_check_types = __debug__ and _check_type is _check_type_real
+        if __debug__ and _check_type is _check_type_real:
+            self._init_checked(kwargs)
+            return
+
+        if not cls._ast_field_names.issuperset(kwargs):
+            kwargs = {k: v for k, v in kwargs.items()
+                      if k in cls._ast_field_names}
+
+        for field in cls._ast_descriptor_fields:
+            self._init_field(field, kwargs.pop(field.name, _marker))
+
+        # Bypass overloaded setattr
+        attrs = self.__dict__
+        attrs.update(cls._ast_static_defaults)
+        for field_name, factory in cls._ast_default_factories:
+            if field_name not in kwargs:
+                attrs[field_name] = factory()
+        attrs.update(kwargs)
+
+    def _init_checked(self, kwargs):
         for field_name, field in self.__class__._fields.items():
-            if field_name in kwargs:
-                value = kwargs[field_name]
-            elif field.default is not None:
-                if callable(field.default):
-                    value = field.default()
-                else:
-                    value = field.default
+            value = kwargs.get(field_name, _marker)
+            self._init_field(field, value, check_type=True)
+
+    def _init_field(self, field, value, *, check_type=False):
+        if value is _marker:
+            if callable(field.default):
+                value = field.default()
             else:
-                value = None
+                value = field.default
 
-            if should_check_types:
-                self.check_field_type(field, value)
+        if check_type:
+            self.check_field_type(field, value)
 
-            # Bypass overloaded setattr
-            try:
-                object.__setattr__(self, field_name, value)
-            except AttributeError:
-                # Field overriden as a property in a subclass.
-                pass
+        # Bypass overloaded setattr
+        try:
+            object.__setattr__(self, field.name, value)
+        except AttributeError:
+            # Field overriden as a property in a subclass.
+            pass
 
     def __copy__(self):
         copied = self.__class__()
@@ -226,15 +271,6 @@ class AST(object, metaclass=MetaAST):
             setattr(copied, field, copy.deepcopy(value, memo))
         return copied
 
-    if __debug__:
-        def __setattr__(self, name, value):
-            super().__setattr__(name, value)
-            field = self._fields.get(name)
-            if field:
-                self.check_field_type(field, value)
-                if name in self.__ast_frozen_fields__:
-                    raise TypeError(f'cannot set immutable {name} on {self!r}')
-
     def check_field_type(self, field, value):
         def raise_error(field_type_name, value):
             raise TypeError(
@@ -248,6 +284,41 @@ class AST(object, metaclass=MetaAST):
         markup.dump(self)
 
 
+def _checked_setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    field = self._fields.get(name)
+    if field:
+        self.check_field_type(field, value)
+        if name in self.__ast_frozen_fields__:
+            raise TypeError(f'cannot set immutable {name} on {self!r}')
+
+
+def _frozen_fields_setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    if name in self.__ast_frozen_fields__:
+        raise TypeError(f'cannot set immutable {name} on {self!r}')
+
+
+def _install_setattr(cls):
+    # Field assignments are only intercepted when there is something
+    # to check, so that the common case is a plain attribute store.
+    if _check_type is _check_type_real:
+        setattr_impl = _checked_setattr
+    elif cls.__ast_frozen_fields__:
+        setattr_impl = _frozen_fields_setattr
+    else:
+        return
+
+    # Leave alone custom __setattr__ implementations, such as the
+    # one in ImmutableASTMixin; they call into ours via super().
+    if cls.__setattr__ in (object.__setattr__, _frozen_fields_setattr):
+        cls.__setattr__ = setattr_impl
+
+
+def _is_data_descriptor(obj):
+    return obj is not None and hasattr(type(obj), '__set__')
+
+
 class ImmutableASTMixin:
     __frozen = False
     __ast_mutable_fields__ = frozenset()
@@ -295,6 +366,22 @@ _marker = object()
 
 
 def iter_fields(node, *, include_meta=True, exclude_unset=False):
+    if exclude_unset:
+        yield from _iter_set_fields(node, include_meta=include_meta)
+        return
+
+    if include_meta:
+        field_names = node._fields
+    else:
+        field_names = node._ast_nonmeta_fields
+
+    for field_name in field_names:
+        field_val = getattr(node, field_name, _marker)
+        if field_val is not _marker:
+            yield field_name, field_val
+
+
+def _iter_set_fields(node, *, include_meta):
     exclude_meta = not include_meta
     for field_name, field in node._fields.items():
         if exclude_meta and field.meta:
@@ -302,16 +389,46 @@ def iter_fields(node, *, include_meta=True, exclude_unset=False):
         field_val = getattr(node, field_name, _marker)
         if field_val is _marker:
             continue
-        if exclude_unset:
-            if callable(field.default):
-                default = field.default()
-            else:
-                default = field.default
-            if field_val == default:
-                continue
+        if callable(field.default):
+            default = field.default()
+        else:
+            default = field.default
+        if field_val == default:
+            continue
         yield field_name, field_val
 
 
+def copy_tree(node):
+    """Return a copy of an AST tree, faster than ``copy.deepcopy()``.
+
+    All AST nodes and the lists, tuples and dicts holding them are
+    copied, while all other values (strings, enums, parser contexts)
+    are shared with the original tree.  Field values are not
+    revalidated.
+    """
+    return _copy_tree(node, {})
+
+
+def _copy_tree(value, memo):
+    if isinstance(value, AST):
+        copied = memo.get(id(value))
+        if copied is None:
+            cls = type(value)
+            copied = memo[id(value)] = cls.__new__(cls)
+            copied.__dict__.update({
+                k: _copy_tree(v, memo) for k, v in value.__dict__.items()
+            })
+        return copied
+    elif type(value) is list:
+        return [_copy_tree(v, memo) for v in value]
+    elif type(value) is tuple:
+        return tuple(_copy_tree(v, memo) for v in value)
+    elif type(value) is dict:
+        return {k: _copy_tree(v, memo) for k, v in value.items()}
+    else:
+        return value
+
+
 def _is_optional(type_):
     return (typing_inspect.is_union_type(type_) and
             type(None) in typing_inspect.get_args(type_, evaluate=True))
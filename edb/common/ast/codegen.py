@@ -45,11 +45,21 @@ class SourceGenerator(NodeVisitor):
         self.new_lines = 0
         self.current_line = 1
         self.pretty = pretty
+        if not pretty:
+            # Compact output needs no line and indentation bookkeeping.
+            self.write = self._write_compact
 
     def node_visit(self, node: base.AST) -> None:
-        method = 'visit_' + node.__class__.__name__
-        visitor = getattr(self, method, self.generic_visit)
-        return visitor(node)
+        return self.get_visitor(node)(node)
+
+    @classmethod
+    def _find_visitor_name(cls, node_cls: type) -> str:
+        # Code generators dispatch on the exact node class.
+        method = 'visit_' + node_cls.__name__
+        if hasattr(cls, method):
+            return method
+        else:
+            return 'generic_visit'
 
     def write(
         self,
@@ -79,6 +89,25 @@ class SourceGenerator(NodeVisitor):
                     'invalid text chunk in codegen: {!r}'.format(chunk))
             self.result.append(chunk)
 
+    def _write_compact(
+        self,
+        *x: str,
+        delimiter: Optional[str] = None
+    ) -> None:
+        if self.new_lines:
+            self.result.append(' ')
+            self.new_lines = 0
+
+        for chunk in x:
+            if not isinstance(chunk, str):
+                raise ValueError(
+                    'invalid text chunk in codegen: {!r}'.format(chunk))
+
+        if delimiter:
+            self.result.append(delimiter.join(x))
+        else:
+            self.result.extend(x)
+
     def visit_list(
         self,
         items: Sequence[base.AST],
@@ -60,7 +60,7 @@ class NodeTransformer(visitor.NodeVisitor):
     """
 
     def generic_visit(self, node):
-        for field, old_value in base.iter_fields(node, include_meta=False):
+        for field in node._ast_nonmeta_fields:
             old_value = getattr(node, field, None)
 
             if typeutils.is_container(old_value):
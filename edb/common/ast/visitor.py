@@ -18,6 +18,7 @@
 
 
 from __future__ import annotations
+from typing import *
 
 from edb.common import typeutils
 
@@ -109,6 +110,14 @@ class NodeVisitor:
     allows modifications.
     """
 
+    # Node class -> name of the visitor method, populated lazily,
+    # separately for every visitor class.
+    _visitor_names: Dict[type, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visitor_names = {}
+
     def __init__(self, *, context=None, memo=None):
         if memo is not None:
             self._memo = memo
@@ -147,17 +156,28 @@ class NodeVisitor:
         else:
             self.memo[node] = None
 
-        for cls in node.__class__.__mro__:
-            method = 'visit_' + cls.__name__
-            visitor = getattr(self, method, None)
-            if visitor is not None:
-                break
-        else:
-            visitor = self.generic_visit
-        result = visitor(node)
+        result = self.get_visitor(node)(node)
         self.memo[node] = result
         return result
 
+    def get_visitor(self, node):
+        """Return the visitor method for *node*."""
+        names = type(self)._visitor_names
+        node_cls = node.__class__
+        try:
+            method = names[node_cls]
+        except KeyError:
+            method = names[node_cls] = self._find_visitor_name(node_cls)
+        return getattr(self, method)
+
+    @classmethod
+    def _find_visitor_name(cls, node_cls):
+        for base_cls in node_cls.__mro__:
+            method = 'visit_' + base_cls.__name__
+            if hasattr(cls, method):
+                return method
+        return 'generic_visit'
+
     def visit(self, node):
         if typeutils.is_container(node):
             return self.container_visit(node)
@@ -167,8 +187,11 @@ class NodeVisitor:
     def generic_visit(self, node, *, combine_results=None):
         field_results = []
 
-        for _field, value in base.iter_fields(node, include_meta=False):
-            if typeutils.is_container(value):
+        for field in node._ast_nonmeta_fields:
+            value = getattr(node, field, None)
+            if value is None:
+                continue
+            elif typeutils.is_container(value):
                 for item in value:
                     if base.is_ast_node(item):
                         res = self.visit(item)
@@ -123,6 +123,9 @@ class flags(metaclass=FlagsMeta):
     log_metrics = Flag(
         doc="Log verbose statistics on connections and compiler behavior.")
 
+    startup_profile = Flag(
+        doc="Log time spent in server startup phases and heavy imports.")
+
 
 @contextlib.contextmanager
 def timeit(title='block'):
@@ -0,0 +1,152 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import math
+
+
+class LogHistogram:
+    """A fixed-size histogram with logarithmically sized buckets.
+
+    Similarly to HdrHistogram, values between *min_value* and
+    *max_value* are recorded with a bounded relative error of
+    *precision*, so memory usage does not depend on the number of
+    recorded values.  Values outside of the range are clamped.
+
+    >>> h = LogHistogram()
+    >>> for v in (0.001, 0.002, 0.003, 0.004):
+    ...     h.record(v)
+    >>> h.count
+    4
+    >>> round(h.quantile(0.5), 4)
+    0.002
+    """
+
+    __slots__ = ('_min_value', '_max_value', '_precision', '_log_base',
+                 '_counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(
+        self,
+        *,
+        min_value: float = 1e-6,
+        max_value: float = 3600.0,
+        precision: float = 0.01,
+    ) -> None:
+        if not 0 < min_value < max_value:
+            raise ValueError('expected 0 < min_value < max_value')
+        if not 0 < precision < 1:
+            raise ValueError('expected 0 < precision < 1')
+
+        self._min_value = min_value
+        self._max_value = max_value
+        self._precision = precision
+        # Each bucket is (1 + 2 * precision) times wider than the
+        # previous one, so its midpoint is within *precision* of any
+        # value in it.
+        self._log_base = math.log1p(2 * precision)
+        nbuckets = math.ceil(
+            math.log(max_value / min_value) / self._log_base) + 2
+        self._counts = [0] * nbuckets
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        if value <= self._min_value:
+            return 0
+        idx = int(math.log(value / self._min_value) / self._log_base) + 1
+        return min(idx, len(self._counts) - 1)
+
+    def _bucket_value(self, idx: int) -> float:
+        if idx == 0:
+            return self._min_value
+        return self._min_value * math.exp((idx - 0.5) * self._log_base)
+
+    def record(self, value: float) -> None:
+        self._counts[self._index(value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: LogHistogram) -> None:
+        if (self._min_value != other._min_value
+                or self._max_value != other._max_value
+                or self._precision != other._precision):
+            raise ValueError('cannot merge histograms with different layouts')
+
+        counts = self._counts
+        for idx, cnt in enumerate(other._counts):
+            if cnt:
+                counts[idx] += cnt
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            return 0.0
+        return self.sum / self.count
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Return approximate values for the given quantiles.
+
+        *qs* must be sorted in ascending order; all quantiles are
+        computed in a single pass over the buckets.
+        """
+        if not self.count:
+            return [0.0] * len(qs)
+
+        result = []
+        qs_iter = iter(qs)
+        q = next(qs_iter, None)
+        seen = 0
+        for idx, cnt in enumerate(self._counts):
+            if not cnt:
+                continue
+            seen += cnt
+            while q is not None and seen >= q * self.count:
+                value = self._bucket_value(idx)
+                result.append(max(self.min, min(value, self.max)))
+                q = next(qs_iter, None)
+            if q is None:
+                break
+
+        while len(result) < len(qs):
+            result.append(self.max)
+
+        return result
@@ -34,7 +34,7 @@ from edb import errors
 from edb.common.exceptions import add_context, get_context
 from edb.common import context as pctx
 from edb.common import lexer
-from edb._edgeql_rust import TokenizerError
+from edb._edgeql_rust import Automaton, TokenizerError
 from edb.errors import EdgeQLSyntaxError
 
 ParserContext = pctx.ParserContext
@@ -310,6 +310,113 @@ class Spec(parsing.Spec):
         return ret
 
 
+class NativeAutomaton:
+    """LR automaton of a parser spec driven by native code.
+
+    The native automaton consumes the whole token stream and produces
+    the sequence of shifts and reductions, which is then replayed in a
+    single pass calling the reduce methods of the grammar.  The result
+    is identical to that of running the spec with ``parsing.Lr``.
+    """
+
+    def __init__(self, spec: parsing.Spec) -> None:
+        terminals: Dict[parsing.SymbolSpec, int] = {}
+        nonterms: Dict[parsing.SymbolSpec, int] = {}
+        productions: Dict[parsing.Production, int] = {}
+
+        for sym in spec._sym2spec.values():
+            if isinstance(sym, parsing.TokenSpec):
+                terminals[sym] = len(terminals)
+
+        actions = []
+        for row in spec._action:
+            native_row = {}
+            for sym, (action,) in row.items():
+                if isinstance(action, parsing.ShiftAction):
+                    native_row[terminals[sym]] = action.nextState
+                else:
+                    prod = productions.setdefault(
+                        action.production, len(productions))
+                    native_row[terminals[sym]] = -prod - 1
+            actions.append(native_row)
+
+        gotos = []
+        for row in spec._goto:
+            gotos.append({
+                nonterms.setdefault(sym, len(nonterms)): state
+                for sym, state in row.items()
+            })
+
+        self._productions = [
+            (prod.method, prod.lhs.nontermType, len(prod.rhs))
+            for prod in productions
+        ]
+
+        self._terminals = {
+            cls: terminals[sym]
+            for cls, sym in spec._sym2spec.items()
+            if isinstance(sym, parsing.TokenSpec)
+        }
+
+        self._automaton = Automaton(
+            actions,
+            gotos,
+            [
+                (nonterms.setdefault(prod.lhs, len(nonterms)), len(prod.rhs))
+                for prod in productions
+            ],
+            terminals[spec._sym2spec[parsing.EndOfInput]],
+        )
+
+    def parse(
+        self,
+        parser: parsing.Lr,
+        tokens: Sequence[Token],
+        *,
+        position: Optional[List[int]] = None,
+    ) -> Tuple[Optional[parsing.Nonterm], Optional[int]]:
+        """Parse *tokens*.
+
+        Return the start symbol and the index of the unexpected token
+        (the number of tokens for the end of input) if the input is not
+        valid, in which case the reductions preceding the error are
+        still done.
+
+        If *position* is given, its only element is kept set to the
+        index of the lookahead token, so that the caller can locate
+        an exception raised by a reduce method.
+        """
+        terminals = self._terminals
+        trace, error = self._automaton.parse(
+            [terminals[type(token)] for token in tokens])
+
+        productions = self._productions
+        stack: List[Any] = []
+        pos = 0
+
+        for action in trace:
+            if action < 0:
+                stack.append(tokens[pos])
+                pos += 1
+                if position is not None:
+                    position[0] = pos
+            else:
+                method, nonterm, rhs_len = productions[action]
+                sym = nonterm(parser)
+                if rhs_len:
+                    rhs = stack[-rhs_len:]
+                    del stack[-rhs_len:]
+                    result = method(sym, *rhs)
+                else:
+                    result = method(sym)
+                stack.append(sym if result is None else result)
+
+        if error is not None:
+            return None, error
+        else:
+            return stack[0], None
+
+
 def _derive_hint(
         input: str, message: str, position: (int, int, int)) -> Optional[str]:
     _, _, off = position
@@ -326,6 +433,7 @@ class Parser:
 
     def cleanup(self):
         self.__class__.parser_spec = None
+        self.__class__.native_automaton = None
         self.__class__.lexer_spec = None
         self.lexer = None
         self.parser = None
@@ -360,6 +468,21 @@ class Parser:
         self.__class__.parser_spec = spec
         return spec
 
+    def get_native_automaton(self):
+        cls = self.__class__
+
+        try:
+            automaton = cls.__dict__['native_automaton']
+        except KeyError:
+            pass
+        else:
+            if automaton is not None:
+                return automaton
+
+        automaton = NativeAutomaton(self.get_parser_spec())
+        self.__class__.native_automaton = automaton
+        return automaton
+
     def localpath(self, mod, type):
         return os.path.join(
             os.path.dirname(mod.__file__),
@@ -393,16 +516,54 @@ class Parser:
             self.reset_parser(input)
             mod = self.get_parser_spec_module()
 
-            tok = self.lexer.token()
+            if self.get_debug():
+                # Drive the automaton in Python, so that the verbose
+                # output of the parser is available.
+                tok = self.lexer.token()
 
-            while tok:
-                token = self.process_lex_token(mod, tok)
-                if token is not None:
-                    self.parser.token(token)
+                while tok:
+                    token = self.process_lex_token(mod, tok)
+                    if token is not None:
+                        self.parser.token(token)
+
+                    tok = self.lexer.token()
+
+                self.parser.eoi()
+                start = self.parser.start[0]
+            else:
+                automaton = self.get_native_automaton()
+                lex_tokens = []
+                tokens = []
 
                 tok = self.lexer.token()
 
-            self.parser.eoi()
+                while tok:
+                    token = self.process_lex_token(mod, tok)
+                    if token is not None:
+                        lex_tokens.append(tok)
+                        tokens.append(token)
+
+                    tok = self.lexer.token()
+
+                position = [0]
+                try:
+                    start, error = automaton.parse(
+                        self.parser, tokens, position=position)
+                except Exception:
+                    # Like parsing.Lr, report the errors raised by
+                    # reduce methods at the lookahead token.
+                    if position[0] < len(lex_tokens):
+                        tok = lex_tokens[position[0]]
+                    raise
+
+                if error is not None:
+                    if error < len(tokens):
+                        tok = lex_tokens[error]
+                        sym = tokens[error]
+                    else:
+                        sym = parsing.EndOfInput(self.parser)
+                    raise parsing.UnexpectedToken(
+                        f'Unexpected token: {sym!r}')
 
         except TokenizerError as e:
             message, position = e.args
@@ -424,7 +585,7 @@ class Parser:
             raise self.get_exception(
                 e, context=self.context(tok), token=tok) from e
 
-        return self.parser.start[0].val
+        return start.val
 
     def context(self, tok=None, pos: (int, int, int) = None):
         lex = self.lexer
@@ -0,0 +1,236 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Minimal metrics registry rendering the Prometheus text format."""
+
+from __future__ import annotations
+from typing import *
+
+import bisect
+import math
+
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0,
+)
+
+
+class Registry:
+
+    def __init__(self, *, prefix: Optional[str] = None) -> None:
+        self._prefix = prefix
+        self._metrics: Dict[str, BaseMetric] = {}
+
+    def _add(self, metric: BaseMetric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f'metric {metric.name!r} is already registered')
+        self._metrics[metric.name] = metric
+
+    def _make_name(self, name: str, unit: Optional[str]) -> str:
+        if self._prefix:
+            name = f'{self._prefix}_{name}'
+        if unit:
+            name = f'{name}_{unit}'
+        return name
+
+    def new_counter(
+        self,
+        name: str,
+        desc: str,
+        *,
+        unit: Optional[str] = None,
+        labels: Tuple[str, ...] = (),
+    ) -> Counter:
+        metric = Counter(self._make_name(name, unit), desc, labels)
+        self._add(metric)
+        return metric
+
+    def new_gauge(
+        self,
+        name: str,
+        desc: str,
+        *,
+        unit: Optional[str] = None,
+        labels: Tuple[str, ...] = (),
+    ) -> Gauge:
+        metric = Gauge(self._make_name(name, unit), desc, labels)
+        self._add(metric)
+        return metric
+
+    def new_histogram(
+        self,
+        name: str,
+        desc: str,
+        *,
+        unit: Optional[str] = None,
+        labels: Tuple[str, ...] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(
+            self._make_name(name, unit), desc, labels, buckets)
+        self._add(metric)
+        return metric
+
+    def generate(self) -> str:
+        buffer: List[str] = []
+        for metric in self._metrics.values():
+            metric._render(buffer)
+        buffer.append('')
+        return '\n'.join(buffer)
+
+
+class BaseMetric:
+
+    _type: ClassVar[str]
+
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        labels: Tuple[str, ...],
+    ) -> None:
+        self.name = name
+        self.desc = desc
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _check_labels(self, labels: Tuple[str, ...]) -> None:
+        if len(labels) != len(self.labels):
+            raise ValueError(
+                f'{self.name} expects {len(self.labels)} label values, '
+                f'got {len(labels)}')
+
+    def _render_labels(
+        self,
+        values: Tuple[str, ...],
+        extra: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        pairs = list(zip(self.labels, values))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        rendered = ','.join(
+            f'{label}="{_escape_label(value)}"' for label, value in pairs)
+        return f'{{{rendered}}}'
+
+    def _render_header(self, buffer: List[str]) -> None:
+        buffer.append(f'# HELP {self.name} {_escape_help(self.desc)}')
+        buffer.append(f'# TYPE {self.name} {self._type}')
+
+    def _render(self, buffer: List[str]) -> None:
+        self._render_header(buffer)
+        for labels, value in sorted(self._values.items()):
+            buffer.append(
+                f'{self.name}{self._render_labels(labels)} '
+                f'{_format_value(value)}')
+
+
+class Counter(BaseMetric):
+
+    _type = 'counter'
+
+    def inc(self, value: float = 1, *labels: str) -> None:
+        if value < 0:
+            raise ValueError('a counter cannot be decremented')
+        self._check_labels(labels)
+        self._values[labels] = self._values.get(labels, 0) + value
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+
+class Gauge(BaseMetric):
+
+    _type = 'gauge'
+
+    def set(self, value: float, *labels: str) -> None:
+        self._check_labels(labels)
+        self._values[labels] = value
+
+    def inc(self, value: float = 1, *labels: str) -> None:
+        self._check_labels(labels)
+        self._values[labels] = self._values.get(labels, 0) + value
+
+    def dec(self, value: float = 1, *labels: str) -> None:
+        self.inc(-value, *labels)
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+
+class Histogram(BaseMetric):
+
+    _type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        labels: Tuple[str, ...],
+        buckets: Sequence[float],
+    ) -> None:
+        super().__init__(name, desc, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        self._check_labels(labels)
+        data = self._values.get(labels)
+        if data is None:
+            # Per-bucket (non-cumulative) counts, plus the +Inf bucket,
+            # followed by the sum of all observed values.
+            data = self._values[labels] = [0] * (len(self.buckets) + 1)
+            data.append(0.0)
+        data[bisect.bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+    def _render(self, buffer: List[str]) -> None:
+        self._render_header(buffer)
+        for labels, data in sorted(self._values.items()):
+            total = 0
+            for bucket, count in zip(self.buckets, data):
+                total += count
+                le = self._render_labels(labels, ('le', _format_value(bucket)))
+                buffer.append(f'{self.name}_bucket{le} {total}')
+            total += data[len(self.buckets)]
+            le = self._render_labels(labels, ('le', '+Inf'))
+            buffer.append(f'{self.name}_bucket{le} {total}')
+            rendered = self._render_labels(labels)
+            buffer.append(
+                f'{self.name}_sum{rendered} {_format_value(data[-1])}')
+            buffer.append(f'{self.name}_count{rendered} {total}')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        if value.is_integer():
+            return f'{value:.1f}'
+    return repr(value)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', r'\\').replace('\n', r'\n')
+
+
+def _escape_label(text: str) -> str:
+    return (
+        text.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+    )
@@ -0,0 +1,361 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Lightweight request tracing.
+
+A trace is started with :func:`trace` for a unit of work (e.g. a
+protocol message) and nested :func:`span` blocks record the time
+spent in individual phases of it.  Finished traces are handed to
+the configured :class:`Exporter`.  Only a fraction of traces is
+recorded (see :func:`configure`); when the current unit of work
+is not sampled, :func:`span` is a cheap no-op.
+
+Spans can be propagated to other processes: :func:`get_context`
+returns an opaque picklable value that is passed to :func:`collect`
+on the remote side, and the spans collected there are merged back
+into the current trace with :func:`add_remote_spans`.
+"""
+
+
+from __future__ import annotations
+from typing import *
+
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+
+
+class Span:
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id',
+                 'start_ns', 'end_ns', 'attributes')
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        trace_id: int,
+        span_id: int,
+        parent_id: Optional[int],
+        start_ns: int,
+        end_ns: int = 0,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.attributes = attributes
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        return (self.name, self.trace_id, self.span_id, self.parent_id,
+                self.start_ns, self.end_ns, self.attributes)
+
+    @classmethod
+    def from_tuple(cls, data: Tuple[Any, ...]) -> Span:
+        name, trace_id, span_id, parent_id, start_ns, end_ns, attrs = data
+        return cls(name, trace_id=trace_id, span_id=span_id,
+                   parent_id=parent_id, start_ns=start_ns, end_ns=end_ns,
+                   attributes=attrs)
+
+    def __repr__(self) -> str:
+        return (f'<Span {self.name!r} {self.span_id:016x} '
+                f'{self.duration_ns / 1e6:.3f}ms>')
+
+
+class Exporter:
+    """Base class for trace exporters."""
+
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class JSONFileExporter(Exporter):
+    """Append traces to a file, one OTLP/JSON document per line.
+
+    Every line is an ``ExportTraceServiceRequest`` in the OpenTelemetry
+    JSON encoding, so the file can be fed to an OpenTelemetry collector
+    (e.g. with the ``otlpjsonfile`` receiver) or inspected directly.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        service_name: str = 'edgedb-server',
+    ) -> None:
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._resource = {
+            'attributes': [_attribute('service.name', service_name)],
+        }
+
+    def export(self, spans: List[Span]) -> None:
+        doc = {
+            'resourceSpans': [{
+                'resource': self._resource,
+                'scopeSpans': [{
+                    'scope': {'name': __name__},
+                    'spans': [_encode_span(s) for s in spans],
+                }],
+            }],
+        }
+        line = json.dumps(doc, separators=(',', ':'))
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {'boolValue': value}
+    elif isinstance(value, int):
+        encoded = {'intValue': str(value)}
+    elif isinstance(value, float):
+        encoded = {'doubleValue': value}
+    else:
+        encoded = {'stringValue': str(value)}
+    return {'key': key, 'value': encoded}
+
+
+def _encode_span(span: Span) -> Dict[str, Any]:
+    return {
+        'traceId': f'{span.trace_id:032x}',
+        'spanId': f'{span.span_id:016x}',
+        'parentSpanId': (
+            f'{span.parent_id:016x}' if span.parent_id is not None else ''),
+        'name': span.name,
+        'kind': 1,  # SPAN_KIND_INTERNAL
+        'startTimeUnixNano': str(span.start_ns),
+        'endTimeUnixNano': str(span.end_ns),
+        'attributes': [
+            _attribute(k, v) for k, v in (span.attributes or {}).items()
+        ],
+    }
+
+
+class _Trace:
+
+    __slots__ = ('trace_id', 'spans')
+
+    def __init__(self, trace_id: int) -> None:
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+
+
+class _SpanContext:
+
+    __slots__ = ('_trace', '_span', '_token')
+
+    def __init__(
+        self,
+        trace: _Trace,
+        name: str,
+        parent_id: Optional[int],
+        attributes: Optional[Dict[str, Any]],
+    ) -> None:
+        self._trace = trace
+        self._span = Span(
+            name,
+            trace_id=trace.trace_id,
+            span_id=_new_id(64),
+            parent_id=parent_id,
+            start_ns=0,
+            attributes=attributes,
+        )
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current.set((self._trace, self._span.span_id))
+        self._span.start_ns = time.time_ns()
+        return self._span
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        span = self._span
+        span.end_ns = time.time_ns()
+        if exc_type is not None:
+            if span.attributes is None:
+                span.attributes = {}
+            span.attributes['error'] = exc_type.__name__
+        _current.reset(self._token)
+        self._trace.spans.append(span)
+
+
+class _RootSpanContext(_SpanContext):
+
+    __slots__ = ()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        super().__exit__(exc_type, exc_val, exc_tb)
+        exporter = _exporter
+        if exporter is not None:
+            exporter.export(self._trace.spans)
+
+
+class _NoopSpanContext:
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+_NOOP = _NoopSpanContext()
+
+#: (trace, id of the innermost active span) of the current task.
+_current: contextvars.ContextVar[
+    Optional[Tuple[_Trace, Optional[int]]]
+] = contextvars.ContextVar('edb_tracing_current', default=None)
+
+_sample_rate: float = 0.0
+_exporter: Optional[Exporter] = None
+
+
+def _new_id(bits: int) -> int:
+    return random.getrandbits(bits) or 1
+
+
+def configure(
+    *,
+    sample_rate: float,
+    exporter: Optional[Exporter],
+) -> None:
+    """Set up tracing for this process.
+
+    *sample_rate* is the fraction of traces (between 0 and 1) that
+    are recorded and passed to *exporter*.
+    """
+    global _sample_rate, _exporter
+
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError('sample_rate must be between 0 and 1')
+
+    if _exporter is not None and _exporter is not exporter:
+        _exporter.close()
+
+    _exporter = exporter
+    _sample_rate = sample_rate if exporter is not None else 0.0
+
+
+def is_enabled() -> bool:
+    return _sample_rate > 0.0
+
+
+def trace(
+    name: str, **attributes: Any
+) -> ContextManager[Optional[Span]]:
+    """Start a new trace with a root span called *name*.
+
+    Whether the trace is recorded is decided by the configured
+    sample rate.  A trace started while another one is active is
+    recorded as a child span of it instead.
+    """
+    cur = _current.get()
+    if cur is not None:
+        cur_trace, parent_id = cur
+        return _SpanContext(cur_trace, name, parent_id, attributes or None)
+
+    if _sample_rate <= 0.0 or (
+            _sample_rate < 1.0 and random.random() >= _sample_rate):
+        return _NOOP
+
+    return _RootSpanContext(
+        _Trace(_new_id(128)), name, None, attributes or None)
+
+
+def span(
+    name: str, **attributes: Any
+) -> ContextManager[Optional[Span]]:
+    """Record the enclosed block as a child span of the current span.
+
+    Does nothing if there is no sampled trace in progress.
+    """
+    cur = _current.get()
+    if cur is None:
+        return _NOOP
+    cur_trace, parent_id = cur
+    return _SpanContext(cur_trace, name, parent_id, attributes or None)
+
+
+def get_context() -> Optional[Tuple[int, Optional[int]]]:
+    """Return the propagation context of the current span, if any."""
+    cur = _current.get()
+    if cur is None:
+        return None
+    cur_trace, parent_id = cur
+    return (cur_trace.trace_id, parent_id)
+
+
+class collect:
+    """Collect spans recorded under a propagated trace context.
+
+    Used on the remote side of a call made with the context returned
+    by :func:`get_context`.  When *context* is ``None``, nothing is
+    recorded.  The collected spans are available as a list of
+    picklable tuples in the ``spans`` attribute after the block exits.
+    """
+
+    __slots__ = ('_context', '_trace', '_token', 'spans')
+
+    def __init__(
+        self, context: Optional[Tuple[int, Optional[int]]]
+    ) -> None:
+        self._context = context
+        self._trace: Optional[_Trace] = None
+        self._token = None
+        self.spans: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> collect:
+        if self._context is not None:
+            trace_id, parent_id = self._context
+            self._trace = _Trace(trace_id)
+            self._token = _current.set((self._trace, parent_id))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._trace is not None:
+            _current.reset(self._token)
+            self.spans = [s.as_tuple() for s in self._trace.spans]
+            self._trace = None
+
+
+def add_remote_spans(spans: Iterable[Tuple[Any, ...]]) -> None:
+    """Add spans collected by :class:`collect` to the current trace."""
+    cur = _current.get()
+    if cur is None:
+        return
+    cur[0].spans.extend(Span.from_tuple(s) for s in spans)
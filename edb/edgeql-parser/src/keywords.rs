@@ -82,7 +82,6 @@ pub const UNRESERVED_KEYWORDS: &[&str] = &[
 
 pub const FUTURE_RESERVED_KEYWORDS: &[&str] = &[
     // Keep in sync with `tokenizer::is_keyword`
-    "analyze",
     "anyarray",
     "begin",
     "case",
@@ -92,7 +91,6 @@ pub const FUTURE_RESERVED_KEYWORDS: &[&str] = &[
     "do",
     "end",
     "execute",
-    "explain",
     "fetch",
     "get",
     "global",
@@ -124,6 +122,7 @@ pub const CURRENT_RESERVED_KEYWORDS: &[&str] = &[
     "__type__",
     "__std__",
     "alter",
+    "analyze",
     "and",
     "anytuple",
     "anytype",
@@ -139,6 +138,7 @@ pub const CURRENT_RESERVED_KEYWORDS: &[&str] = &[
     "else",
     "empty",
     "exists",
+    "explain",
     "extending",
     "false",
     "filter",
@@ -810,6 +810,7 @@ pub fn is_keyword(s: &str) -> bool {
         | "__type__"
         | "__std__"
         | "alter"
+        | "analyze"
         | "and"
         | "anytuple"
         | "anytype"
@@ -825,6 +826,7 @@ pub fn is_keyword(s: &str) -> bool {
         | "else"
         | "empty"
         | "exists"
+        | "explain"
         | "extending"
         | "false"
         | "filter"
@@ -859,7 +861,6 @@ pub fn is_keyword(s: &str) -> bool {
           // Keep in sync with keywords::CURRENT_RESERVED_KEYWORDS
         // # Future reserved keywords #
           // Keep in sync with keywords::FUTURE_RESERVED_KEYWORDS
-        | "analyze"
         | "anyarray"
         | "begin"
         | "case"
@@ -869,7 +870,6 @@ pub fn is_keyword(s: &str) -> bool {
         | "do"
         | "end"
         | "execute"
-        | "explain"
         | "fetch"
         | "get"
         | "global"
@@ -6,6 +6,7 @@ mod errors;
 mod keywords;
 mod tokenizer;
 pub mod normalize;
+pub mod parser;
 mod pynormalize;
 
 use errors::TokenizerError;
@@ -26,6 +27,7 @@ py_module_initializer!(
         m.add(py, "TokenizerError", py.get_type::<TokenizerError>())?;
         m.add(py, "Entry", py.get_type::<pynormalize::Entry>())?;
         m.add(py, "normalize", py_fn!(py, normalize(query: &PyString)))?;
+        m.add(py, "Automaton", py.get_type::<parser::Automaton>())?;
         m.add(py, "unreserved_keywords", keywords.unreserved)?;
         m.add(py, "future_reserved_keywords", keywords.future)?;
         m.add(py, "current_reserved_keywords", keywords.current)?;
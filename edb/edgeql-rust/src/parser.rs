@@ -0,0 +1,260 @@
+use std::collections::HashMap;
+
+use cpython::{PyList, PyObject, PyResult, Python, PyErr, ToPyObject};
+use cpython::{ObjectProtocol, PyDict, PythonObject};
+use cpython::exc::ValueError;
+
+
+/// An entry of the trace that means "shift the next token". All other
+/// entries are indexes of the reduced productions.
+pub const SHIFT: i32 = -1;
+
+
+#[derive(Debug, Clone, Copy)]
+pub enum Action {
+    Shift(u32),
+    Reduce(u32),
+}
+
+#[derive(Debug)]
+pub struct Production {
+    pub lhs: u32,
+    pub rhs_len: usize,
+}
+
+/// Tables of an LR(1) automaton exported from a `parsing.Spec`.
+#[derive(Debug)]
+pub struct Tables {
+    pub actions: Vec<HashMap<u32, Action>>,
+    pub gotos: Vec<HashMap<u32, u32>>,
+    pub productions: Vec<Production>,
+    pub end_of_input: u32,
+}
+
+#[derive(Debug, PartialEq)]
+pub struct Trace {
+    pub actions: Vec<i32>,
+    /// Index of the unexpected token (the number of tokens for
+    /// the end of input) if the input could not be parsed.
+    pub error: Option<usize>,
+}
+
+
+impl Tables {
+    pub fn validate(&self) -> Result<(), String> {
+        let nstates = self.actions.len();
+        if nstates == 0 || self.gotos.len() != nstates {
+            return Err("action and goto tables must have the same \
+                        non-zero number of states".into());
+        }
+        for row in &self.actions {
+            for action in row.values() {
+                match *action {
+                    Action::Shift(state) if state as usize >= nstates => {
+                        return Err(format!("invalid state {}", state));
+                    }
+                    Action::Reduce(prod)
+                        if prod as usize >= self.productions.len() =>
+                    {
+                        return Err(format!("invalid production {}", prod));
+                    }
+                    _ => {}
+                }
+            }
+        }
+        for row in &self.gotos {
+            for state in row.values() {
+                if *state as usize >= nstates {
+                    return Err(format!("invalid state {}", state));
+                }
+            }
+        }
+        Ok(())
+    }
+
+    /// Run the automaton over a sequence of terminals.
+    ///
+    /// The input is accepted when the end of input is shifted, which
+    /// is not recorded in the trace, same as the reduction of the
+    /// augmented start production which never happens.
+    pub fn run(&self, tokens: &[u32]) -> Result<Trace, String> {
+        let mut stack: Vec<u32> = vec![0];
+        let mut actions = Vec::with_capacity(tokens.len() * 2);
+        let mut pos = 0;
+
+        loop {
+            let terminal = match tokens.get(pos) {
+                Some(terminal) => *terminal,
+                None => self.end_of_input,
+            };
+            let state = *stack.last().unwrap() as usize;
+
+            match self.actions[state].get(&terminal) {
+                None => {
+                    return Ok(Trace { actions, error: Some(pos) });
+                }
+                Some(Action::Shift(_)) if pos == tokens.len() => {
+                    return Ok(Trace { actions, error: None });
+                }
+                Some(Action::Shift(next)) => {
+                    stack.push(*next);
+                    actions.push(SHIFT);
+                    pos += 1;
+                }
+                Some(Action::Reduce(prod)) => {
+                    let production = &self.productions[*prod as usize];
+                    if production.rhs_len >= stack.len() {
+                        return Err(format!(
+                            "stack underflow reducing production {}", prod));
+                    }
+                    stack.truncate(stack.len() - production.rhs_len);
+                    let top = *stack.last().unwrap() as usize;
+                    match self.gotos[top].get(&production.lhs) {
+                        Some(next) => stack.push(*next),
+                        None => {
+                            return Err(format!(
+                                "no goto for nonterminal {} in state {}",
+                                production.lhs, top));
+                        }
+                    }
+                    actions.push(*prod as i32);
+                }
+            }
+        }
+    }
+}
+
+
+fn extract_rows<T, F>(py: Python, rows: &PyList, convert: F)
+    -> PyResult<Vec<HashMap<u32, T>>>
+    where F: Fn(i64) -> T
+{
+    let mut result = Vec::with_capacity(rows.len(py));
+    for row in rows.iter(py) {
+        let row = row.cast_into::<PyDict>(py)?;
+        let mut map = HashMap::with_capacity(row.len(py));
+        for (key, value) in row.items(py) {
+            map.insert(key.extract::<u32>(py)?,
+                       convert(value.extract::<i64>(py)?));
+        }
+        result.push(map);
+    }
+    Ok(result)
+}
+
+
+py_class!(pub class Automaton |py| {
+    data _tables: Tables;
+
+    def __new__(_cls,
+        actions: PyList,
+        gotos: PyList,
+        productions: PyList,
+        end_of_input: u32)
+        -> PyResult<Automaton>
+    {
+        let actions = extract_rows(py, &actions, |value| {
+            if value >= 0 {
+                Action::Shift(value as u32)
+            } else {
+                Action::Reduce((-value - 1) as u32)
+            }
+        })?;
+        let gotos = extract_rows(py, &gotos, |value| value as u32)?;
+        let mut prods = Vec::with_capacity(productions.len(py));
+        for prod in productions.iter(py) {
+            let (lhs, rhs_len) = prod.extract::<(u32, usize)>(py)?;
+            prods.push(Production { lhs, rhs_len });
+        }
+        let tables = Tables {
+            actions,
+            gotos,
+            productions: prods,
+            end_of_input,
+        };
+        tables.validate()
+            .map_err(|e| PyErr::new::<ValueError, _>(py, e))?;
+        Automaton::create_instance(py, tables)
+    }
+
+    def parse(&self, tokens: PyList) -> PyResult<PyObject> {
+        let mut terminals = Vec::with_capacity(tokens.len(py));
+        for token in tokens.iter(py) {
+            terminals.push(token.extract::<u32>(py)?);
+        }
+        let tables = self._tables(py);
+        let trace = py.allow_threads(|| tables.run(&terminals))
+            .map_err(|e| PyErr::new::<ValueError, _>(py, e))?;
+        Ok((trace.actions, trace.error).to_py_object(py).into_object())
+    }
+});
+
+
+#[cfg(test)]
+mod test {
+    use std::collections::HashMap;
+    use super::{Action, Production, Tables, Trace, SHIFT};
+
+    // E -> E plus n | n
+    //
+    // Terminals: n = 0, plus = 1, <$> = 2
+    // Nonterminals: E = 0
+    // Productions: 0: E -> E plus n, 1: E -> n
+    fn tables() -> Tables {
+        let actions = vec![
+            vec![(0, Action::Shift(1))],
+            vec![(1, Action::Reduce(1)), (2, Action::Reduce(1))],
+            vec![(1, Action::Shift(3)), (2, Action::Shift(5))],
+            vec![(0, Action::Shift(4))],
+            vec![(1, Action::Reduce(0)), (2, Action::Reduce(0))],
+            vec![],
+        ];
+        Tables {
+            actions: actions.into_iter()
+                .map(|row| row.into_iter().collect())
+                .collect(),
+            gotos: vec![
+                vec![(0, 2)].into_iter().collect(),
+                HashMap::new(),
+                HashMap::new(),
+                HashMap::new(),
+                HashMap::new(),
+                HashMap::new(),
+            ],
+            productions: vec![
+                Production { lhs: 0, rhs_len: 3 },
+                Production { lhs: 0, rhs_len: 1 },
+            ],
+            end_of_input: 2,
+        }
+    }
+
+    #[test]
+    fn valid() {
+        assert_eq!(tables().validate(), Ok(()));
+    }
+
+    #[test]
+    fn accept() {
+        assert_eq!(tables().run(&[0, 1, 0, 1, 0]), Ok(Trace {
+            actions: vec![SHIFT, 1, SHIFT, SHIFT, 0, SHIFT, SHIFT, 0],
+            error: None,
+        }));
+    }
+
+    #[test]
+    fn unexpected_token() {
+        assert_eq!(tables().run(&[0, 0]), Ok(Trace {
+            actions: vec![SHIFT],
+            error: Some(1),
+        }));
+    }
+
+    #[test]
+    fn unexpected_end_of_input() {
+        assert_eq!(tables().run(&[0, 1]), Ok(Trace {
+            actions: vec![SHIFT, 1, SHIFT],
+            error: Some(2),
+        }));
+    }
+}
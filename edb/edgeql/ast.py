@@ -1021,6 +1021,12 @@ class DescribeStmt(Statement):
     options: Options
 
 
+class ExplainStmt(Statement):
+
+    query: Statement
+    analyze: bool = False
+
+
 #
 # SDL
 #
@@ -105,8 +105,7 @@ class EdgeQLSourceGenerator(codegen.SourceGenerator):
         if isinstance(node, list):
             self.visit_list(node, terminator=';')
         else:
-            method = 'visit_' + node.__class__.__name__
-            visitor = getattr(self, method, self.generic_visit)
+            visitor = self.get_visitor(node)
             visitor(node, **kwargs)
 
     def _write_keywords(self, *kws: str) -> None:
@@ -1669,6 +1668,12 @@ class EdgeQLSourceGenerator(codegen.SourceGenerator):
             self.write(' ')
             self.visit(node.options)
 
+    def visit_ExplainStmt(self, node: qlast.ExplainStmt) -> None:
+        self.write('EXPLAIN ')
+        if node.analyze:
+            self.write('ANALYZE ')
+        self.visit(node.query)
+
     def visit_Options(self, node: qlast.Options) -> None:
         for i, opt in enumerate(node.options.values()):
             if i > 0:
@@ -75,6 +75,8 @@ __all__ = base.__all__ + (
     'ConfigurationError',
     'AccessError',
     'AuthenticationError',
+    'AvailabilityError',
+    'BackendUnavailableError',
     'LogMessage',
     'WarningMessage',
 )
@@ -336,6 +338,14 @@ class AuthenticationError(AccessError):
     _code = 0x_07_01_00_00
 
 
+class AvailabilityError(EdgeDBError):
+    _code = 0x_08_00_00_00
+
+
+class BackendUnavailableError(AvailabilityError):
+    _code = 0x_08_00_00_01
+
+
 class LogMessage(EdgeDBMessage):
     _code = 0x_F0_00_00_00
 
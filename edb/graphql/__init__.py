@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 from .translator import translate_ast, parse_text, parse_tokens
+from .translator import is_introspection_query, execute_introspection
 from .types import GQLCoreSchema
 
 
@@ -27,4 +28,7 @@ from . import _patch_core
 _patch_core.patch_graphql_core()
 
 
-__all__ = ('translate_ast', 'parse_text', 'parse_tokens', 'GQLCoreSchema')
+__all__ = (
+    'translate_ast', 'parse_text', 'parse_tokens', 'GQLCoreSchema',
+    'is_introspection_query', 'execute_introspection',
+)
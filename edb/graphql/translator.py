@@ -144,6 +144,12 @@ class TranspiledOperation(NamedTuple):
     variables_desc: dict
 
 
+class IntrospectionResult(NamedTuple):
+
+    data: Dict[str, Any]
+    cache_deps_vars: Optional[FrozenSet[str]]
+
+
 class BookkeepDict(dict):
 
     def __init__(self, values):
@@ -1668,21 +1674,7 @@ def translate_ast(
     if variables is None:
         variables = {}
 
-    validation_errors = convert_errors(
-        graphql.validate(gqlcore.graphql_schema, document_ast),
-        substitutions=substitutions)
-    if validation_errors:
-        err = validation_errors[0]
-        if isinstance(err, graphql.GraphQLError):
-
-            # possibly add additional information and/or hints to the
-            # error message
-            msg = augment_error_message(gqlcore, err.message)
-
-            err_loc = (err.locations[0].line, err.locations[0].column)
-            raise g_errors.GraphQLCoreError(msg, loc=err_loc)
-        else:
-            raise err
+    validate_ast(gqlcore, document_ast, substitutions=substitutions)
 
     context = GraphQLTranslatorContext(
         gqlcore=gqlcore, query=None,
@@ -1707,6 +1699,120 @@ def translate_ast(
     )
 
 
+def validate_ast(
+    gqlcore: gt.GQLCoreSchema,
+    document_ast: graphql.Document,
+    *,
+    substitutions: Optional[Dict[str, Tuple[str, int, int]]],
+) -> None:
+    validation_errors = convert_errors(
+        graphql.validate(gqlcore.graphql_schema, document_ast),
+        substitutions=substitutions)
+    if validation_errors:
+        err = validation_errors[0]
+        if isinstance(err, graphql.GraphQLError):
+
+            # possibly add additional information and/or hints to the
+            # error message
+            msg = augment_error_message(gqlcore, err.message)
+
+            err_loc = (err.locations[0].line, err.locations[0].column)
+            raise g_errors.GraphQLCoreError(msg, loc=err_loc)
+        else:
+            raise err
+
+
+def is_introspection_query(
+    document_ast: graphql.Document,
+    *,
+    operation_name: Optional[str]=None,
+) -> bool:
+    """Check if the operation only selects introspection fields.
+
+    Such operations (e.g. the standard ``IntrospectionQuery`` sent by
+    GraphQL tooling) do not touch the database and can be answered
+    by graphql-core directly from the schema.
+    """
+
+    operations = []
+    fragments = {}
+    for defn in document_ast.definitions:
+        if isinstance(defn, gql_ast.OperationDefinitionNode):
+            opname = defn.name.value if defn.name else None
+            if operation_name is None or opname == operation_name:
+                operations.append(defn)
+        elif isinstance(defn, gql_ast.FragmentDefinitionNode):
+            fragments[defn.name.value] = defn
+
+    if len(operations) != 1:
+        # Let the translator report the ambiguity or the missing operation.
+        return False
+
+    operation = operations[0]
+    if operation.operation != graphql.OperationType.QUERY:
+        return False
+
+    seen_fragments = set()
+
+    def _only_introspection(selection_set) -> bool:
+        for sel in selection_set.selections:
+            if isinstance(sel, gql_ast.FieldNode):
+                if not sel.name.value.startswith('__'):
+                    return False
+            elif isinstance(sel, gql_ast.InlineFragmentNode):
+                if not _only_introspection(sel.selection_set):
+                    return False
+            elif isinstance(sel, gql_ast.FragmentSpreadNode):
+                name = sel.name.value
+                if name in seen_fragments:
+                    continue
+                seen_fragments.add(name)
+                frag = fragments.get(name)
+                if frag is None or not _only_introspection(frag.selection_set):
+                    return False
+            else:
+                return False
+        return True
+
+    return _only_introspection(operation.selection_set)
+
+
+def execute_introspection(
+    gqlcore: gt.GQLCoreSchema,
+    document_ast: graphql.Document,
+    *,
+    operation_name: Optional[str]=None,
+    variables: Dict[str, Any]=None,
+    substitutions: Optional[Dict[str, Tuple[str, int, int]]],
+) -> IntrospectionResult:
+
+    if variables is None:
+        variables = {}
+
+    validate_ast(gqlcore, document_ast, substitutions=substitutions)
+
+    vars = BookkeepDict(variables)
+    result = graphql.execute(
+        gqlcore.graphql_schema,
+        document_ast,
+        operation_name=operation_name,
+        variable_values=vars)
+
+    if result.errors:
+        err = result.errors[0]
+        if isinstance(err, graphql.GraphQLError):
+            err_loc = (err.locations[0].line,
+                       err.locations[0].column)
+            raise g_errors.GraphQLCoreError(err.message, loc=err_loc)
+        else:
+            raise err
+
+    return IntrospectionResult(
+        data=result.data,
+        cache_deps_vars=frozenset(vars.touched) if vars.touched else None,
+    )
+
+
 def augment_error_message(gqlcore: gt.GQLCoreSchema, message: str):
     # If the error is about wrong Query field, we can add more details
     # about what seems to have gone wrong. The type is missing,
@@ -19,6 +19,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from edb import errors
 
 from edb.pgsql import common
@@ -61,6 +63,28 @@ class SQLSourceGeneratorError(errors.InternalServerError):
             exceptions.add_context(self, ctx)
 
 
+# Renderings of names and types are cached, as the same relations,
+# columns, functions and casts come up over and over in the generated
+# queries.
+_RENDER_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _qname(*parts):
+    return common.qname(*parts)
+
+
+@functools.lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _type_name(name, array_bounds):
+    result = common.quote_type(name)
+    for array_bound in array_bounds:
+        if array_bound >= 0:
+            result += f'[{array_bound}]'
+        else:
+            result += '[]'
+    return result
+
+
 class SQLSourceGenerator(codegen.SourceGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -108,9 +132,9 @@ class SQLSourceGenerator(codegen.SourceGenerator):
 
     def visit_Relation(self, node):
         if node.schemaname is None:
-            self.write(common.qname(node.name))
+            self.write(_qname(node.name))
         else:
-            self.write(common.qname(node.schemaname, node.name))
+            self.write(_qname(node.schemaname, node.name))
 
     def _visit_values_expr(self, node):
         self.new_lines = 1
@@ -462,7 +486,7 @@ class SQLSourceGenerator(codegen.SourceGenerator):
     def visit_ColumnRef(self, node):
         names = node.name
         if isinstance(names[-1], pgast.Star):
-            self.write(common.qname(*names[:-1]))
+            self.write(_qname(*names[:-1]))
             if len(names) > 1:
                 self.write('.')
             self.write('*')
@@ -473,9 +497,9 @@ class SQLSourceGenerator(codegen.SourceGenerator):
                 self.write(names[0])
                 if len(names) > 1:
                     self.write('.')
-                    self.write(common.qname(*names[1:]))
+                    self.write(_qname(*names[1:]))
             else:
-                self.write(common.qname(*names))
+                self.write(_qname(*names))
 
     def visit_ColumnDef(self, node):
         self.write(common.quote_ident(node.name))
@@ -572,7 +596,7 @@ class SQLSourceGenerator(codegen.SourceGenerator):
         self.visit(node.expr)
 
     def visit_FuncCall(self, node):
-        self.write(common.qname(*node.name))
+        self.write(_qname(*node.name))
 
         self.write('(')
         if node.agg_distinct:
@@ -663,13 +687,10 @@ class SQLSourceGenerator(codegen.SourceGenerator):
         self.visit(node.type_name)
 
     def visit_TypeName(self, node):
-        self.write(common.quote_type(node.name))
-        if node.array_bounds:
-            for array_bound in node.array_bounds:
-                self.write('[')
-                if array_bound >= 0:
-                    self.write(array_bound)
-                self.write(']')
+        name = node.name
+        if isinstance(name, list):
+            name = tuple(name)
+        self.write(_type_name(name, tuple(node.array_bounds or ())))
 
     def visit_Star(self, node):
         self.write('*')
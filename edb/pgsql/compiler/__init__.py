@@ -25,6 +25,7 @@ from edb import errors
 
 from edb.common import debug
 from edb.common import exceptions as edgedb_error
+from edb.common import tracing
 
 from edb.ir import ast as irast
 
@@ -102,13 +103,14 @@ def compile_ir_to_sql(
     pretty: bool=True
 ) -> Tuple[str, Dict[str, pgast.Param]]:
 
-    qtree = compile_ir_to_sql_tree(
-        ir_expr,
-        output_format=output_format,
-        ignore_shapes=ignore_shapes,
-        explicit_top_cast=explicit_top_cast,
-        use_named_params=use_named_params,
-        expected_cardinality_one=expected_cardinality_one)
+    with tracing.span('compiler.sql'):
+        qtree = compile_ir_to_sql_tree(
+            ir_expr,
+            output_format=output_format,
+            ignore_shapes=ignore_shapes,
+            explicit_top_cast=explicit_top_cast,
+            use_named_params=use_named_params,
+            expected_cardinality_one=expected_cardinality_one)
 
     if debug.flags.edgeql_compile:  # pragma: no cover
         debug.header('SQL Tree')
@@ -118,7 +120,8 @@ def compile_ir_to_sql(
     argmap = qtree.argnames
 
     # Generate query text
-    codegen = _run_codegen(qtree, pretty=pretty)
+    with tracing.span('compiler.codegen'):
+        codegen = _run_codegen(qtree, pretty=pretty)
     sql_text = ''.join(codegen.result)
 
     if debug.flags.edgeql_compile:  # pragma: no cover
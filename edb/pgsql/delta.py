@@ -3811,17 +3811,17 @@ class CreateDatabase(ObjectMetaCommand, adapts=s_db.CreateDatabase):
     ) -> s_schema.Schema:
         schema = s_db.CreateDatabase.apply(self, schema, context)
         db = self.scls
-        self.pgops.add(
-            dbops.CreateDatabase(
-                dbops.Database(
-                    self.classname,
-                    metadata=dict(
-                        id=str(db.id),
-                        builtin=db.get_builtin(schema),
-                    ),
-                )
-            )
+        pg_db = dbops.Database(
+            self.classname,
+            metadata=dict(
+                id=str(db.id),
+                builtin=db.get_builtin(schema),
+            ),
         )
+        template = db.get_template(schema)
+        if template is not None:
+            pg_db.template = template
+        self.pgops.add(dbops.CreateDatabase(pg_db))
         return schema
 
 
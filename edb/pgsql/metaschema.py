@@ -1934,7 +1934,8 @@ class SysConfigFunction(dbops.Function):
                          'work_mem',
                          'effective_cache_size',
                          'effective_io_concurrency',
-                         'default_statistics_target'
+                         'default_statistics_target',
+                         'statement_timeout'
                      ])
                     )
 
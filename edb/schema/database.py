@@ -34,7 +34,17 @@ from . import schema as s_schema
 
 class Database(so.GlobalObject, s_anno.AnnotationSubject, s_abc.Database,
                qlkind=qltypes.SchemaObjectClass.DATABASE):
-    pass
+
+    # The name of the database to clone when creating this one,
+    # the std template is used by default.
+    template = so.SchemaField(
+        str,
+        default=None,
+        inheritable=False,
+        introspectable=False,
+        ephemeral=True,
+        allow_ddl_set=True,
+    )
 
 
 class DatabaseCommandContext(sd.ObjectCommandContext[Database]):
@@ -61,6 +71,15 @@ class DatabaseCommand(sd.GlobalObjectCommand, schema_metaclass=Database,
                 context=source_context,
             )
 
+        template = self.get_attribute_value('template')
+        if template is not None and (
+                template in context.reserved_database_names):
+            source_context = self.get_attribute_source_context('template')
+            raise errors.InvalidDatabaseDefinitionError(
+                f'{template!r} cannot be used as a template database',
+                context=source_context,
+            )
+
         return schema
 
 
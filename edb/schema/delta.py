@@ -645,6 +645,7 @@ class CommandContext:
             Mapping[Tuple[str, Optional[str]], uuid.UUID]
         ] = None,
         backend_superuser_role: Optional[str] = None,
+        reserved_database_names: AbstractSet[str] = frozenset(),
     ) -> None:
         self.stack: List[CommandContextToken[Command]] = []
         self._cache: Dict[Hashable, Any] = {}
@@ -661,6 +662,7 @@ class CommandContext:
         self.altered_targets: Set[so.Object] = set()
         self.schema_object_ids = schema_object_ids
         self.backend_superuser_role = backend_superuser_role
+        self.reserved_database_names = reserved_database_names
 
     @property
     def modaliases(self) -> Mapping[Optional[str], str]:
@@ -66,6 +66,10 @@ def parse_into(
     name_to_id = {}
     shortname_to_id = collections.defaultdict(set)
     globalname_to_id = {}
+    type_to_ids: Dict[Type[s_obj.Object], Dict[uuid.UUID, None]] = (
+        collections.defaultdict(dict))
+    module_to_ids: Dict[str, Dict[uuid.UUID, None]] = (
+        collections.defaultdict(dict))
     dict_of_dicts: Callable[
         [],
         Dict[Tuple[Type[s_obj.Object], str], Dict[uuid.UUID, None]],
@@ -97,9 +101,12 @@ def parse_into(
         if isinstance(obj, s_obj.QualifiedObject):
             name = s_name.Name(name)
             name_to_id[name] = objid
+            module_to_ids[name.module][objid] = None
         else:
             globalname_to_id[mcls, name] = objid
 
+        type_to_ids[mcls][objid] = None
+
         if isinstance(obj, (s_func.Function, s_oper.Operator)):
             shortname = mcls.get_shortname_static(name)
             shortname_to_id[mcls, shortname].add(objid)
@@ -225,11 +232,23 @@ def parse_into(
         ),
         globalname_to_id=schema._globalname_to_id.update(globalname_to_id),
         refs_to=mm.finish(),
+        type_to_ids=_update_index(schema._type_to_ids, type_to_ids),
+        module_to_ids=_update_index(schema._module_to_ids, module_to_ids),
     )
 
     return schema
 
 
+def _update_index(
+    index: immutables.Map[Any, immutables.Map[uuid.UUID, None]],
+    updates: Mapping[Any, Dict[uuid.UUID, None]],
+) -> immutables.Map[Any, immutables.Map[uuid.UUID, None]]:
+    with index.mutate() as mm:
+        for key, ids in updates.items():
+            mm[key] = mm.get(key, immutables.Map()).update(ids)
+        return mm.finish()
+
+
 def _parse_expression(val: Dict[str, Any]) -> s_expr.Expression:
     refids = frozenset(
         uuidgen.UUID(r) for r in val['refs']
@@ -51,6 +51,9 @@ if TYPE_CHECKING:
         ],
     ]
 
+    # Secondary index: key -> set of object ids (as a map to None).
+    Index_T = immu.Map[Any, immu.Map[uuid.UUID, None]]
+
 STD_LIB = ('std', 'schema', 'math', 'sys', 'cfg', 'cal')
 STD_MODULES = frozenset(STD_LIB + ('stdgraphql',))
 
@@ -69,6 +72,10 @@ class Schema(s_abc.Schema):
     ]
     _globalname_to_id: immu.Map[Tuple[Type[so.Object], str], uuid.UUID]
     _refs_to: Refs_T
+    # Object ids by exact schema class and by module name (qualified
+    # objects only), used to avoid full scans in get_objects().
+    _type_to_ids: Index_T
+    _module_to_ids: Index_T
     _generation: int
 
     def __init__(self) -> None:
@@ -78,6 +85,8 @@ class Schema(s_abc.Schema):
         self._name_to_id = immu.Map()
         self._globalname_to_id = immu.Map()
         self._refs_to = immu.Map()
+        self._type_to_ids = immu.Map()
+        self._module_to_ids = immu.Map()
         self._generation = 0
 
     def _replace(
@@ -96,6 +105,8 @@ class Schema(s_abc.Schema):
             immu.Map[Tuple[Type[so.Object], str], uuid.UUID]
         ],
         refs_to: Optional[Refs_T] = None,
+        type_to_ids: Optional[Index_T] = None,
+        module_to_ids: Optional[Index_T] = None,
     ) -> Schema:
         new = Schema.__new__(Schema)
 
@@ -129,6 +140,16 @@ class Schema(s_abc.Schema):
         else:
             new._refs_to = refs_to
 
+        if type_to_ids is None:
+            new._type_to_ids = self._type_to_ids
+        else:
+            new._type_to_ids = type_to_ids
+
+        if module_to_ids is None:
+            new._module_to_ids = self._module_to_ids
+        else:
+            new._module_to_ids = module_to_ids
+
         new._generation = self._generation + 1
 
         return new  # type: ignore
@@ -143,10 +164,12 @@ class Schema(s_abc.Schema):
         immu.Map[str, uuid.UUID],
         immu.Map[Tuple[Type[so.Object], str], FrozenSet[uuid.UUID]],
         immu.Map[Tuple[Type[so.Object], str], uuid.UUID],
+        Index_T,
     ]:
         name_to_id = self._name_to_id
         shortname_to_id = self._shortname_to_id
         globalname_to_id = self._globalname_to_id
+        module_to_ids = self._module_to_ids
         stype = type(scls)
         is_global = not issubclass(stype, so.QualifiedObject)
 
@@ -157,6 +180,8 @@ class Schema(s_abc.Schema):
                 globalname_to_id = globalname_to_id.delete((stype, old_name))
             else:
                 name_to_id = name_to_id.delete(old_name)
+                module_to_ids = _index_discard(
+                    module_to_ids, old_name.module, obj_id)
             if has_sn_cache:
                 old_shortname = sn.shortname_from_fullname(old_name)
                 sn_key = (stype, old_shortname)
@@ -181,6 +206,8 @@ class Schema(s_abc.Schema):
                     raise errors.SchemaError(
                         f'name {new_name!r} is already in the schema')
                 name_to_id = name_to_id.set(new_name, obj_id)
+                module_to_ids = _index_add(
+                    module_to_ids, new_name.module, obj_id)
 
             if has_sn_cache:
                 new_shortname = sn.shortname_from_fullname(new_name)
@@ -194,7 +221,7 @@ class Schema(s_abc.Schema):
                 shortname_to_id = shortname_to_id.set(
                     sn_key, ids | {obj_id})
 
-        return name_to_id, shortname_to_id, globalname_to_id
+        return name_to_id, shortname_to_id, globalname_to_id, module_to_ids
 
     def _update_obj(
         self,
@@ -212,10 +239,12 @@ class Schema(s_abc.Schema):
         name_to_id = None
         shortname_to_id = None
         globalname_to_id = None
+        module_to_ids = None
         with data.mutate() as mm:
             for field, value in updates.items():
                 if field == 'name':
-                    name_to_id, shortname_to_id, globalname_to_id = (
+                    (name_to_id, shortname_to_id, globalname_to_id,
+                     module_to_ids) = (
                         self._update_obj_name(
                             obj_id,
                             self._id_to_type[obj_id],
@@ -237,6 +266,7 @@ class Schema(s_abc.Schema):
         return self._replace(name_to_id=name_to_id,
                              shortname_to_id=shortname_to_id,
                              globalname_to_id=globalname_to_id,
+                             module_to_ids=module_to_ids,
                              id_to_data=id_to_data,
                              refs_to=refs_to)
 
@@ -270,9 +300,11 @@ class Schema(s_abc.Schema):
         name_to_id = None
         shortname_to_id = None
         globalname_to_id = None
+        module_to_ids = None
         if field == 'name':
             old_name = data.get('name')
-            name_to_id, shortname_to_id, globalname_to_id = (
+            (name_to_id, shortname_to_id, globalname_to_id,
+             module_to_ids) = (
                 self._update_obj_name(
                     obj_id,
                     self._id_to_type[obj_id],
@@ -295,6 +327,7 @@ class Schema(s_abc.Schema):
         return self._replace(name_to_id=name_to_id,
                              shortname_to_id=shortname_to_id,
                              globalname_to_id=globalname_to_id,
+                             module_to_ids=module_to_ids,
                              id_to_data=id_to_data,
                              refs_to=refs_to)
 
@@ -311,9 +344,11 @@ class Schema(s_abc.Schema):
         name_to_id = None
         shortname_to_id = None
         globalname_to_id = None
+        module_to_ids = None
         name = data.get('name')
         if field == 'name' and name is not None:
-            name_to_id, shortname_to_id, globalname_to_id = (
+            (name_to_id, shortname_to_id, globalname_to_id,
+             module_to_ids) = (
                 self._update_obj_name(
                     obj_id,
                     self._id_to_type[obj_id],
@@ -335,6 +370,7 @@ class Schema(s_abc.Schema):
         return self._replace(name_to_id=name_to_id,
                              shortname_to_id=shortname_to_id,
                              globalname_to_id=globalname_to_id,
+                             module_to_ids=module_to_ids,
                              id_to_data=id_to_data,
                              refs_to=refs_to)
 
@@ -448,8 +484,8 @@ class Schema(s_abc.Schema):
 
         data = immu.Map(data)
 
-        name_to_id, shortname_to_id, globalname_to_id = self._update_obj_name(
-            id, scls, None, name)
+        (name_to_id, shortname_to_id, globalname_to_id,
+         module_to_ids) = self._update_obj_name(id, scls, None, name)
 
         updates = dict(
             id_to_data=self._id_to_data.set(id, data),
@@ -458,6 +494,8 @@ class Schema(s_abc.Schema):
             shortname_to_id=shortname_to_id,
             globalname_to_id=globalname_to_id,
             refs_to=self._update_refs_to(scls, None, data),
+            type_to_ids=_index_add(self._type_to_ids, type(scls), id),
+            module_to_ids=module_to_ids,
         )
 
         if (isinstance(scls, so.QualifiedObject)
@@ -477,8 +515,9 @@ class Schema(s_abc.Schema):
 
         updates = {}
 
-        name_to_id, shortname_to_id, globalname_to_id = self._update_obj_name(
-            obj.id, self._id_to_type[obj.id], name, None)
+        scls = self._id_to_type[obj.id]
+        (name_to_id, shortname_to_id, globalname_to_id,
+         module_to_ids) = self._update_obj_name(obj.id, scls, name, None)
 
         refs_to = self._update_refs_to(obj, self._id_to_data[obj.id], None)
 
@@ -489,6 +528,8 @@ class Schema(s_abc.Schema):
             id_to_data=self._id_to_data.delete(obj.id),
             id_to_type=self._id_to_type.delete(obj.id),
             refs_to=refs_to,
+            type_to_ids=_index_discard(self._type_to_ids, type(scls), obj.id),
+            module_to_ids=module_to_ids,
         ))
 
         return self._replace(**updates)  # type: ignore
@@ -923,9 +964,23 @@ class Schema(s_abc.Schema):
         )
 
     def get_modules(self) -> Iterator[s_mod.Module]:
-        for (objtype, _), objid in self._globalname_to_id.items():
-            if objtype is s_mod.Module:
-                yield self.get_by_id(objid, type=s_mod.Module)
+        for objid in self._type_to_ids.get(s_mod.Module, ()):
+            yield self.get_by_id(objid, type=s_mod.Module)
+
+    def _get_ids_by_type(
+        self,
+        type: Type[so.Object],
+    ) -> Iterator[uuid.UUID]:
+        for objtype, ids in self._type_to_ids.items():
+            if issubclass(objtype, type):
+                yield from ids
+
+    def _get_ids_by_module(
+        self,
+        modules: Iterable[str],
+    ) -> Iterator[uuid.UUID]:
+        for module in modules:
+            yield from self._module_to_ids.get(module, ())
 
     def __repr__(self) -> str:
         return (
@@ -948,16 +1003,18 @@ class SchemaIterator(Generic[so.Object_T]):
 
         filters = []
 
-        if type is not None:
-            t = type
-            filters.append(lambda schema, obj: isinstance(obj, t))
+        # The candidate objects are taken from the module index, or the
+        # type index, when possible, instead of scanning the schema.
+        self._modules: Optional[FrozenSet[str]] = None
+        self._type: Optional[Type[so.Object_T]] = None
 
         if included_modules:
-            modules = frozenset(included_modules)
-            filters.append(
-                lambda schema, obj:
-                    isinstance(obj, so.QualifiedObject) and
-                    obj.get_name(schema).module in modules)
+            self._modules = frozenset(included_modules)
+            if type is not None:
+                t = type
+                filters.append(lambda schema, obj: isinstance(obj, t))
+        elif type is not None:
+            self._type = type
 
         if excluded_modules or exclude_stdlib:
             excmod: Set[str] = set()
@@ -995,13 +1052,43 @@ class SchemaIterator(Generic[so.Object_T]):
 
     def __iter__(self) -> Iterator[so.Object_T]:
         filters = self._filters
-        index = self._schema._id_to_type
+        schema = self._schema
+        index = schema._id_to_type
+
+        objs: Iterable[so.Object]
+        if self._modules is not None:
+            objs = (index[objid]
+                    for objid in schema._get_ids_by_module(self._modules))
+        elif self._type is not None:
+            objs = (index[objid]
+                    for objid in schema._get_ids_by_type(self._type))
+        else:
+            objs = index.values()
 
-        for obj in index.values():
-            if all(f(self._schema, obj) for f in filters):
+        for obj in objs:
+            if all(f(schema, obj) for f in filters):
                 yield obj  # type: ignore
 
 
+def _index_add(index: Index_T, key: Any, obj_id: uuid.UUID) -> Index_T:
+    try:
+        ids = index[key]
+    except KeyError:
+        ids = immu.Map()
+    return index.set(key, ids.set(obj_id, None))
+
+
+def _index_discard(index: Index_T, key: Any, obj_id: uuid.UUID) -> Index_T:
+    try:
+        ids = index[key].delete(obj_id)
+    except KeyError:
+        return index
+    if ids:
+        return index.set(key, ids)
+    else:
+        return index.delete(key)
+
+
 @functools.lru_cache()
 def _get_functions(
     schema: Schema,
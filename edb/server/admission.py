@@ -0,0 +1,249 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import asyncio
+import enum
+import heapq
+import itertools
+import time
+
+from edb import errors
+
+from edb.server import metrics
+
+
+class Priority(enum.IntEnum):
+
+    #: Work done in an already started transaction; finishing it
+    #: releases the locks and the backend snapshot it holds.
+    HIGH = 0
+
+    NORMAL = 1
+
+
+class Slots:
+    """A counting semaphore that wakes up waiters in priority order.
+
+    Waiters of the same priority are served in FIFO order.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit <= 0:
+            raise ValueError('limit must be greater than 0')
+        self._limit = limit
+        self._active = 0
+        self._queued = 0
+        # Heap of (priority, seqno, future).
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seqno = itertools.count()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def is_idle(self) -> bool:
+        return not self._active and not self._queued
+
+    async def acquire(self, priority: Priority, timeout: float) -> bool:
+        """Acquire a slot; return False if it took longer than *timeout*."""
+        if self._active < self._limit and not self._queued:
+            self._active += 1
+            return True
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seqno), fut))
+        self._queued += 1
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over to us right as the wait
+                # timed out; keep it, the caller releases it as usual.
+                return True
+            return False
+        except BaseException:
+            if fut.done() and not fut.cancelled():
+                # We were given a slot, but got cancelled before
+                # we could use it.
+                self.release()
+            raise
+        finally:
+            if not fut.done() or fut.cancelled():
+                # Cancelled waiters are skipped by _wakeup().
+                self._queued -= 1
+        return True
+
+    def release(self) -> None:
+        self._active -= 1
+        self._wakeup()
+
+    def _wakeup(self) -> None:
+        while self._waiters and self._active < self._limit:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                self._queued -= 1
+                self._active += 1
+                fut.set_result(None)
+
+
+class AdmissionController:
+    """Bound concurrent query executions and compilations.
+
+    Every unit of work of a given *kind* ("execute" or "compile") must
+    be admitted by both its database and its role limit.  Work that
+    cannot be admitted immediately is queued by priority; if it is
+    still queued after *timeout* seconds, it is rejected with a
+    retryable ``BackendUnavailableError``.  A limit of 0 means no limit.
+    Work admitted with *exempt* set is never queued nor counted.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: Mapping[str, Tuple[int, int]],
+        timeout: float,
+    ) -> None:
+        self._limits = {
+            kind: (max(db_limit, 0), max(role_limit, 0))
+            for kind, (db_limit, role_limit) in limits.items()
+        }
+        self._timeout = timeout
+        self._slots: Dict[Tuple[str, str, str], Slots] = {}
+
+    def is_enabled(self, kind: str) -> bool:
+        return any(self._limits.get(kind, (0, 0)))
+
+    def admit(
+        self,
+        kind: str,
+        *,
+        dbname: str,
+        role: str,
+        priority: Priority = Priority.NORMAL,
+        exempt: bool = False,
+    ) -> AsyncContextManager[None]:
+        db_limit, role_limit = self._limits.get(kind, (0, 0))
+        if exempt or (not db_limit and not role_limit):
+            return _NOOP
+
+        keys = []
+        if db_limit:
+            keys.append(((kind, 'database', dbname), db_limit))
+        if role_limit:
+            keys.append(((kind, 'role', role), role_limit))
+
+        return _Admission(self, kind, keys, priority)
+
+    def _get_slots(self, key: Tuple[str, str, str], limit: int) -> Slots:
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = Slots(limit)
+        return slots
+
+    def _release(self, key: Tuple[str, str, str]) -> None:
+        slots = self._slots[key]
+        slots.release()
+        if slots.is_idle():
+            self._drop_slots(key, slots)
+
+    def _drop_slots(self, key: Tuple[str, str, str], slots: Slots) -> None:
+        # Don't keep state for every database and role ever seen.
+        if self._slots.get(key) is slots:
+            del self._slots[key]
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                'kind': kind,
+                'scope': scope,
+                'name': name,
+                'active': slots.active,
+                'queued': slots.queued,
+            }
+            for (kind, scope, name), slots in sorted(self._slots.items())
+        ]
+
+
+class _Admission:
+
+    __slots__ = ('_controller', '_kind', '_keys', '_priority', '_acquired')
+
+    def __init__(
+        self,
+        controller: AdmissionController,
+        kind: str,
+        keys: List[Tuple[Tuple[str, str, str], int]],
+        priority: Priority,
+    ) -> None:
+        self._controller = controller
+        self._kind = kind
+        self._keys = keys
+        self._priority = priority
+        self._acquired: List[Tuple[str, str, str]] = []
+
+    async def __aenter__(self) -> None:
+        controller = self._controller
+        deadline = time.monotonic() + controller._timeout
+        try:
+            for key, limit in self._keys:
+                slots = controller._get_slots(key, limit)
+                timeout = max(deadline - time.monotonic(), 0)
+                try:
+                    admitted = await slots.acquire(self._priority, timeout)
+                finally:
+                    if slots.is_idle():
+                        controller._drop_slots(key, slots)
+                if not admitted:
+                    _, scope, name = key
+                    metrics.admission_rejections.inc(1, self._kind, scope)
+                    raise errors.BackendUnavailableError(
+                        f'too many concurrent queries for {scope} '
+                        f'{name!r}, please retry later')
+                self._acquired.append(key)
+        except BaseException:
+            self._release()
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        while self._acquired:
+            self._controller._release(self._acquired.pop())
+
+
+class _NoopAdmission:
+
+    __slots__ = ()
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+_NOOP = _NoopAdmission()
@@ -64,6 +64,7 @@ class Port:
             'backend_instance_params': (
                 self.get_server().get_backend_instance_params()
             ),
+            'std_cache_dir': self.get_server().get_std_cache_dir(),
         }
 
     def get_compiler_worker_name(self):
@@ -89,6 +90,7 @@ class Port:
             worker_cls=self.get_compiler_worker_cls(),
             name=self.get_compiler_worker_name(),
             pool_size=self._compiler_pool_size,
+            **self.get_server().get_compiler_worker_limits(),
         )
 
     async def stop(self):
@@ -20,8 +20,10 @@
 from __future__ import annotations
 from typing import *
 
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import pathlib
 import pickle
@@ -73,6 +75,12 @@ CACHE_SRC_DIRS = s_std.CACHE_SRC_DIRS + (
     (pathlib.Path(metaschema.__file__).parent, '.py'),
 )
 
+# The sources of the code that processes std modules, as opposed
+# to the std modules themselves.
+STDLIB_CODE_DIRS = tuple(
+    (path, ext) for path, ext in CACHE_SRC_DIRS if path != s_std.LIB_ROOT
+)
+
 
 logger = logging.getLogger('edb.server')
 
@@ -337,38 +345,132 @@ class StdlibBits(NamedTuple):
     introquery: str
 
 
-async def _make_stdlib(testmode: bool, global_ids) -> StdlibBits:
-    schema = s_schema.Schema()
-    schema, _ = s_mod.Module.create_in_schema(schema, name='__derived__')
+def _get_stdlib_checkpoint_keys(
+    modnames: Sequence[str],
+    std_texts: Sequence[str],
+) -> List[bytes]:
+    # The checkpoint of a module depends on the processing code
+    # and on the text of all modules up to and including it.
+    h = hashlib.sha1(buildmeta.hash_dirs(STDLIB_CODE_DIRS))
+    keys = []
+    for modname, text in zip(modnames, std_texts):
+        h.update(modname.encode())
+        h.update(text.encode())
+        keys.append(h.digest())
+    return keys
+
+
+def _get_stdlib_checkpoint_name(modname: str) -> str:
+    return f'backend-stdlib-{modname}.pickle'
 
-    current_block = dbops.PLTopBlock()
 
-    std_texts = []
-    for modname in s_schema.STD_LIB + ('stdgraphql',):
-        std_texts.append(s_std.get_std_module_text(modname))
+_intro_compile_state: Optional[Tuple[edbcompiler.Compiler, Any]] = None
 
+
+def _compile_intro_part(intropart: str) -> str:
+    assert _intro_compile_state is not None
+    compiler, compilerctx = _intro_compile_state
+    introtokens = tokenizer.tokenize(intropart.encode())
+    units = compiler._compile(ctx=compilerctx, tokens=introtokens)
+    assert len(units) == 1 and len(units[0].sql) == 1
+    return units[0].sql[0].decode()
+
+
+def _compile_intro_parts(
+    compiler: edbcompiler.Compiler,
+    compilerctx: Any,
+    introparts: Sequence[str],
+) -> List[str]:
+    global _intro_compile_state
+
+    # The parts are independent, so compile them in forked worker
+    # processes, which inherit the compiler and the schemas for free.
+    nprocs = min(len(introparts), os.cpu_count() or 1)
+    _intro_compile_state = (compiler, compilerctx)
+    try:
+        if (nprocs < 2
+                or 'fork' not in multiprocessing.get_all_start_methods()):
+            return [_compile_intro_part(part) for part in introparts]
+
+        mp = multiprocessing.get_context('fork')
+        with mp.Pool(nprocs) as pool:
+            return pool.map(_compile_intro_part, introparts)
+    finally:
+        _intro_compile_state = None
+
+
+async def _make_stdlib(
+    testmode: bool,
+    global_ids,
+    *,
+    checkpoints: bool = False,
+    cache_dir: Optional[pathlib.Path] = None,
+) -> StdlibBits:
+    modnames = s_schema.STD_LIB + ('stdgraphql',)
     if testmode:
-        std_texts.append(s_std.get_std_module_text('_testmode'))
+        modnames += ('_testmode',)
+
+    std_texts = [s_std.get_std_module_text(modname) for modname in modnames]
+
+    # When *checkpoints* is set, the state after processing each
+    # module is cached, so that a change in a module only requires
+    # reprocessing it and the modules that follow it.
+    keys = (_get_stdlib_checkpoint_keys(modnames, std_texts)
+            if checkpoints else [])
+
+    state = None
+    start = 0
+    for i in reversed(range(len(keys))):
+        state = buildmeta.read_data_cache(
+            keys[i],
+            _get_stdlib_checkpoint_name(modnames[i]),
+            source_dir=cache_dir,
+        )
+        if state is not None:
+            logger.info('Resuming std bootstrap after the %r module '
+                        'checkpoint...', modnames[i])
+            start = i + 1
+            break
+
+    if state is None:
+        schema = s_schema.Schema()
+        schema, _ = s_mod.Module.create_in_schema(
+            schema, name='__derived__')
+        current_block = dbops.PLTopBlock()
+        types: Set[uuid.UUID] = set()
+        std_plans: List[sd.Command] = []
+    else:
+        schema, current_block, types, std_plans = state
 
-    ddl_text = '\n'.join(std_texts)
-    types: Set[uuid.UUID] = set()
-    std_plans: List[sd.Command] = []
+    for i in range(start, len(modnames)):
+        for ddl_cmd in edgeql.parse_block(std_texts[i]):
+            delta_command = s_ddl.delta_from_ddl(
+                ddl_cmd, modaliases={}, schema=schema, stdmode=True)
 
-    for ddl_cmd in edgeql.parse_block(ddl_text):
-        delta_command = s_ddl.delta_from_ddl(
-            ddl_cmd, modaliases={}, schema=schema, stdmode=True)
+            if debug.flags.delta_plan_input:
+                debug.header('Delta Plan Input')
+                debug.dump(delta_command)
 
-        if debug.flags.delta_plan_input:
-            debug.header('Delta Plan Input')
-            debug.dump(delta_command)
+            # Apply and adapt delta, build native delta plan, which
+            # will also update the schema.
+            schema, plan = _process_delta(delta_command, schema)
+            std_plans.append(delta_command)
 
-        # Apply and adapt delta, build native delta plan, which
-        # will also update the schema.
-        schema, plan = _process_delta(delta_command, schema)
-        std_plans.append(delta_command)
+            types.update(plan.new_types)
+            plan.generate(current_block)
 
-        types.update(plan.new_types)
-        plan.generate(current_block)
+        if checkpoints:
+            try:
+                buildmeta.write_data_cache(
+                    (schema, current_block, types, std_plans),
+                    keys[i],
+                    _get_stdlib_checkpoint_name(modnames[i]),
+                    target_dir=cache_dir,
+                )
+            except Exception:
+                logger.warning('could not write the std bootstrap '
+                               'checkpoint for the %r module', modnames[i],
+                               exc_info=True)
 
     stdglobals = '\n'.join([
         f'''CREATE SUPERUSER ROLE {edbdef.EDGEDB_SUPERUSER} {{
@@ -427,14 +529,7 @@ async def _make_stdlib(testmode: bool, global_ids) -> StdlibBits:
     # because it's a large UNION and we currently generate SQL
     # that is much harder for Posgres to plan as opposed to a
     # straight flat UNION.
-    sql_introparts = []
-
-    for intropart in introparts:
-        introtokens = tokenizer.tokenize(intropart.encode())
-        units = compiler._compile(ctx=compilerctx, tokens=introtokens)
-        assert len(units) == 1 and len(units[0].sql) == 1
-        sql_intropart = units[0].sql[0].decode()
-        sql_introparts.append(sql_intropart)
+    sql_introparts = _compile_intro_parts(compiler, compilerctx, introparts)
 
     introsql = ' UNION ALL '.join(sql_introparts)
 
@@ -516,7 +611,12 @@ async def _init_stdlib(cluster, conn, testmode, global_ids):
         src_hash, tpldbdump_cache, source_dir=cache_dir, pickled=False)
 
     if stdlib is None:
-        stdlib = await _make_stdlib(in_dev_mode or testmode, global_ids)
+        stdlib = await _make_stdlib(
+            in_dev_mode or testmode,
+            global_ids,
+            checkpoints=bool(in_dev_mode or specified_cache_dir),
+            cache_dir=cache_dir,
+        )
         cache_hit = False
     else:
         cache_hit = True
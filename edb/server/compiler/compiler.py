@@ -38,7 +38,10 @@ from edb.server import tokenizer
 from edb.pgsql import compiler as pg_compiler
 
 from edb import edgeql
+from edb.common import ast
 from edb.common import debug
+from edb.common import lru
+from edb.common import tracing
 from edb.common import uuidgen
 
 from edb.edgeql import ast as qlast
@@ -68,10 +71,12 @@ from edb.pgsql import common as pg_common
 from edb.pgsql import types as pg_types
 
 from edb.server import config
+from edb.server import stdcache
 
 from . import dbstate
 from . import enums
 from . import errormech
+from . import explain
 from . import sertypes
 from . import status
 
@@ -119,6 +124,15 @@ _IO_FORMAT_MAP = {
 
 pg_ql = lambda o: pg_common.quote_literal(str(o))
 
+# Databases that cannot be used as the template of a new database:
+# the std template itself and the databases Postgres creates.
+RESERVED_DATABASE_NAMES = frozenset({
+    defines.EDGEDB_TEMPLATE_DB,
+    'postgres',
+    'template0',
+    'template1',
+})
+
 
 def _convert_format(inp: enums.IoFormat) -> pg_compiler.OutputFormat:
     try:
@@ -235,8 +249,10 @@ class BaseCompiler:
         *,
         backend_instance_params: BackendInstanceParams = (
             BackendInstanceParams()),
+        std_cache_dir: Optional[str] = None,
     ):
         self._connect_args = connect_args
+        self._std_cache_dir = std_cache_dir
         self._dbname = None
         self._cached_db = None
         self._std_schema = None
@@ -321,17 +337,33 @@ class BaseCompiler:
             await con.close()
 
     async def ensure_initialized(self, con: asyncpg.Connection) -> None:
+        # Prefer the copy of the std data materialized by the server
+        # in the local runstate dir and fall back to the backend.
+        cache_dir = self._std_cache_dir
+
         if self._std_schema is None:
-            self._std_schema = await load_cached_schema(con, 'stdschema')
+            self._std_schema = stdcache.load(cache_dir, 'stdschema')
+            if self._std_schema is None:
+                self._std_schema = await load_cached_schema(
+                    con, 'stdschema')
 
         if self._refl_schema is None:
-            self._refl_schema = await load_cached_schema(con, 'reflschema')
+            self._refl_schema = stdcache.load(cache_dir, 'reflschema')
+            if self._refl_schema is None:
+                self._refl_schema = await load_cached_schema(
+                    con, 'reflschema')
 
         if self._schema_class_layout is None:
-            self._schema_class_layout = await load_schema_class_layout(con)
+            self._schema_class_layout = stdcache.load(
+                cache_dir, 'classlayout')
+            if self._schema_class_layout is None:
+                self._schema_class_layout = await load_schema_class_layout(
+                    con)
 
         if self._intro_query is None:
-            self._intro_query = await load_schema_intro_query(con)
+            self._intro_query = stdcache.load(cache_dir, 'introquery')
+            if self._intro_query is None:
+                self._intro_query = await load_schema_intro_query(con)
 
         if self._config_spec is None:
             self._config_spec = config.load_spec_from_schema(
@@ -363,15 +395,21 @@ class Compiler(BaseCompiler):
         *,
         backend_instance_params: BackendInstanceParams = (
             BackendInstanceParams()),
+        std_cache_dir: Optional[str] = None,
     ):
         super().__init__(
             connect_args,
             backend_instance_params=backend_instance_params,
+            std_cache_dir=std_cache_dir,
         )
 
         self._current_db_state = None
         self._bootstrap_mode = False
 
+        # Parsed statements by the token stream they were parsed from.
+        self._parse_cache = lru.LRUMapping(
+            maxsize=defines._MAX_PARSED_QUERIES_CACHE)
+
     def _in_testmode(self, ctx: CompileContext):
         current_tx = ctx.state.current_tx()
         session_config = current_tx.get_session_config()
@@ -389,6 +427,7 @@ class Compiler(BaseCompiler):
         context.schema_object_ids = ctx.schema_object_ids
         context.backend_superuser_role = (
             self._backend_instance_params.explicit_superuser_role)
+        context.reserved_database_names = RESERVED_DATABASE_NAMES
         return context
 
     def _process_delta(self, ctx: CompileContext, delta):
@@ -560,6 +599,19 @@ class Compiler(BaseCompiler):
 
         single_stmt_mode = ctx.stmt_mode is enums.CompileStatementMode.SINGLE
 
+        explain_stmt: Optional[qlast.ExplainStmt] = None
+        if isinstance(ql, qlast.ExplainStmt):
+            if not single_stmt_mode or not native_out_format:
+                raise errors.QueryError(
+                    'EXPLAIN is only supported for single queries '
+                    'returning data in the binary format')
+            if ctx.expected_cardinality_one:
+                raise errors.ResultCardinalityMismatchError(
+                    'EXPLAIN returns a set of plan lines which does not '
+                    'match the expected cardinality ONE')
+            explain_stmt = ql
+            ql = ql.query
+
         implicit_fields = (
             native_out_format and
             single_stmt_mode
@@ -575,21 +627,24 @@ class Compiler(BaseCompiler):
         # commands indicates that session mode is available
         session_mode = ctx.state.capability & (enums.Capability.TRANSACTION |
                                                enums.Capability.SESSION)
-        ir = qlcompiler.compile_ast_to_ir(
-            ql,
-            schema=current_tx.get_schema(),
-            options=qlcompiler.CompilerOptions(
-                modaliases=current_tx.get_modaliases(),
-                implicit_tid_in_shapes=implicit_fields,
-                implicit_id_in_shapes=implicit_fields,
-                constant_folding=not disable_constant_folding,
-                json_parameters=ctx.json_parameters,
-                implicit_limit=ctx.implicit_limit,
-                session_mode=session_mode,
-                allow_writing_protected_pointers=ctx.schema_reflection_mode,
-                introspection_schema_rewrites=not ctx.schema_reflection_mode,
-            ),
-        )
+        with tracing.span('compiler.ir'):
+            ir = qlcompiler.compile_ast_to_ir(
+                ql,
+                schema=current_tx.get_schema(),
+                options=qlcompiler.CompilerOptions(
+                    modaliases=current_tx.get_modaliases(),
+                    implicit_tid_in_shapes=implicit_fields,
+                    implicit_id_in_shapes=implicit_fields,
+                    constant_folding=not disable_constant_folding,
+                    json_parameters=ctx.json_parameters,
+                    implicit_limit=ctx.implicit_limit,
+                    session_mode=session_mode,
+                    allow_writing_protected_pointers=(
+                        ctx.schema_reflection_mode),
+                    introspection_schema_rewrites=(
+                        not ctx.schema_reflection_mode),
+                ),
+            )
 
         if ir.cardinality.is_single():
             result_cardinality = enums.ResultCardinality.ONE
@@ -600,17 +655,38 @@ class Compiler(BaseCompiler):
                     f'the query has cardinality {result_cardinality} '
                     f'which does not match the expected cardinality ONE')
 
-        sql_text, argmap = pg_compiler.compile_ir_to_sql(
-            ir,
-            pretty=debug.flags.edgeql_compile or debug.flags.delta_execute,
-            expected_cardinality_one=ctx.expected_cardinality_one,
-            output_format=_convert_format(ctx.output_format),
-        )
+        explain_annotations = None
+        if explain_stmt is None:
+            sql_text, argmap = pg_compiler.compile_ir_to_sql(
+                ir,
+                pretty=debug.flags.edgeql_compile or debug.flags.delta_execute,
+                expected_cardinality_one=ctx.expected_cardinality_one,
+                output_format=_convert_format(ctx.output_format),
+            )
+        else:
+            sql_tree = pg_compiler.compile_ir_to_sql_tree(
+                ir,
+                output_format=_convert_format(ctx.output_format),
+            )
+            argmap = sql_tree.argnames
+            explain_annotations = explain.get_source_annotations(sql_tree)
+            if explain_stmt.analyze:
+                explain_opts = 'ANALYZE, BUFFERS, FORMAT JSON'
+            else:
+                explain_opts = 'FORMAT JSON'
+            sql_text = (
+                f'EXPLAIN ({explain_opts}) '
+                f'{pg_codegen.generate_source(sql_tree)}'
+            )
+            result_cardinality = enums.ResultCardinality.MANY
 
         sql_bytes = sql_text.encode(defines.EDGEDB_ENCODING)
 
         if single_stmt_mode:
-            if native_out_format:
+            if explain_stmt is not None:
+                out_type_data, out_type_id = sertypes.TypeSerializer.describe(
+                    ir.schema, ir.schema.get('std::str'), {}, {})
+            elif native_out_format:
                 out_type_data, out_type_id = sertypes.TypeSerializer.describe(
                     ir.schema, ir.stype,
                     ir.view_shapes, ir.view_shapes_metadata)
@@ -679,6 +755,7 @@ class Compiler(BaseCompiler):
                 in_type_args=in_type_args,
                 out_type_id=out_type_id.bytes,
                 out_type_data=out_type_data,
+                explain_annotations=explain_annotations,
             )
 
         else:
@@ -1130,6 +1207,27 @@ class Compiler(BaseCompiler):
                     f'for the current connection')
             return self._compile_ql_query(ctx, ql)
 
+    def _parse_tokens(
+        self,
+        tokens: List[_edgeql_rust.Token],
+    ) -> List[qlast.Base]:
+        # The same query is recompiled for every database version,
+        # output format and expected cardinality, so its parse is
+        # cached.  The token positions are a part of the key, so the
+        # parser contexts of a cached tree (and hence the positions
+        # in error messages) are always those of the query at hand.
+        key = tuple((tok.text(), tok.start()) for tok in tokens)
+
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            return [ast.copy_tree(stmt) for stmt in cached]
+
+        statements = edgeql.parse_block_tokens(tokens)
+        # The compiler is free to modify the trees it is given, so
+        # the cache holds a pristine copy.
+        self._parse_cache[key] = [ast.copy_tree(stmt) for stmt in statements]
+        return statements
+
     def _compile(
         self,
         *,
@@ -1143,7 +1241,8 @@ class Compiler(BaseCompiler):
         single_stmt_mode = ctx.stmt_mode is enums.CompileStatementMode.SINGLE
         default_cardinality = enums.ResultCardinality.NO_RESULT
 
-        statements = edgeql.parse_block_tokens(tokens)
+        with tracing.span('compiler.parse'):
+            statements = self._parse_tokens(tokens)
         statements_len = len(statements)
 
         if ctx.stmt_mode is enums.CompileStatementMode.SKIP_FIRST:
@@ -1204,6 +1303,7 @@ class Compiler(BaseCompiler):
                     unit.cacheable = True
 
                     unit.cardinality = comp.cardinality
+                    unit.explain_annotations = comp.explain_annotations
                 else:
                     unit.sql += comp.sql
 
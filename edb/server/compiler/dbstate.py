@@ -65,6 +65,8 @@ class Query(BaseQuery):
     in_type_id: bytes
     in_type_args: Optional[List[Param]] = None
 
+    explain_annotations: Optional[Dict[str, str]] = None
+
     is_transactional: bool = True
     single_unit: bool = False
 
@@ -177,6 +179,10 @@ class QueryUnit:
     in_type_id: bytes = sertypes.EMPTY_TUPLE_ID
     in_type_args: Optional[List[Param]] = None
 
+    # Set only for EXPLAIN statements: a map of relation aliases
+    # in the explained SQL to the EdgeQL paths they were compiled from.
+    explain_annotations: Optional[Dict[str, str]] = None
+
     # Set only when this unit contains a CONFIGURE SYSTEM command.
     system_config: bool = False
     config_requires_restart: bool = False
@@ -62,6 +62,8 @@ class PGErrorCode(enum.Enum):
 
     ObjectInUse = '55006'
 
+    QueryCanceled = '57014'
+
 
 class SchemaRequired:
     '''A sentinel used to signal that a particular error requires a schema.'''
@@ -318,6 +320,12 @@ def static_interpret_backend_error(fields):
     elif err_details.code == PGErrorCode.ObjectInUse:
         return errors.ExecutionError(err_details.message)
 
+    elif err_details.code == PGErrorCode.QueryCanceled:
+        if 'statement timeout' in err_details.message:
+            return errors.QueryTimeoutError(err_details.message)
+        else:
+            return errors.ExecutionError(err_details.message)
+
     return errors.InternalServerError(err_details.message)
 
 
@@ -0,0 +1,170 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Support for the EXPLAIN statement.
+
+At compile time the generated SQL tree is scanned for range variables
+and CTEs that have an EdgeQL path associated with them; at run time
+the JSON plan returned by Postgres is rendered as text, and every plan
+node that scans one of those relations is annotated with the path.
+"""
+
+from __future__ import annotations
+from typing import *
+
+import json
+
+from edb.common import ast
+from edb.pgsql import ast as pgast
+
+
+# Plan node properties rendered under the node line, in this order.
+_NODE_DETAILS = (
+    'Hash Cond',
+    'Merge Cond',
+    'Index Cond',
+    'Recheck Cond',
+    'Join Filter',
+    'Filter',
+    'Sort Key',
+    'Group Key',
+)
+
+
+def get_source_annotations(sql_tree: pgast.Base) -> Dict[str, str]:
+    """Map relation aliases and CTE names to EdgeQL paths."""
+
+    annotations: Dict[str, str] = {}
+
+    nodes = ast.find_children(
+        sql_tree,
+        lambda n: isinstance(n, (pgast.PathRangeVar, pgast.CommonTableExpr)),
+    )
+
+    for node in nodes:
+        if isinstance(node, pgast.CommonTableExpr):
+            name = node.name
+            query = node.query
+        else:
+            if node.alias is None:
+                continue
+            name = node.alias.aliasname
+            query = node.query
+
+        path_id = getattr(query, 'path_id', None)
+        if not name or path_id is None or name in annotations:
+            continue
+
+        source = path_id.pformat()
+        if source:
+            annotations[name] = source
+
+    return annotations
+
+
+def render_plan(
+    plan_json: str,
+    annotations: Mapping[str, str],
+) -> List[str]:
+    """Render a Postgres JSON plan as text annotated with EdgeQL paths."""
+
+    lines: List[str] = []
+    for result in json.loads(plan_json):
+        _render_node(result['Plan'], annotations, 0, lines)
+        for key in ('Planning Time', 'Execution Time'):
+            if key in result:
+                lines.append(f'{key}: {result[key]:.3f} ms')
+    return lines
+
+
+def _render_node(
+    node: Mapping[str, Any],
+    annotations: Mapping[str, str],
+    depth: int,
+    lines: List[str],
+) -> None:
+    if depth:
+        indent = '   ' * (depth - 1) + '  ->  '
+        detail_indent = '   ' * depth + '    '
+    else:
+        indent = ''
+        detail_indent = '  '
+
+    title = node['Node Type']
+    join_type = node.get('Join Type')
+    if join_type and join_type != 'Inner':
+        if title.endswith(' Join'):
+            title = title[:-len(' Join')]
+        title = f'{title} {join_type} Join'
+    relation = node.get('Relation Name') or node.get('CTE Name')
+    alias = node.get('Alias')
+    if relation:
+        title += f' on {relation}'
+        if alias and alias != relation:
+            title += f' {alias}'
+    elif alias:
+        title += f' on {alias}'
+
+    title += (
+        f'  (cost={node["Startup Cost"]:.2f}..{node["Total Cost"]:.2f}'
+        f' rows={node["Plan Rows"]} width={node["Plan Width"]})'
+    )
+    if 'Actual Total Time' in node:
+        title += (
+            f' (actual time={node["Actual Startup Time"]:.3f}'
+            f'..{node["Actual Total Time"]:.3f}'
+            f' rows={node["Actual Rows"]} loops={node["Actual Loops"]})'
+        )
+    elif node.get('Actual Loops') == 0:
+        title += ' (never executed)'
+
+    subplan = node.get('Subplan Name')
+    if subplan:
+        title = f'{subplan}: {title}'
+
+    lines.append(f'{indent}{title}')
+
+    source = _get_source(node, annotations)
+    if source is not None:
+        lines.append(f'{detail_indent}EdgeQL: {source}')
+
+    for key in _NODE_DETAILS:
+        value = node.get(key)
+        if value is None:
+            continue
+        if isinstance(value, list):
+            value = ', '.join(value)
+        lines.append(f'{detail_indent}{key}: {value}')
+
+    for child in node.get('Plans', ()):
+        _render_node(child, annotations, depth + 1, lines)
+
+
+def _get_source(
+    node: Mapping[str, Any],
+    annotations: Mapping[str, str],
+) -> Optional[str]:
+    candidates = [node.get('Alias'), node.get('CTE Name')]
+    subplan = node.get('Subplan Name')
+    if subplan and subplan.startswith('CTE '):
+        candidates.append(subplan[4:])
+
+    for name in candidates:
+        if name and name in annotations:
+            return annotations[name]
+    return None
@@ -147,6 +147,11 @@ def _describe(ql):
     return f'DESCRIBE'.encode()
 
 
+@get_status.register(qlast.ExplainStmt)
+def _explain(ql):
+    return f'EXPLAIN'.encode()
+
+
 @get_status.register(qlast.Rename)
 def _rename(ql):
     return f'RENAME'.encode()
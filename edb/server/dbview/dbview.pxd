@@ -35,6 +35,8 @@ cdef class Database:
         object _dbver
         object _eql_to_compiled
         DatabaseIndex _index
+        object _timer
+        object _query_stats
 
     cdef _signal_ddl(self, new_dbver)
     cdef _invalidate_caches(self)
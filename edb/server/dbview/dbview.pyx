@@ -26,7 +26,8 @@ import immutables
 
 from edb import errors
 from edb.common import lru, uuidgen
-from edb.server import defines, config
+from edb.server import defines, config, metrics
+from edb.server import querystats, timer
 from edb.server.compiler import dbstate
 from edb.pgsql import dbops
 
@@ -48,6 +49,13 @@ cdef class Database:
         self._eql_to_compiled = lru.LRUMapping(
             maxsize=defines._MAX_QUERIES_CACHE)
 
+        # Latency statistics shared by all connections to this database.
+        self._timer = timer.Timer(name)
+
+        # Per-query execution statistics.
+        self._query_stats = querystats.QueryStats(
+            maxsize=defines.QUERY_STATS_MAX_ENTRIES)
+
     cdef _signal_ddl(self, new_dbver):
         if new_dbver is None:
             self._dbver = uuidgen.uuid1mc().bytes
@@ -66,6 +74,10 @@ cdef class Database:
             # We already have a cached query for a more recent DB version.
             return
 
+        if (existing is None and
+                len(self._eql_to_compiled) >= defines._MAX_QUERIES_CACHE):
+            metrics.query_cache_evictions.inc()
+
         self._eql_to_compiled[key] = compiled
 
     cdef _new_view(self, user, query_cache):
@@ -142,6 +154,14 @@ cdef class DatabaseConnectionView:
         else:
             self._config = new_conf
 
+    def lookup_config(self, name: str):
+        return config.lookup(
+            config.get_settings(),
+            name,
+            self.get_session_config(),
+            self._db._index.get_sys_config(),
+        )
+
     property modaliases:
         def __get__(self):
             return self._modaliases
@@ -162,6 +182,14 @@ cdef class DatabaseConnectionView:
         def __get__(self):
             return self._db._name
 
+    property timer:
+        def __get__(self):
+            return self._db._timer
+
+    property query_stats:
+        def __get__(self):
+            return self._db._query_stats
+
     cdef in_tx(self):
         return self._in_tx
 
@@ -198,6 +226,11 @@ cdef class DatabaseConnectionView:
             if query_unit is not None and query_unit.dbver != self.dbver:
                 query_unit = None
 
+        if query_unit is None:
+            metrics.query_cache_misses.inc()
+        else:
+            metrics.query_cache_hits.inc()
+
         return query_unit
 
     cdef tx_error(self):
@@ -334,6 +367,33 @@ cdef class DatabaseIndex:
         db = self._get_db(dbname)
         return (<Database>db)._dbver
 
+    def get_query_stats(self, dbname=None):
+        if dbname is not None:
+            db = self._dbs.get(dbname)
+            if db is None:
+                return {}
+            dbs = {dbname: db}
+        else:
+            dbs = self._dbs
+
+        return {
+            name: (<Database>db)._query_stats.as_list()
+            for name, db in dbs.items()
+        }
+
+    def reset_query_stats(self, dbname=None):
+        if dbname is not None:
+            db = self._dbs.get(dbname)
+            if db is not None:
+                (<Database>db)._query_stats.reset()
+        else:
+            for db in self._dbs.values():
+                (<Database>db)._query_stats.reset()
+
+    def log_stats(self):
+        for db in self._dbs.values():
+            (<Database>db)._timer.log_all_stats()
+
     def _get_db(self, dbname):
         try:
             db = self._dbs[dbname]
@@ -27,7 +27,7 @@ EDGEDB_ENCODING = 'utf-8'
 EDGEDB_VISIBLE_METADATA_PREFIX = r'EdgeDB metadata follows, do not modify.\n'
 
 # Increment this whenever the database layout or stdlib changes.
-EDGEDB_CATALOG_VERSION = 2020_06_23_00_00
+EDGEDB_CATALOG_VERSION = 2020_06_30_00_00
 
 # Resource limit on open FDs for the server process.
 # By default, at least on macOS, the max number of open FDs
@@ -38,6 +38,19 @@ EDGEDB_MIN_RLIMIT_NOFILE = 2048
 
 _MAX_QUERIES_CACHE = 1000
 
+# Maximum number of parsed queries cached by a compiler process.
+_MAX_PARSED_QUERIES_CACHE = 1000
+
+# Maximum number of distinct queries tracked in per-database
+# query statistics.
+QUERY_STATS_MAX_ENTRIES = 5000
+
+# Maximum number of slow queries logged per minute.
+SLOW_QUERY_LOG_RATE_LIMIT = 10
+
+# Seconds a query can wait for admission before it is rejected.
+ADMISSION_TIMEOUT = 10.0
+
 _QUERY_ROLLING_AVG_LEN = 10
 _QUERIES_ROLLING_AVG_LEN = 300
 
@@ -45,4 +58,11 @@ DEFAULT_MODULE_ALIAS = 'default'
 
 
 HTTP_PORT_QUERY_CACHE_SIZE = 500
+HTTP_PORT_INTROSPECTION_CACHE_SIZE = 50
 HTTP_PORT_MAX_CONCURRENCY = 250
+# Grow an HTTP port's compiler or pgcon pool when a request had to wait
+# for a free one longer than this many seconds.
+HTTP_PORT_POOL_GROW_AFTER = 0.05
+# Close compilers and pgcons above the port's min_concurrency after
+# they have been idle for this many seconds.
+HTTP_PORT_POOL_IDLE_TIMEOUT = 300
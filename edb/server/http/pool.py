@@ -0,0 +1,305 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import asyncio
+import collections
+import logging
+import time
+
+from edb.common import taskgroup
+
+from edb.server import metrics
+
+
+logger = logging.getLogger('edb.server')
+
+
+class ElasticPool:
+    """A LIFO pool of compilers or backend connections.
+
+    The pool starts with *min_size* objects and grows up to *max_size*
+    when a ``get()`` call had to wait longer than *grow_after* seconds.
+    Objects that stayed idle for longer than *idle_timeout* seconds are
+    closed, but the pool never shrinks below *min_size*.
+
+    If *recycle* is given, it is called for every object put back into
+    the pool; objects for which it returns True are replaced with new
+    ones.  An object keeps being used until its replacement is ready.
+
+    A pool started with ``lazy=True`` creates its first *min_size*
+    objects on the first ``get()`` call instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        min_size: int,
+        max_size: int,
+        connect: Callable[[], Awaitable[Any]],
+        disconnect: Callable[[Any], Awaitable[None]],
+        grow_after: float,
+        idle_timeout: float,
+        recycle: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        if min_size <= 0 or min_size > max_size:
+            raise ValueError(
+                f'invalid {name} pool size bounds: '
+                f'min={min_size}, max={max_size}')
+
+        self._name = name
+        self._min_size = min_size
+        self._max_size = max_size
+        self._connect = connect
+        self._disconnect = disconnect
+        self._grow_after = grow_after
+        self._idle_timeout = idle_timeout
+        self._recycle = recycle
+
+        self._objects: List[Any] = []
+        # (object, released_at) pairs; the most recently released
+        # object is at the right end.
+        self._idle: Deque[Tuple[Any, float]] = collections.deque()
+        self._waiters: Deque[asyncio.Future] = collections.deque()
+        self._spawning = 0
+        # Objects being replaced, and replaced objects that are still
+        # in use and must be closed when they are put back.
+        self._replacing: Set[Any] = set()
+        self._retired: Set[Any] = set()
+        self._reaper: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._wait_count = 0
+        self._wait_time_total = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._objects)
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'size': self.size,
+            'min_size': self._min_size,
+            'max_size': self._max_size,
+            'idle': self.idle,
+            'waiting': self.waiting,
+            'wait_count': self._wait_count,
+            'wait_time_total': self._wait_time_total,
+        }
+
+    async def start(self, *, lazy: bool = False) -> None:
+        if not lazy:
+            async with taskgroup.TaskGroup() as g:
+                tasks = [g.create_task(self._connect())
+                         for _ in range(self._min_size)]
+
+            now = time.monotonic()
+            for task in tasks:
+                obj = task.result()
+                self._objects.append(obj)
+                self._idle.append((obj, now))
+
+        self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def stop(self) -> None:
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        while self._waiters:
+            self._waiters.popleft().cancel()
+
+        objects = list(self._objects)
+        self._objects.clear()
+        self._idle.clear()
+        self._replacing.clear()
+        self._retired.clear()
+
+        async with taskgroup.TaskGroup() as g:
+            for obj in objects:
+                g.create_task(self._disconnect(obj))
+
+    async def get(self) -> Any:
+        if self._idle:
+            obj, _ = self._idle.pop()
+            metrics.pool_wait_duration.observe(0.0, self._name)
+            return obj
+
+        while len(self._objects) + self._spawning < self._min_size:
+            self._grow()
+
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        started = time.monotonic()
+        try:
+            if self._can_grow():
+                done, _ = await asyncio.wait([fut], timeout=self._grow_after)
+                if not done:
+                    self._grow()
+            return await fut
+        except BaseException:
+            if (fut.done() and not fut.cancelled()
+                    and fut.exception() is None):
+                # We were handed an object, but got cancelled before
+                # we could use it; give it to someone else.
+                self.put_nowait(fut.result())
+            else:
+                fut.cancel()
+                try:
+                    self._waiters.remove(fut)
+                except ValueError:
+                    pass
+            raise
+        finally:
+            waited = time.monotonic() - started
+            self._wait_count += 1
+            self._wait_time_total += waited
+            metrics.pool_wait_duration.observe(waited, self._name)
+
+    def put_nowait(self, obj: Any) -> None:
+        if obj in self._retired:
+            self._retired.discard(obj)
+            self._objects.remove(obj)
+            asyncio.create_task(self._close(obj))
+            return
+
+        if (self._recycle is not None and obj not in self._replacing
+                and self._recycle(obj)):
+            self._replacing.add(obj)
+            asyncio.create_task(self._replace(obj))
+
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(obj)
+                return
+        self._idle.append((obj, time.monotonic()))
+
+    def _can_grow(self) -> bool:
+        return len(self._objects) + self._spawning < self._max_size
+
+    def _grow(self) -> None:
+        if self._can_grow():
+            self._spawning += 1
+            asyncio.create_task(self._spawn())
+
+    async def _spawn(self) -> None:
+        try:
+            try:
+                obj = await self._connect()
+            finally:
+                self._spawning -= 1
+        except Exception as ex:
+            logger.exception('could not grow the %s pool', self._name)
+            if not self._objects and not self._spawning:
+                # Nothing will ever be put back into the pool,
+                # don't leave the waiters hanging.
+                while self._waiters:
+                    fut = self._waiters.popleft()
+                    if not fut.done():
+                        fut.set_exception(ex)
+            return
+
+        if self._closed:
+            await self._disconnect(obj)
+            return
+
+        self._objects.append(obj)
+        logger.debug('grew the %s pool to %d', self._name, self.size)
+        self.put_nowait(obj)
+
+    async def _replace(self, old: Any) -> None:
+        try:
+            new = await self._connect()
+        except Exception:
+            logger.exception('could not replace an object in the %s pool',
+                             self._name)
+            return
+        finally:
+            self._replacing.discard(old)
+
+        if self._closed:
+            await self._disconnect(new)
+            return
+
+        idle = False
+        for i, (obj, _) in enumerate(self._idle):
+            if obj is old:
+                del self._idle[i]
+                self._objects.remove(old)
+                idle = True
+                break
+        else:
+            if old in self._objects:
+                # Still in use; close it when it's put back.
+                self._retired.add(old)
+
+        self._objects.append(new)
+        logger.debug('replaced an object in the %s pool', self._name)
+        self.put_nowait(new)
+
+        if idle:
+            await self._close(old)
+
+    async def _close(self, obj: Any) -> None:
+        try:
+            await self._disconnect(obj)
+        except Exception:
+            logger.exception('could not close an object in the %s pool',
+                             self._name)
+
+    async def _reap_idle(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self._idle_timeout / 2)
+            except asyncio.CancelledError:
+                return
+
+            # The least recently used objects are at the left end
+            # of the idle queue.
+            deadline = time.monotonic() - self._idle_timeout
+            reaped = 0
+            while (len(self._objects) > self._min_size
+                    and self._idle
+                    and self._idle[0][1] < deadline):
+                obj, _ = self._idle.popleft()
+                self._objects.remove(obj)
+                reaped += 1
+                try:
+                    await self._disconnect(obj)
+                except Exception:
+                    logger.exception(
+                        'could not close an idle object in the %s pool',
+                        self._name)
+
+            if reaped:
+                logger.debug('shrunk the %s pool to %d',
+                             self._name, self.size)
@@ -18,6 +18,7 @@
 
 
 from __future__ import annotations
+from typing import *
 
 import asyncio
 import logging
@@ -29,6 +30,8 @@ from edb.server import baseport
 from edb.server import cache
 from edb.server import defines
 
+from . import pool
+
 log_metrics = logging.getLogger('edb.server.metrics')
 
 
@@ -39,6 +42,8 @@ class BaseHttpPort(baseport.Port):
                  user: str,
                  concurrency: int,
                  protocol: str,
+                 min_concurrency: Optional[int] = None,
+                 lazy: bool = False,
                  **kwargs):
 
         super().__init__(**kwargs)
@@ -51,10 +56,32 @@ class BaseHttpPort(baseport.Port):
                 f'concurrency must be greater than 0 and '
                 f'less than {defines.HTTP_PORT_MAX_CONCURRENCY}')
 
-        self._compilers = asyncio.LifoQueue()
-        self._pgcons = asyncio.LifoQueue()
-        self._compilers_list = []
-        self._pgcons_list = []
+        if min_concurrency is None:
+            min_concurrency = concurrency
+        elif min_concurrency <= 0 or min_concurrency > concurrency:
+            raise RuntimeError(
+                'min_concurrency must be greater than 0 and '
+                'not greater than concurrency')
+
+        self._compilers = pool.ElasticPool(
+            name=f'compiler-{netport}',
+            min_size=min_concurrency,
+            max_size=concurrency,
+            connect=self._new_compiler,
+            disconnect=self._close_compiler,
+            grow_after=defines.HTTP_PORT_POOL_GROW_AFTER,
+            idle_timeout=defines.HTTP_PORT_POOL_IDLE_TIMEOUT,
+            recycle=lambda compiler: compiler.needs_recycling(),
+        )
+        self._pgcons = pool.ElasticPool(
+            name=f'pgcon-{netport}',
+            min_size=min_concurrency,
+            max_size=concurrency,
+            connect=self._new_pgcon,
+            disconnect=self._close_pgcon,
+            grow_after=defines.HTTP_PORT_POOL_GROW_AFTER,
+            idle_timeout=defines.HTTP_PORT_POOL_IDLE_TIMEOUT,
+        )
 
         self._nethost = nethost
         self._netport = netport
@@ -62,6 +89,8 @@ class BaseHttpPort(baseport.Port):
         self.database = database
         self.user = user
         self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self._lazy = lazy
         self.last_minute_requests = windowedsum.WindowedSum()
 
         self._http_proto_server = None
@@ -93,27 +122,24 @@ class BaseHttpPort(baseport.Port):
     def build_protocol(self):
         raise NotImplementedError
 
-    async def start(self):
-        compilers = []
-        pgcons = []
+    async def _new_compiler(self):
+        return await self.new_compiler(self.database, self.get_dbver())
 
-        await super().start()
+    async def _close_compiler(self, compiler):
+        await compiler.close()
 
-        async with taskgroup.TaskGroup() as g:
-            for _ in range(self.concurrency):
-                compilers.append(
-                    g.create_task(self.new_compiler(
-                        self.database, self.get_dbver())))
-                pgcons.append(
-                    g.create_task(self.get_server().new_pgcon(self.database)))
+    async def _new_pgcon(self):
+        return await self.get_server().new_pgcon(self.database)
 
-        for com_task in compilers:
-            self._compilers.put_nowait(com_task.result())
-            self._compilers_list.append(com_task.result())
+    async def _close_pgcon(self, pgcon):
+        pgcon.terminate()
 
-        for con_task in pgcons:
-            self._pgcons.put_nowait(con_task.result())
-            self._pgcons_list.append(con_task.result())
+    async def start(self):
+        await super().start()
+
+        async with taskgroup.TaskGroup() as g:
+            g.create_task(self._compilers.start(lazy=self._lazy))
+            g.create_task(self._pgcons.start(lazy=self._lazy))
 
         nethost = await self._fix_localhost(self._nethost, self._netport)
         self._http_proto_server = await self._loop.create_server(
@@ -133,13 +159,9 @@ class BaseHttpPort(baseport.Port):
         finally:
             try:
                 async with taskgroup.TaskGroup() as g:
-                    for cmp in self._compilers_list:
-                        g.create_task(cmp.close())
-                    self._compilers_list.clear()
+                    g.create_task(self._compilers.stop())
+                    g.create_task(self._pgcons.stop())
 
-                for pgcon in self._pgcons_list:
-                    pgcon.terminate()
-                self._pgcons_list.clear()
                 if self._http_request_logger is not None:
                     self._http_request_logger.cancel()
                     await self._http_request_logger
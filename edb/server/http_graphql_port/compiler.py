@@ -21,6 +21,7 @@ from __future__ import annotations
 from typing import *
 
 import dataclasses
+import json
 
 import immutables
 
@@ -54,6 +55,14 @@ class CompiledOperation:
     variables: Dict
 
 
+@dataclasses.dataclass(frozen=True)
+class IntrospectionResponse:
+
+    data: bytes
+    dbver: int
+    cache_deps_vars: Optional[FrozenSet[str]]
+
+
 class Compiler(compiler.BaseCompiler):
 
     def _wrap_schema(
@@ -78,7 +87,7 @@ class Compiler(compiler.BaseCompiler):
         substitutions: Optional[Dict[str, Tuple[str, int, int]]],
         operation_name: str=None,
         variables: Optional[Mapping[str, object]]=None,
-    ) -> CompiledOperation:
+    ) -> Union[CompiledOperation, IntrospectionResponse]:
 
         db = await self._get_database(dbver)
 
@@ -86,6 +95,23 @@ class Compiler(compiler.BaseCompiler):
             ast = graphql.parse_text(gql)
         else:
             ast = graphql.parse_tokens(gql, tokens)
+
+        if graphql.is_introspection_query(ast, operation_name=operation_name):
+            # Pure introspection queries are answered from the GraphQL
+            # schema directly; the response is cached by the port
+            # until the next DDL bumps dbver.
+            res = graphql.execute_introspection(
+                db.gqlcore,
+                ast,
+                variables=variables,
+                substitutions=substitutions,
+                operation_name=operation_name)
+            return IntrospectionResponse(
+                data=json.dumps(res.data).encode(),
+                dbver=dbver,
+                cache_deps_vars=res.cache_deps_vars,
+            )
+
         op = graphql.translate_ast(
             db.gqlcore,
             ast,
@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+from edb.server import defines
 from edb.server import http
 
 from . import compiler
@@ -27,6 +28,26 @@ from . import protocol
 
 class HttpGraphQLPort(http.BaseHttpPort):
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._introspection_cache = {}
+        self._introspection_dbver = None
+
+    def get_introspection_cache(self, dbver: int) -> dict:
+        # Introspection responses depend only on the schema, so the
+        # whole cache is dropped as soon as DDL bumps the dbver.
+        if dbver != self._introspection_dbver:
+            self._introspection_cache = {}
+            self._introspection_dbver = dbver
+        return self._introspection_cache
+
+    def cache_introspection(self, key, entry) -> None:
+        cache = self._introspection_cache
+        if key not in cache:
+            while len(cache) >= defines.HTTP_PORT_INTROSPECTION_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = entry
+
     def build_protocol(self):
         return protocol.Protocol(self._loop, self, self._query_cache)
 
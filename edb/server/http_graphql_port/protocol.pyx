@@ -55,7 +55,11 @@ cdef class CacheRedirect:
         self.key_vars = key_vars
 
 
-CacheEntry = Union[CacheRedirect, compiler.CompiledOperation]
+CacheEntry = Union[
+    CacheRedirect,
+    compiler.CompiledOperation,
+    compiler.IntrospectionResponse,
+]
 
 
 cdef class Protocol(http.HttpProtocol):
@@ -238,12 +242,21 @@ cdef class Protocol(http.HttpProtocol):
         cache_key = (prepared_query, key_vars, operation_name, dbver)
         use_prep_stmt = False
 
-        entry: CacheEntry = self.query_cache.get(cache_key, None)
+        introspection_cache = self.server.get_introspection_cache(dbver)
+        entry: CacheEntry = introspection_cache.get(cache_key)
+        if entry is None:
+            entry = self.query_cache.get(cache_key, None)
+            is_introspection = False
+        else:
+            is_introspection = True
 
         if isinstance(entry, CacheRedirect):
             key_vars2 = tuple(vars[k] for k in entry.key_vars)
             cache_key2 = (prepared_query, key_vars2, operation_name, dbver)
-            entry = self.query_cache.get(cache_key2, None)
+            if is_introspection:
+                entry = introspection_cache.get(cache_key2)
+            else:
+                entry = self.query_cache.get(cache_key2, None)
 
         if entry is None:
             if rewritten is not None:
@@ -256,15 +269,23 @@ cdef class Protocol(http.HttpProtocol):
                 op = await self.compile(
                     dbver, query, None, None, operation_name, vars)
 
+            is_introspection = isinstance(op, compiler.IntrospectionResponse)
+
             key_var_set = set(key_var_names)
             if op.cache_deps_vars and op.cache_deps_vars != key_var_set:
                 key_var_set.update(op.cache_deps_vars)
                 key_var_names = sorted(key_var_set)
                 redir = CacheRedirect(key_vars=key_var_names)
-                self.query_cache[cache_key] = redir
                 key_vars2 = tuple(vars[k] for k in key_var_names)
                 cache_key2 = (prepared_query, key_vars2, operation_name, dbver)
-                self.query_cache[cache_key2] = op
+                if is_introspection:
+                    self.server.cache_introspection(cache_key, redir)
+                    self.server.cache_introspection(cache_key2, op)
+                else:
+                    self.query_cache[cache_key] = redir
+                    self.query_cache[cache_key2] = op
+            elif is_introspection:
+                self.server.cache_introspection(cache_key, op)
             else:
                 self.query_cache[cache_key] = op
         else:
@@ -273,6 +294,10 @@ cdef class Protocol(http.HttpProtocol):
             # and it's safe to cache.
             use_prep_stmt = True
 
+        if is_introspection:
+            # Introspection does not need a round-trip to Postgres.
+            return op.data
+
         args = []
         if op.sql_args:
             for name in op.sql_args:
@@ -21,6 +21,7 @@ from __future__ import annotations
 from typing import *
 
 import asyncio
+import concurrent.futures
 import contextlib
 import errno
 import getpass
@@ -43,6 +44,7 @@ import setproctitle
 
 from edb.common import devmode
 from edb.common import exceptions
+from edb.common import tracing
 
 from . import buildmeta
 from . import cluster as edgedb_cluster
@@ -52,6 +54,7 @@ from . import logsetup
 from . import pgconnparams
 from . import pgcluster
 from . import mng_port
+from . import startup
 
 
 logger = logging.getLogger('edb.server')
@@ -172,7 +175,8 @@ def _init_parsers():
 
     from edb.edgeql import parser as ql_parser
 
-    ql_parser.preload()
+    with startup.phase('init parsers'):
+        ql_parser.preload()
 
 
 def _run_server(cluster, args: ServerConfig,
@@ -183,7 +187,14 @@ def _run_server(cluster, args: ServerConfig,
     # under coverage (if we're testing with it).  Otherwise
     # coverage will fail to detect that "import edb..." lines
     # actually were run.
-    from . import server
+    with startup.phase('import server'):
+        from . import server
+
+    if args.trace_file is not None:
+        tracing.configure(
+            sample_rate=args.trace_sample_rate,
+            exporter=tracing.JSONFileExporter(args.trace_file),
+        )
 
     ss = server.Server(
         loop=loop,
@@ -196,18 +207,31 @@ def _run_server(cluster, args: ServerConfig,
         auto_shutdown=args.auto_shutdown,
         echo_runtime_info=args.echo_runtime_info,
         max_protocol=args.max_protocol,
+        admission_limits={
+            'execute': (args.max_concurrent_queries,
+                        args.max_concurrent_queries_per_role),
+            'compile': (args.max_concurrent_compilations,
+                        args.max_concurrent_compilations_per_role),
+        },
+        admission_timeout=args.admission_timeout,
+        compiler_max_requests=args.compiler_max_requests,
+        compiler_max_rss=args.compiler_max_rss * 1024 * 1024,
     )
 
-    loop.run_until_complete(ss.init())
+    with startup.phase('server init'):
+        loop.run_until_complete(ss.init())
 
     try:
-        loop.run_until_complete(ss.start())
+        with startup.phase('server start'):
+            loop.run_until_complete(ss.start())
     except Exception:
         loop.run_until_complete(ss.stop())
         raise
 
     loop.add_signal_handler(signal.SIGTERM, terminate_server, ss, loop)
 
+    startup.report()
+
     # Notify systemd that we've started up.
     _sd_notify('READY=1')
 
@@ -218,6 +242,7 @@ def _run_server(cluster, args: ServerConfig,
             logger.info('Shutting down.')
             loop.run_until_complete(ss.stop())
         finally:
+            tracing.configure(sample_rate=0.0, exporter=None)
             _sd_notify('STOPPING=1')
 
 
@@ -229,7 +254,15 @@ def run_server(args: ServerConfig):
     else:
         logger.info(f'EdgeDB server ({ver}) starting.')
 
-    _init_parsers()
+    startup.profile_imports()
+
+    # Loading the parser specs is CPU-bound, while starting the
+    # Postgres cluster is mostly waiting on a subprocess, so overlap
+    # the two.  The parsers must be ready before the bootstrap.
+    parsers_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix='init-parsers')
+    parsers_ready = parsers_executor.submit(_init_parsers)
+    parsers_executor.shutdown(wait=False)
 
     pg_cluster_init_by_us = False
     pg_cluster_started_by_us = False
@@ -253,7 +286,8 @@ def run_server(args: ServerConfig):
               'are specified')
 
     try:
-        pg_cluster_init_by_us = cluster.ensure_initialized()
+        with startup.phase('initialize cluster'):
+            pg_cluster_init_by_us = cluster.ensure_initialized()
 
         cluster_status = cluster.get_status()
 
@@ -279,14 +313,19 @@ def run_server(args: ServerConfig):
                 _internal_state_dir(runstate_dir) as internal_runstate_dir:
 
             if cluster_status == 'stopped':
-                cluster.start(port=edgedb_cluster.find_available_port())
+                with startup.phase('start cluster'):
+                    cluster.start(
+                        port=edgedb_cluster.find_available_port())
                 pg_cluster_started_by_us = True
 
             elif cluster_status != 'running':
                 abort('Could not start database cluster in %s',
                       args.data_dir)
 
-            need_cluster_restart = _init_cluster(cluster, args)
+            parsers_ready.result()
+
+            with startup.phase('bootstrap'):
+                need_cluster_restart = _init_cluster(cluster, args)
 
             if need_cluster_restart and pg_cluster_started_by_us:
                 logger.info('Restarting server to reload configuration...')
@@ -401,6 +440,15 @@ class ServerConfig(typing.NamedTuple):
     temp_dir: bool
     auto_shutdown: bool
     max_protocol: Tuple[int, int]
+    trace_file: Optional[pathlib.Path]
+    trace_sample_rate: float
+    max_concurrent_queries: int
+    max_concurrent_queries_per_role: int
+    max_concurrent_compilations: int
+    max_concurrent_compilations_per_role: int
+    admission_timeout: float
+    compiler_max_requests: int
+    compiler_max_rss: int
 
 
 def bump_rlimit_nofile() -> None:
@@ -515,6 +563,48 @@ _server_options = [
         '--max-protocol', type=str, callback=_protocol_version,
         default='.'.join(map(str, mng_port.CURRENT_PROTOCOL)),
         help='maximum supported and advertized client protocol version'),
+    click.option(
+        '--trace-file', type=PathPath(), default=None,
+        envvar='EDGEDB_TRACE_FILE',
+        help='append traces of sampled queries to the specified file '
+             '(one OTLP/JSON document per line)'),
+    click.option(
+        '--trace-sample-rate', type=click.FloatRange(0.0, 1.0),
+        default=0.01, envvar='EDGEDB_TRACE_SAMPLE_RATE',
+        help='fraction of queries to trace when --trace-file '
+             'is specified'),
+    click.option(
+        '--max-concurrent-queries', type=click.IntRange(0), default=0,
+        help='maximum number of queries executing concurrently in '
+             'a database; excess queries are queued (0 means no limit)'),
+    click.option(
+        '--max-concurrent-queries-per-role', type=click.IntRange(0),
+        default=0,
+        help='maximum number of queries executing concurrently on '
+             'behalf of a role (0 means no limit)'),
+    click.option(
+        '--max-concurrent-compilations', type=click.IntRange(0), default=0,
+        help='maximum number of queries compiled concurrently for '
+             'a database (0 means no limit)'),
+    click.option(
+        '--max-concurrent-compilations-per-role', type=click.IntRange(0),
+        default=0,
+        help='maximum number of queries compiled concurrently on '
+             'behalf of a role (0 means no limit)'),
+    click.option(
+        '--admission-timeout', type=click.FloatRange(0.0),
+        default=defines.ADMISSION_TIMEOUT,
+        help='number of seconds a query can be queued because of the '
+             'concurrency limits before it is rejected'),
+    click.option(
+        '--compiler-max-requests', type=click.IntRange(0), default=0,
+        help='replace a compiler process after it has served this '
+             'many requests (0 means never)'),
+    click.option(
+        '--compiler-max-rss', type=click.IntRange(0), default=0,
+        metavar='MEGABYTES',
+        help='replace a compiler process once its resident memory '
+             'size exceeds this many megabytes (0 means never)'),
     click.option(
         '--version', is_flag=True,
         help='Show the version and exit.')
@@ -0,0 +1,105 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+
+from edb.common import prometheus as prom
+
+
+registry = prom.Registry(prefix='edgedb_server')
+
+current_client_connections = registry.new_gauge(
+    'client_connections_current',
+    'Current number of active client connections.',
+)
+
+total_client_connections = registry.new_counter(
+    'client_connections_total',
+    'Total number of client connections.',
+)
+
+current_compiler_processes = registry.new_gauge(
+    'compiler_processes_current',
+    'Current number of active compiler processes.',
+    labels=('pool',),
+)
+
+total_compiler_processes_spawned = registry.new_counter(
+    'compiler_processes_spawned_total',
+    'Total number of compiler processes spawned.',
+    labels=('pool',),
+)
+
+total_compiler_processes_killed = registry.new_counter(
+    'compiler_processes_killed_total',
+    'Total number of compiler processes shut down.',
+    labels=('pool',),
+)
+
+query_compilation_duration = registry.new_histogram(
+    'query_compilation_duration',
+    'Time it takes to compile an EdgeQL query.',
+    unit='seconds',
+)
+
+query_execution_duration = registry.new_histogram(
+    'query_execution_duration',
+    'Time it takes to execute a compiled query in the backend.',
+    unit='seconds',
+)
+
+query_cache_hits = registry.new_counter(
+    'query_cache_hits_total',
+    'Number of compiled queries found in the query cache.',
+)
+
+query_cache_misses = registry.new_counter(
+    'query_cache_misses_total',
+    'Number of queries that were not found in the query cache.',
+)
+
+query_cache_evictions = registry.new_counter(
+    'query_cache_evictions_total',
+    'Number of compiled queries evicted from the query cache.',
+)
+
+pool_wait_duration = registry.new_histogram(
+    'pool_wait_duration',
+    'Time spent waiting for a free compiler or backend connection '
+    'in an HTTP port pool.',
+    unit='seconds',
+    labels=('pool',),
+)
+
+admission_rejections = registry.new_counter(
+    'admission_rejections_total',
+    'Number of queries rejected because of too many concurrent '
+    'executions or compilations.',
+    labels=('kind', 'scope'),
+)
+
+dump_bytes = registry.new_counter(
+    'dump_bytes_total',
+    'Number of bytes of data blocks sent by DUMP.',
+)
+
+restore_bytes = registry.new_counter(
+    'restore_bytes_total',
+    'Number of bytes of data blocks received by RESTORE.',
+)
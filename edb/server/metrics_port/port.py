@@ -0,0 +1,88 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+
+from edb.common import windowedsum
+from edb.server import baseport
+
+from . import protocol
+
+
+class MetricsPort(baseport.Port):
+    """An HTTP port exposing server metrics in the Prometheus format.
+
+    The port also serves per-query execution statistics of all
+    databases as JSON on /query-stats (optionally filtered with the
+    "database" query parameter); POST to /query-stats/reset clears them.
+
+    Unlike other application ports it does not need compilers or
+    backend connections, so the "database", "user" and "concurrency"
+    settings of its cfg::Port are ignored.
+    """
+
+    def __init__(self, nethost: str, netport: int,
+                 protocol: str,
+                 **kwargs):
+
+        # Discard the cfg::Port settings that only make sense
+        # for query-serving ports.
+        for setting in ('database', 'user', 'concurrency',
+                        'min_concurrency', 'lazy'):
+            kwargs.pop(setting, None)
+
+        super().__init__(**kwargs)
+
+        if protocol != self.get_proto_name():
+            raise RuntimeError(f'unknown protocol {protocol!r}')
+
+        self._nethost = nethost
+        self._netport = netport
+        self._http_proto_server = None
+        self.last_minute_requests = windowedsum.WindowedSum()
+
+    @classmethod
+    def get_proto_name(cls):
+        return 'metrics+http'
+
+    def get_dbindex(self):
+        return self._dbindex
+
+    def build_protocol(self):
+        return protocol.Protocol(self._loop, self)
+
+    async def start(self):
+        if self._serving:
+            raise RuntimeError('already serving')
+        self._serving = True
+
+        nethost = await self._fix_localhost(self._nethost, self._netport)
+        self._http_proto_server = await self._loop.create_server(
+            self.build_protocol,
+            host=nethost, port=self._netport)
+
+    async def stop(self):
+        try:
+            srv = self._http_proto_server
+            if srv is not None:
+                self._http_proto_server = None
+                srv.close()
+                await srv.wait_closed()
+        finally:
+            await super().stop()
@@ -0,0 +1,66 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import json
+import urllib.parse
+
+from edb.server import metrics
+from edb.server.http import http
+from edb.server.http cimport http
+
+
+cdef class Protocol(http.HttpProtocol):
+
+    async def handle_request(self, http.HttpRequest request,
+                             http.HttpResponse response):
+        url_path = request.url.path.strip(b'/')
+
+        if url_path == b'metrics' and request.method == b'GET':
+            response.status = http.HTTPStatus.OK
+            response.content_type = (
+                b'text/plain; version=0.0.4; charset=utf-8')
+            response.body = metrics.registry.generate().encode()
+
+        elif url_path == b'query-stats' and request.method == b'GET':
+            dbindex = self.server.get_dbindex()
+            stats = dbindex.get_query_stats(self._get_dbname(request))
+            response.status = http.HTTPStatus.OK
+            response.content_type = b'application/json'
+            response.body = json.dumps(stats).encode()
+
+        elif url_path == b'query-stats/reset' and request.method == b'POST':
+            dbindex = self.server.get_dbindex()
+            dbindex.reset_query_stats(self._get_dbname(request))
+            response.status = http.HTTPStatus.OK
+            response.content_type = b'application/json'
+            response.body = b'{}'
+
+        else:
+            response.body = f'Unknown path: /{url_path.decode()!r}'.encode()
+            response.status = http.HTTPStatus.NOT_FOUND
+            response.close_connection = True
+
+    def _get_dbname(self, http.HttpRequest request):
+        if not request.url.query:
+            return None
+        qs = urllib.parse.parse_qs(request.url.query.decode('ascii'))
+        dbname = qs.get('database')
+        if dbname is not None:
+            dbname = dbname[0]
+        return dbname
@@ -56,6 +56,8 @@ cdef class CompiledQuery:
     cdef public object first_extra  # Optional[int]
     cdef public int extra_count
     cdef public bytes extra_blob
+    cdef public str stats_key
+    cdef public bint cached
 
 
 @cython.final
@@ -97,6 +99,9 @@ cdef class EdgeConnection:
         tuple max_protocol
         object timer
 
+        bytes _cancel_key
+        object _admission
+
         object __weakref__
 
     cdef _parse_io_format(self, bytes mode)
@@ -116,6 +121,11 @@ cdef class EdgeConnection:
         bytes bind_args, CompiledQuery compiled)
 
     cdef WriteBuffer make_describe_msg(self, CompiledQuery query)
+    cdef _record_query_stats(self, CompiledQuery compiled, double duration,
+                             bint error)
+    cdef _maybe_log_slow_query(self, CompiledQuery compiled,
+                               bytes bind_args, WriteBuffer bound_args_buf,
+                               double duration)
     cdef WriteBuffer make_command_complete_msg(self, query_unit)
 
     cdef inline reject_headers(self)
@@ -125,13 +135,8 @@ cdef class EdgeConnection:
     cdef write_log(self, EdgeSeverity severity, uint32_t code, str message)
 
     cdef get_backend(self)
+    cdef _maybe_recycle_compiler(self)
+    cdef _admit(self, str kind)
+    cdef _admit_execute(self, query_unit)
 
     cdef uint64_t _parse_implicit_limit(self, bytes v) except <uint64_t>-1
-
-
-@cython.final
-cdef class Timer:
-    cdef:
-        dict _durations
-        dict _last_report_timestamp
-        int _threshold_seconds
@@ -18,18 +18,17 @@
 
 import asyncio
 import collections
-import contextlib
+import functools
 import hashlib
 import json
 import logging
 import time
-import statistics
 import traceback
 
 cimport cython
 cimport cpython
 
-from typing import Dict, List, Optional, Sequence
+from typing import List, Optional
 from . cimport cpythonx
 
 from libc.stdint cimport int8_t, uint8_t, int16_t, uint16_t, \
@@ -56,11 +55,15 @@ from edb.server.pgproto.pgproto import UUID as pg_UUID
 
 from edb.server.dbview cimport dbview
 
+from edb.server import admission
 from edb.server import config
 
 from edb.server import buildmeta
 from edb.server import compiler
+from edb.server import metrics
+from edb.server import slowlog
 from edb.server.compiler import errormech
+from edb.server.compiler import explain
 from edb.server.pgcon cimport pgcon
 from edb.server.pgcon import errors as pgerror
 
@@ -69,6 +72,7 @@ from edb.schema import objects as s_obj
 from edb import errors
 from edb.errors import base as base_errors, EdgeQLSyntaxError
 from edb.common import debug, taskgroup
+from edb.common import tracing
 from edb.common import context as pctx
 
 from edgedb import scram
@@ -105,12 +109,16 @@ cdef class CompiledQuery:
     def __init__(self, object query_unit,
         first_extra: Optional[int]=None,
         int extra_count=0,
-        bytes extra_blob=None
+        bytes extra_blob=None,
+        str stats_key=None,
+        bint cached=False,
     ):
         self.query_unit = query_unit
         self.first_extra = first_extra
         self.extra_count = extra_count
         self.extra_blob = extra_blob
+        self.stats_key = stats_key
+        self.cached = cached
 
 
 @cython.final
@@ -150,7 +158,9 @@ cdef class EdgeConnection:
 
         self.protocol_version = max_protocol
         self.max_protocol = max_protocol
-        self.timer = Timer()
+        self.timer = None
+        self._cancel_key = None
+        self._admission = None
 
     def on_remote_ddl(self, dbver):
         if not self.dbview:
@@ -199,7 +209,6 @@ cdef class EdgeConnection:
         if self._backend is not None:
             self.loop.create_task(self._backend.close())
             self._backend = None
-        self.timer.log_all_stats()
 
     cdef close(self):
         self.flush()
@@ -210,7 +219,6 @@ cdef class EdgeConnection:
         if self._backend is not None:
             self.loop.create_task(self._backend.close())
             self._backend = None
-        self.timer.log_all_stats()
 
     cdef flush(self):
         if self._transport is None:
@@ -240,6 +248,9 @@ cdef class EdgeConnection:
 
         await self.wait_for_message()
         mtype = self.buffer.get_message_type()
+        if mtype == b'c':
+            await self.cancel_request()
+            return False
         if mtype != b'V':
             raise errors.BinaryProtocolError(
                 f'unexpected initial message: {mtype}, expected "V"')
@@ -268,6 +279,8 @@ cdef class EdgeConnection:
             query_cache=self.query_cache_enabled)
         assert type(dbv) is dbview.DatabaseConnectionView
         self.dbview = <dbview.DatabaseConnectionView>dbv
+        self.timer = self.dbview.timer
+        self._admission = self.port.get_server().get_admission_controller()
 
         self._backend = await self.port.new_backend(
             dbname=database, dbver=self.dbview.dbver)
@@ -302,8 +315,8 @@ cdef class EdgeConnection:
         buf.write_buffer(msg_buf)
 
         msg_buf = WriteBuffer.new_message(b'K')
-        # TODO: should send ID of this connection
-        msg_buf.write_bytes(b'\x00' * 32)
+        self._cancel_key = self.port.new_cancel_key(self)
+        msg_buf.write_bytes(self._cancel_key)
         msg_buf.end_message()
         buf.write_buffer(msg_buf)
 
@@ -325,6 +338,22 @@ cdef class EdgeConnection:
 
         self.write(buf)
         self.flush()
+        return True
+
+    async def cancel_request(self):
+        # A CancelRequest is sent by the client over a new connection
+        # in place of the ClientHandshake.  It carries the key sent to
+        # the client in the ServerKeyData message; no response is
+        # sent back and the connection is closed.
+        key = self.buffer.read_bytes(32)
+        self.buffer.finish_message()
+        self.close()
+        await self.port.cancel_query(key)
+
+    async def cancel_query(self):
+        if self._backend is None:
+            return
+        await self._backend.pgcon.cancel()
 
     async def do_handshake(self):
         cdef:
@@ -624,31 +653,81 @@ cdef class EdgeConnection:
         if self.dbview.in_tx_error():
             self.dbview.raise_in_tx_error()
 
+        self._maybe_recycle_compiler()
+
+        async with self._admit('compile'):
+            if self.dbview.in_tx():
+                return await self.get_backend().compiler.call(
+                    'compile_eql_tokens_in_tx',
+                    self.dbview.txid,
+                    tokens,
+                    io_format,
+                    expect_one,
+                    implicit_limit,
+                    stmt_mode,
+                    first_extracted_var,
+                )
+            else:
+                return await self.get_backend().compiler.call(
+                    'compile_eql_tokens',
+                    self.dbview.dbver,
+                    tokens,
+                    self.dbview.modaliases,
+                    self.dbview.get_session_config(),
+                    io_format,
+                    expect_one,
+                    implicit_limit,
+                    stmt_mode,
+                    CAP_ALL,
+                    first_extracted_var,
+                )
+
+    cdef _maybe_recycle_compiler(self):
         if self.dbview.in_tx():
-            return await self.get_backend().compiler.call(
-                'compile_eql_tokens_in_tx',
-                self.dbview.txid,
-                tokens,
-                io_format,
-                expect_one,
-                implicit_limit,
-                stmt_mode,
-                first_extracted_var,
-            )
-        else:
-            return await self.get_backend().compiler.call(
-                'compile_eql_tokens',
+            # The state of an open transaction lives in the compiler
+            # process; it can only be replaced between transactions.
+            return
+
+        backend = self.get_backend()
+        backend.swap_compiler()
+        if backend.compiler.needs_recycling():
+            backend.replace_compiler(functools.partial(
+                self.port.new_compiler,
+                self.dbview.dbname,
                 self.dbview.dbver,
-                tokens,
-                self.dbview.modaliases,
-                self.dbview.get_session_config(),
-                io_format,
-                expect_one,
-                implicit_limit,
-                stmt_mode,
-                CAP_ALL,
-                first_extracted_var,
-            )
+            ))
+
+    cdef _admit(self, str kind):
+        if self.dbview.in_tx():
+            # Let the transactions that are already running finish
+            # first: they hold locks and backend snapshots.
+            priority = admission.Priority.HIGH
+        else:
+            priority = admission.Priority.NORMAL
+        return self._admission.admit(
+            kind,
+            dbname=self.dbview.dbname,
+            role=self.dbview.user,
+            priority=priority,
+        )
+
+    cdef _admit_execute(self, query_unit):
+        # The statements of an already open transaction, and the ones
+        # ending it, are not subject to admission: the transaction may
+        # hold locks that the queries occupying every slot are waiting
+        # for, and queueing it would leave nothing able to make progress.
+        exempt = (
+            (self.dbview.in_tx() and query_unit.tx_id is None)
+            or query_unit.tx_commit
+            or query_unit.tx_rollback
+            or query_unit.tx_savepoint_rollback
+        )
+        return self._admission.admit(
+            'execute',
+            dbname=self.dbview.dbname,
+            role=self.dbview.user,
+            exempt=exempt,
+        )
 
     async def _compile_rollback(self, bytes eql):
         assert self.dbview.in_tx_error()
@@ -719,13 +798,14 @@ cdef class EdgeConnection:
                 if query_unit.system_config:
                     await self._execute_system_config(query_unit)
                 else:
-                    if query_unit.is_transactional:
-                        await self.get_backend().pgcon.simple_query(
-                            b';'.join(query_unit.sql), ignore_data=True)
-                    else:
-                        for sql in query_unit.sql:
+                    async with self._admit_execute(query_unit):
+                        if query_unit.is_transactional:
                             await self.get_backend().pgcon.simple_query(
-                                sql, ignore_data=True)
+                                b';'.join(query_unit.sql), ignore_data=True)
+                        else:
+                            for sql in query_unit.sql:
+                                await self.get_backend().pgcon.simple_query(
+                                    sql, ignore_data=True)
 
                     if query_unit.config_ops:
                         await self.dbview.apply_config_ops(
@@ -775,7 +855,8 @@ cdef class EdgeConnection:
         if self.debug:
             self.debug_print('PARSE', eql)
 
-        with self.timer.timed("Query normalization"):
+        with self.timer.timed("Query normalization"), \
+                tracing.span('normalize'):
             normalized = normalize(eql)
 
         if self.debug:
@@ -783,8 +864,9 @@ cdef class EdgeConnection:
             self.debug_print('Extra variables', normalized.variables(),
                              'after', normalized.first_extra())
 
-        query_unit = self.dbview.lookup_compiled_query(
-            normalized.key(), io_format, expect_one, implicit_limit)
+        with tracing.span('cache_lookup'):
+            query_unit = self.dbview.lookup_compiled_query(
+                normalized.key(), io_format, expect_one, implicit_limit)
         cached = True
         if query_unit is None:
             # Cache miss; need to compile this query.
@@ -800,7 +882,9 @@ cdef class EdgeConnection:
                     # ROLLBACK in that 'eql' string.
                     self.dbview.raise_in_tx_error()
             else:
-                with self.timer.timed("Query compilation"):
+                started_at = time.monotonic()
+                with self.timer.timed("Query compilation"), \
+                        tracing.span('compile'):
                     query_unit = await self._compile(
                         normalized.tokens(),
                         io_format=io_format,
@@ -810,6 +894,8 @@ cdef class EdgeConnection:
                         first_extracted_var=normalized.first_extra(),
                     )
                 query_unit = query_unit[0]
+                self.dbview.query_stats.record_compilation(
+                    normalized.key(), time.monotonic() - started_at)
         elif self.dbview.in_tx_error():
             # We have a cached QueryUnit for this 'eql', but the current
             # transaction is aborted.  We can only complete this Parse
@@ -838,6 +924,8 @@ cdef class EdgeConnection:
             first_extra=normalized.first_extra(),
             extra_count=normalized.extra_count(),
             extra_blob=normalized.extra_blob(),
+            stats_key=normalized.key(),
+            cached=cached,
         )
 
     cdef parse_cardinality(self, bytes card):
@@ -1051,6 +1139,88 @@ cdef class EdgeConnection:
                 'server restart is required for the configuration '
                 'change to take effect')
 
+    async def _execute_explain(self, query_unit, WriteBuffer bind_data):
+        cdef:
+            WriteBuffer buf
+            WriteBuffer msg_buf
+            bytes line
+
+        plan = await self.get_backend().pgcon.explain(
+            query_unit.sql[0], bind_data)
+
+        buf = WriteBuffer.new()
+        for text in explain.render_plan(
+                plan, query_unit.explain_annotations):
+            line = text.encode('utf-8')
+            msg_buf = WriteBuffer.new_message(b'D')
+            msg_buf.write_int16(1)
+            msg_buf.write_int32(len(line))
+            msg_buf.write_bytes(line)
+            buf.write_buffer(msg_buf.end_message())
+        self.write(buf)
+
+    cdef _record_query_stats(self, CompiledQuery compiled, double duration,
+                             bint error):
+        if compiled.stats_key is None:
+            return
+        self.dbview.query_stats.record_execution(
+            compiled.stats_key,
+            duration,
+            rows=self.get_backend().pgcon.last_row_count,
+            cached=compiled.cached,
+            error=error,
+        )
+        # Subsequent executions of the same prepared statement
+        # do not need to compile it.
+        compiled.cached = True
+
+    cdef _maybe_log_slow_query(self, CompiledQuery compiled,
+                               bytes bind_args, WriteBuffer bound_args_buf,
+                               double duration):
+        slow_log = self.port.get_slow_query_log()
+        threshold = self.dbview.lookup_config('slow_query_log_threshold')
+        if not slow_log.is_slow(duration, threshold):
+            return
+        if not slow_log.acquire():
+            return
+
+        query_unit = compiled.query_unit
+        entry = dict(
+            dbname=self.dbview.dbname,
+            query=compiled.stats_key,
+            sql=query_unit.sql,
+            duration=duration,
+            args=slowlog.describe_args(
+                [param.name for param in query_unit.in_type_args or ()],
+                compiled.extra_count,
+                len(bind_args),
+            ),
+        )
+
+        # EXPLAIN ANALYZE executes the query again, so only
+        # capture plans of queries that do not modify data.
+        if (self.dbview.lookup_config('slow_query_log_explain') and
+                query_unit.status == b'SELECT' and
+                len(query_unit.sql) == 1):
+            self.loop.create_task(
+                self._log_slow_query_with_plan(
+                    slow_log, entry, query_unit.sql[0], bound_args_buf))
+        else:
+            slow_log.log(**entry)
+
+    async def _log_slow_query_with_plan(self, slow_log, entry,
+                                        bytes sql, WriteBuffer bind_data):
+        try:
+            pgcon = await self.port.new_pgcon(entry['dbname'])
+            try:
+                plan = await pgcon.explain_analyze(sql, bind_data)
+            finally:
+                pgcon.terminate()
+        except Exception as ex:
+            plan = f'could not capture the query plan: {ex}'
+
+        slow_log.log(plan=plan, **entry)
+
     async def _execute(self, compiled: CompiledQuery, bind_args,
                        bint parse, bint use_prep_stmt):
         query_unit = compiled.query_unit
@@ -1081,19 +1251,30 @@ cdef class EdgeConnection:
             bound_args_buf = self.recode_bind_args(bind_args, compiled)
 
             self.dbview.start(query_unit)
+            # The clock is started once the query is admitted, so that
+            # the time spent waiting in the admission queue is not
+            # reported as part of the execution time.
+            started_at = None
             try:
                 if query_unit.system_config:
+                    started_at = time.monotonic()
                     await self._execute_system_config(query_unit)
+                elif query_unit.explain_annotations is not None:
+                    started_at = time.monotonic()
+                    await self._execute_explain(query_unit, bound_args_buf)
                 else:
-                    await self.get_backend().pgcon.parse_execute(
-                        parse,              # =parse
-                        1,                  # =execute
-                        query_unit,         # =query
-                        self,               # =edgecon
-                        bound_args_buf,     # =bind_data
-                        process_sync,       # =send_sync
-                        use_prep_stmt,      # =use_prep_stmt
-                    )
+                    async with self._admit_execute(query_unit):
+                        started_at = time.monotonic()
+                        with self.timer.timed("Query execution"):
+                            await self.get_backend().pgcon.parse_execute(
+                                parse,              # =parse
+                                1,                  # =execute
+                                query_unit,         # =query
+                                self,               # =edgecon
+                                bound_args_buf,     # =bind_data
+                                process_sync,       # =send_sync
+                                use_prep_stmt,      # =use_prep_stmt
+                            )
                     if query_unit.config_ops:
                         await self.dbview.apply_config_ops(
                             self.get_backend().pgcon,
@@ -1102,6 +1283,9 @@ cdef class EdgeConnection:
                 raise
             except Exception:
                 self.dbview.on_error(query_unit)
+                if started_at is not None:
+                    self._record_query_stats(
+                        compiled, time.monotonic() - started_at, True)
 
                 if not process_sync and self.dbview.in_tx():
                     # An exception occurred while in transaction.
@@ -1121,6 +1305,10 @@ cdef class EdgeConnection:
                     await self.recover_current_tx_info()
                 raise
             else:
+                duration = time.monotonic() - started_at
+                self._record_query_stats(compiled, duration, False)
+                self._maybe_log_slow_query(
+                    compiled, bind_args, bound_args_buf, duration)
                 if self.dbview.on_success(query_unit):
                     await self.get_backend().pgcon.signal_ddl(
                         self.dbview.dbver
@@ -1240,9 +1428,11 @@ cdef class EdgeConnection:
         if not query:
             raise errors.BinaryProtocolError('empty query')
 
-        normalized = normalize(query)
-        query_unit = self.dbview.lookup_compiled_query(
-            normalized.key(), io_format, expect_one, implicit_limit)
+        with tracing.span('normalize'):
+            normalized = normalize(query)
+        with tracing.span('cache_lookup'):
+            query_unit = self.dbview.lookup_compiled_query(
+                normalized.key(), io_format, expect_one, implicit_limit)
         if query_unit is None:
             if self.debug:
                 self.debug_print('OPTIMISTIC EXECUTE /REPARSE', query)
@@ -1257,6 +1447,8 @@ cdef class EdgeConnection:
                 first_extra=normalized.first_extra(),
                 extra_count=normalized.extra_count(),
                 extra_blob=normalized.extra_blob(),
+                stats_key=normalized.key(),
+                cached=True,
             )
 
         if (query_unit.in_type_id != in_tid or
@@ -1304,7 +1496,8 @@ cdef class EdgeConnection:
             bint flush_sync_on_error
 
         try:
-            await self.auth()
+            if not await self.auth():
+                return
         except Exception as ex:
             if self._transport is not None:
                 # If there's no transport it means that the connection
@@ -1342,20 +1535,24 @@ cdef class EdgeConnection:
 
                 try:
                     if mtype == b'P':
-                        await self.parse()
+                        with tracing.trace('edgedb.parse'):
+                            await self.parse()
 
                     elif mtype == b'D':
                         await self.describe()
 
                     elif mtype == b'E':
-                        await self.execute()
+                        with tracing.trace('edgedb.execute'):
+                            await self.execute()
 
                     elif mtype == b'O':
-                        await self.optimistic_execute()
+                        with tracing.trace('edgedb.optimistic_execute'):
+                            await self.optimistic_execute()
 
                     elif mtype == b'Q':
                         flush_sync_on_error = True
-                        await self.simple_query()
+                        with tracing.trace('edgedb.simple_query'):
+                            await self.simple_query()
 
                     elif mtype == b'S':
                         await self.sync()
@@ -1689,6 +1886,10 @@ cdef class EdgeConnection:
         if self.authed:
             self.server.on_client_disconnected()
 
+        if self._cancel_key is not None:
+            self.port.drop_cancel_key(self._cancel_key)
+            self._cancel_key = None
+
         if (self._msg_take_waiter is not None and
                 not self._msg_take_waiter.done()):
             self._msg_take_waiter.set_exception(ConnectionAbortedError())
@@ -1850,8 +2051,10 @@ cdef class EdgeConnection:
                             str(block_num).encode())
                         msg_buf.write_int16(DUMP_HEADER_BLOCK_DATA)
                         msg_buf.write_len_prefixed_buffer(data)
+                        msg_buf.end_message()
 
-                        self._transport.write(msg_buf.end_message())
+                        metrics.dump_bytes.inc(msg_buf.len())
+                        self._transport.write(msg_buf)
                         if self._write_waiter:
                             await self._write_waiter
 
@@ -2010,6 +2213,7 @@ cdef class EdgeConnection:
                             or block_num is None or block_data is None):
                         raise errors.ProtocolError('incomplete data block')
 
+                    metrics.restore_bytes.inc(len(block_data))
                     await pgcon.restore(
                         restore_blocks[block_id], block_data)
 
@@ -2033,56 +2237,3 @@ cdef class EdgeConnection:
         msg.write_len_prefixed_bytes(b'RESTORE')
         self.write(msg.end_message())
         self.flush()
-
-
-@cython.final
-cdef class Timer:
-    def __init__(self) -> None:
-        self._durations: Dict[str, List[float]] = {}
-        self._last_report_timestamp: Dict[str, float] = {}
-        self._threshold_seconds = 300
-
-    @contextlib.contextmanager
-    def timed(self, operation: str):
-        ts_start = time.monotonic()
-        try:
-            yield
-        finally:
-            ts_end = time.monotonic()
-            duration = ts_end - ts_start
-            series = self._durations.setdefault(operation, [])
-            series.append(duration)
-            self.maybe_log_stats(operation, series=series)
-
-    def maybe_log_stats(
-        self, operation: str, *, series: Sequence[float] = ()
-    ) -> None:
-        since_last_report = time.monotonic() - self._last_report_timestamp.get(operation, 0)
-        if since_last_report < self._threshold_seconds:
-            return
-
-        self.log_operation_stats(operation, series=series)
-
-    def log_all_stats(self) -> None:
-        for operation in self._durations:
-            self.log_operation_stats(operation)
-
-    def log_operation_stats(
-        self, operation: str, *, series: Sequence[float] = ()
-    ) -> None:
-        if not series:
-            series = self._durations[operation]
-        if len(series) < 2:
-            return
-
-        p = [0] + statistics.quantiles(series, n=100, method="inclusive")
-        log_metrics.info(
-            "%s stats: count=%d, p99=%.4f; p90=%.4f; p50=%.4f; max=%.4f",
-            operation,
-            len(series),
-            p[99],
-            p[90],
-            p[50],  # median
-            max(series),
-        )
-        self._last_report_timestamp[operation] = time.monotonic()
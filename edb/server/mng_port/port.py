@@ -30,6 +30,9 @@ import weakref
 from edb.common import taskgroup
 from edb.server import baseport
 from edb.server import compiler
+from edb.server import defines
+from edb.server import metrics
+from edb.server import slowlog
 
 from . import edgecon
 
@@ -43,6 +46,7 @@ class Backend:
     def __init__(self, pgcon, compiler):
         self._pgcon = pgcon
         self._compiler = compiler
+        self._new_compiler = None
 
     @property
     def pgcon(self):
@@ -52,8 +56,44 @@ class Backend:
     def compiler(self):
         return self._compiler
 
+    def replace_compiler(
+        self,
+        new_compiler: Callable[[], Awaitable[Any]],
+    ) -> None:
+        # The new compiler is started and warmed up in the background;
+        # see swap_compiler().
+        if self._new_compiler is None:
+            self._new_compiler = asyncio.ensure_future(new_compiler())
+
+    def swap_compiler(self) -> None:
+        # Must only be called when there are no calls to the current
+        # compiler in progress and it holds no transaction state.
+        task = self._new_compiler
+        if task is None or not task.done():
+            return
+        self._new_compiler = None
+
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error('could not start a replacement compiler process',
+                         exc_info=exc)
+            return
+
+        old_compiler = self._compiler
+        self._compiler = task.result()
+        asyncio.ensure_future(old_compiler.close())
+
     async def close(self):
         self._pgcon.terminate()
+        task = self._new_compiler
+        if task is not None:
+            self._new_compiler = None
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None:
+                await task.result().close()
         await self._compiler.close()
 
 
@@ -78,10 +118,18 @@ class ManagementPort(baseport.Port):
         self._accepting = False
         self._max_protocol = max_protocol
 
+        self._slow_query_log = slowlog.SlowQueryLog(
+            rate_limit=defines.SLOW_QUERY_LOG_RATE_LIMIT)
+
+        self._cancel_keys = weakref.WeakValueDictionary()
+
     def new_view(self, *, dbname, user, query_cache):
         return self._dbindex.new_view(
             dbname, user=user, query_cache=query_cache)
 
+    def get_slow_query_log(self):
+        return self._slow_query_log
+
     def get_compiler_worker_cls(self):
         return compiler.Compiler
 
@@ -105,6 +153,21 @@ class ManagementPort(baseport.Port):
         self._backends.add(backend)
         return backend
 
+    def new_cancel_key(self, con) -> bytes:
+        key = os.urandom(32)
+        self._cancel_keys[key] = con
+        return key
+
+    def drop_cancel_key(self, key: bytes) -> None:
+        self._cancel_keys.pop(key, None)
+
+    async def cancel_query(self, key: bytes) -> None:
+        con = self._cancel_keys.get(key)
+        if con is None:
+            logger.debug('received a cancel request with an unknown key')
+            return
+        await con.cancel_query()
+
     def on_client_connected(self) -> str:
         self._edgecon_id += 1
         return str(self._edgecon_id)
@@ -115,10 +178,13 @@ class ManagementPort(baseport.Port):
 
     def on_client_authed(self):
         self._num_connections += 1
+        metrics.current_client_connections.inc()
+        metrics.total_client_connections.inc()
         self._report_connections()
 
     def on_client_disconnected(self):
         self._num_connections -= 1
+        metrics.current_client_connections.dec()
         self._report_connections(action="close")
         if not self._num_connections and self._auto_shutdown:
             self._accepting = False
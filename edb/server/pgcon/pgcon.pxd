@@ -76,6 +76,9 @@ cdef class PGProto:
         readonly int32_t backend_pid
         readonly int32_t backend_secret
 
+        # Number of rows affected by the last executed statement.
+        readonly int64_t last_row_count
+
         stmt_cache.StatementsCache prep_stmts
         list last_parse_prep_stmts
 
@@ -56,6 +56,7 @@ from edb.server.cache cimport stmt_cache
 from edb.server.mng_port cimport edgecon
 
 from edb.common import debug
+from edb.common import tracing
 
 from . import errors as pgerror
 
@@ -130,6 +131,15 @@ async def connect(connargs, dbname):
     return protocol
 
 
+cdef int64_t _parse_row_count(bytes tag):
+    # CommandComplete tags look like "SELECT 5" or "INSERT 0 1";
+    # the row count is always the last word.
+    _, _, count = tag.rpartition(b' ')
+    if count.isdigit():
+        return int(count)
+    return 0
+
+
 @cython.final
 cdef class EdegDBCodecContext(pgproto.CodecContext):
 
@@ -168,6 +178,7 @@ cdef class PGProto:
 
         self.backend_pid = -1
         self.backend_secret = -1
+        self.last_row_count = 0
 
         self.last_parse_prep_stmts = []
         self.debug = debug.flags.server_proto
@@ -217,6 +228,36 @@ cdef class PGProto:
             self.msg_waiter.set_exception(ConnectionAbortedError())
             self.msg_waiter = None
 
+    async def cancel(self):
+        # Send a CancelRequest for the command currently running on
+        # this connection over a separate connection, as the protocol
+        # requires.  Postgres doesn't reply to it; if no command is
+        # running, the request is ignored.
+        cdef WriteBuffer buf
+
+        if self.backend_pid <= 0:
+            return
+
+        host = self.pgaddr.get('host')
+        port = self.pgaddr.get('port')
+
+        if host.startswith('/'):
+            addr = os.path.join(host, f'.s.PGSQL.{port}')
+            _, writer = await asyncio.open_unix_connection(addr)
+        else:
+            _, writer = await asyncio.open_connection(host=host, port=port)
+
+        try:
+            buf = WriteBuffer()
+            buf.write_int32(16)
+            buf.write_int32(80877102)  # cancel request code
+            buf.write_int32(self.backend_pid)
+            buf.write_int32(self.backend_secret)
+            writer.write(buf)
+            await writer.drain()
+        finally:
+            writer.close()
+
     async def signal_ddl(self, dbver):
         query = f"""
             SELECT pg_notify('__edgedb_ddl__', {pg_ql(dbver.hex())})
@@ -513,6 +554,9 @@ cdef class PGProto:
         if not parse and not execute:
             raise RuntimeError('invalid parse/execute call')
 
+        if execute:
+            self.last_row_count = 0
+
         packet = WriteBuffer.new()
 
         if use_prep_stmt:
@@ -614,7 +658,8 @@ cdef class PGProto:
 
                     elif mtype == b'C' and execute:  ## result
                         # CommandComplete
-                        self.buffer.discard_message()
+                        self.last_row_count = _parse_row_count(
+                            self.buffer.read_null_str())
                         if buf is not None:
                             edgecon.write(buf)
                             buf = None
@@ -679,15 +724,116 @@ cdef class PGProto:
     ):
         self.before_command()
         try:
-            return await self._parse_execute(
-                parse,
-                execute,
-                query,
-                edgecon,
-                bind_data,
-                send_sync,
-                use_prep_stmt,
-            )
+            with tracing.span('pgcon.parse_execute',
+                              parse=parse, execute=execute):
+                return await self._parse_execute(
+                    parse,
+                    execute,
+                    query,
+                    edgecon,
+                    bind_data,
+                    send_sync,
+                    use_prep_stmt,
+                )
+        finally:
+            self.after_command()
+
+    async def _explain(self, bytes sql, WriteBuffer bind_data):
+        cdef:
+            WriteBuffer buf
+            WriteBuffer msg_buf
+
+        buf = WriteBuffer.new()
+
+        msg_buf = WriteBuffer.new_message(b'P')
+        msg_buf.write_bytestring(b'')  # statement name
+        msg_buf.write_bytestring(sql)
+        msg_buf.write_int16(0)
+        buf.write_buffer(msg_buf.end_message())
+
+        msg_buf = WriteBuffer.new_message(b'B')
+        msg_buf.write_bytestring(b'')  # portal name
+        msg_buf.write_bytestring(b'')  # statement name
+        msg_buf.write_buffer(bind_data)
+        buf.write_buffer(msg_buf.end_message())
+
+        msg_buf = WriteBuffer.new_message(b'E')
+        msg_buf.write_bytestring(b'')  # portal name
+        msg_buf.write_int32(0)  # return all rows
+        buf.write_buffer(msg_buf.end_message())
+
+        buf.write_bytes(SYNC_MESSAGE)
+
+        self.write(buf)
+        error = None
+        self.waiting_for_sync = True
+        lines = []
+        while True:
+            if not self.buffer.take_message():
+                await self.wait_for_message()
+            mtype = self.buffer.get_message_type()
+
+            try:
+                if mtype == b'D':
+                    # DataRow: a single text column with the plan
+                    # (or a line of it.)
+                    self.buffer.read_int16()
+                    coll = self.buffer.read_int32()
+                    lines.append(
+                        self.buffer.read_bytes(coll).decode('utf-8'))
+
+                elif mtype == b'E':
+                    # ErrorResponse
+                    fields = self.parse_error_message()
+                    error = pgerror.BackendError(fields=fields)
+
+                elif mtype in {b'1', b'C', b'n', b'2', b'I'}:
+                    # ParseComplete
+                    # CommandComplete
+                    # NoData
+                    # BindComplete
+                    # EmptyQueryResponse
+                    self.buffer.discard_message()
+
+                elif mtype == b'Z':
+                    # ReadyForQuery
+                    self.parse_sync_message()
+                    break
+
+                else:
+                    self.fallthrough()
+
+            finally:
+                self.buffer.finish_message()
+
+        if error is not None:
+            raise error
+
+        return '\n'.join(lines)
+
+    async def explain(self, bytes sql, WriteBuffer bind_data):
+        """Run an EXPLAIN statement *sql* and return its output."""
+        self.before_command()
+        try:
+            return await self._explain(sql, bind_data)
+        finally:
+            self.after_command()
+
+    async def explain_analyze(self, bytes sql, WriteBuffer bind_data):
+        """Return the EXPLAIN (ANALYZE, BUFFERS) plan of *sql*.
+
+        The query is executed in a read-only transaction which is
+        rolled back afterwards.
+        """
+        self.before_command()
+        try:
+            await self._simple_query(
+                b'START TRANSACTION READ ONLY', ignore_data=True)
+            try:
+                return await self._explain(
+                    b'EXPLAIN (ANALYZE, BUFFERS) ' + sql, bind_data)
+            finally:
+                await self._simple_query(b'ROLLBACK', ignore_data=True)
         finally:
             self.after_command()
 
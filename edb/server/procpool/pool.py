@@ -29,9 +29,14 @@ import subprocess
 import sys
 import time
 
+import psutil
+
 from edb.common import debug
 from edb.common import supervisor
 from edb.common import taskgroup
+from edb.common import tracing
+
+from edb.server import metrics
 
 from . import amsg
 
@@ -39,6 +44,7 @@ from . import amsg
 BUFFER_POOL_SIZE = 4
 PROCESS_INITIAL_RESPONSE_TIMEOUT = 60.0
 KILL_TIMEOUT = 10.0
+RSS_CHECK_INTERVAL = 30.0
 WORKER_MOD = __name__.rpartition('.')[0] + '.worker'
 
 
@@ -64,6 +70,9 @@ class Worker:
         self._closed = False
         self._sup = None
 
+        self._requests = 0
+        self._rss = 0
+
     async def _kill_proc(self, proc):
         try:
             proc.kill()
@@ -78,11 +87,16 @@ class Worker:
 
     async def _spawn(self):
         self._manager._stats_spawned += 1
+        metrics.total_compiler_processes_spawned.inc(1, self._manager._name)
 
         if self._proc is not None:
             self._manager._sup.create_task(self._kill_proc(self._proc))
             self._proc = None
 
+        # The recycling counters describe the current process.
+        self._requests = 0
+        self._rss = 0
+
         env = _ENV
         if debug.flags.server:
             env = {'EDGEDB_DEBUG_SERVER': '1', **_ENV}
@@ -105,20 +119,46 @@ class Worker:
     def get_pid(self):
         return self._proc.pid
 
+    def needs_recycling(self):
+        """Return True if the worker should be replaced with a new one.
+
+        The owner of the worker is responsible for the replacement,
+        as only it knows when the worker holds no state that would
+        be lost (e.g. that of an open transaction.)
+        """
+        return self._manager._needs_recycling(self)
+
+    def _update_rss(self):
+        try:
+            self._rss = psutil.Process(self._proc.pid).memory_info().rss
+        except psutil.Error:
+            pass
+
     async def call(self, method_name, *args):
         assert not self._closed
 
         if self._con.is_closed():
             await self._spawn()
 
-        msg = pickle.dumps((method_name, args))
-        data = await self._con.request(msg)
-        status, *data = pickle.loads(data)
+        self._requests += 1
+        with tracing.span('compiler.call', method=method_name):
+            # Spans recorded by the worker become children of
+            # "compiler.call".
+            trace_ctx = tracing.get_context()
+            with tracing.span('compiler.pickle'):
+                msg = pickle.dumps((method_name, args, trace_ctx))
+            with tracing.span('compiler.request'):
+                data = await self._con.request(msg)
+            with tracing.span('compiler.unpickle'):
+                status, *data = pickle.loads(data)
 
         self._last_used = time.monotonic()
 
         if status == 0:
-            return data[0]
+            res, spans = data
+            if spans:
+                tracing.add_remote_spans(spans)
+            return res
         elif status == 1:
             exc, tb = data
             exc.__formatted_error__ = tb
@@ -134,6 +174,7 @@ class Worker:
             return
         self._closed = True
         self._manager._stats_killed += 1
+        metrics.total_compiler_processes_killed.inc(1, self._manager._name)
         self._manager._workers.discard(self)
         self._manager._report_workers(self, action="kill")
         try:
@@ -146,7 +187,8 @@ class Worker:
 class Manager:
 
     def __init__(self, *, worker_cls, worker_args,
-                 loop, name, runstate_dir, pool_size=BUFFER_POOL_SIZE):
+                 loop, name, runstate_dir, pool_size=BUFFER_POOL_SIZE,
+                 max_worker_requests=0, max_worker_rss=0):
 
         self._worker_cls = worker_cls
         self._worker_args = worker_args
@@ -160,6 +202,8 @@ class Manager:
             self._runstate_dir, f'{name}.socket')
 
         self._pool_size = pool_size
+        self._max_worker_requests = max_worker_requests
+        self._max_worker_rss = max_worker_rss
         self._workers_pool = collections.deque()
         self._workers = set()
 
@@ -171,6 +215,7 @@ class Manager:
         self._stats_killed = 0
 
         self._sup = None
+        self._rss_monitor = None
 
         self._worker_command_args = [
             sys.executable, '-m', WORKER_MOD,
@@ -188,6 +233,21 @@ class Manager:
     def is_running(self):
         return self._running
 
+    def _needs_recycling(self, worker):
+        return bool(
+            (self._max_worker_requests
+                and worker._requests >= self._max_worker_requests)
+            or (self._max_worker_rss
+                and worker._rss >= self._max_worker_rss)
+        )
+
+    async def _monitor_rss(self):
+        while True:
+            await asyncio.sleep(RSS_CHECK_INTERVAL)
+            for worker in self.iter_workers():
+                if not worker._closed:
+                    worker._update_rss()
+
     async def _spawn_worker(self, *, report: bool = True):
         worker = Worker(self, self._server, self._worker_command_args)
         await worker._spawn()
@@ -227,6 +287,9 @@ class Manager:
         await self._server.start()
         self._running = True
 
+        if self._max_worker_rss:
+            self._rss_monitor = self._loop.create_task(self._monitor_rss())
+
         if self._pool_size:
             async with taskgroup.TaskGroup(name='manager-start') as g:
                 for _ in range(self._pool_size):
@@ -236,6 +299,10 @@ class Manager:
         if not self._running:
             return
 
+        if self._rss_monitor is not None:
+            self._rss_monitor.cancel()
+            self._rss_monitor = None
+
         await self._sup.wait()
 
         await self._server.stop()
@@ -256,6 +323,8 @@ class Manager:
         if not action.endswith("e"):
             action += "e"
         action += "d"
+        metrics.current_compiler_processes.set(
+            len(self._workers) + len(self._workers_pool), self._name)
         log_metrics.info(
             "%s a %s worker with PID %d; used=%d; pool=%d;"
             + " spawned=%d; killed=%d",
@@ -271,7 +340,9 @@ class Manager:
 
 async def create_manager(*, runstate_dir: str, name: str,
                          worker_cls: type, worker_args: dict,
-                         pool_size: int) -> Manager:
+                         pool_size: int,
+                         max_worker_requests: int = 0,
+                         max_worker_rss: int = 0) -> Manager:
 
     loop = asyncio.get_running_loop()
     pool = Manager(
@@ -280,7 +351,9 @@ async def create_manager(*, runstate_dir: str, name: str,
         worker_cls=worker_cls,
         worker_args=worker_args,
         name=name,
-        pool_size=pool_size)
+        pool_size=pool_size,
+        max_worker_requests=max_worker_requests,
+        max_worker_rss=max_worker_rss)
 
     await pool.start()
     return pool
@@ -33,6 +33,7 @@ import uvloop
 from edb.common import debug
 from edb.common import devmode
 from edb.common import markup
+from edb.common import tracing
 
 from . import amsg
 
@@ -59,7 +60,7 @@ async def worker(cls, cls_args, sockname):
                 os._exit(0)
 
             try:
-                methname, args = pickle.loads(req)
+                methname, args, trace_ctx = pickle.loads(req)
                 meth = getattr(worker, methname)
             except Exception as ex:
                 prepare_exception(ex)
@@ -72,8 +73,9 @@ async def worker(cls, cls_args, sockname):
                 )
             else:
                 try:
-                    res = await meth(*args)
-                    data = (0, res)
+                    with tracing.collect(trace_ctx) as collected:
+                        res = await meth(*args)
+                    data = (0, res, collected.spans)
                 except Exception as ex:
                     prepare_exception(ex)
                     if debug.flags.server:
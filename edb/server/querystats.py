@@ -0,0 +1,125 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import collections
+
+
+class QueryStatsEntry:
+
+    __slots__ = ('query', 'calls', 'errors', 'cache_hits', 'rows',
+                 'total_exec_time', 'max_exec_time',
+                 'compilations', 'total_compile_time')
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.rows = 0
+        self.total_exec_time = 0.0
+        self.max_exec_time = 0.0
+        self.compilations = 0
+        self.total_compile_time = 0.0
+
+    @property
+    def mean_exec_time(self) -> float:
+        return self.total_exec_time / self.calls if self.calls else 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cache_hits / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'query': self.query,
+            'calls': self.calls,
+            'errors': self.errors,
+            'rows': self.rows,
+            'total_exec_time': self.total_exec_time,
+            'mean_exec_time': self.mean_exec_time,
+            'max_exec_time': self.max_exec_time,
+            'compilations': self.compilations,
+            'total_compile_time': self.total_compile_time,
+            'cache_hit_ratio': self.cache_hit_ratio,
+        }
+
+
+class QueryStats:
+    """Per-query execution statistics of a database.
+
+    Statistics are aggregated by the normalized query text produced
+    by the tokenizer (the same key the compiled query cache uses).
+    The number of tracked queries is bounded; the least recently
+    executed queries are dropped first.
+    """
+
+    def __init__(self, *, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: collections.OrderedDict[str, QueryStatsEntry] = (
+            collections.OrderedDict())
+
+    def _get_entry(self, query: str) -> QueryStatsEntry:
+        entry = self._entries.get(query)
+        if entry is None:
+            entry = self._entries[query] = QueryStatsEntry(query)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(query, last=True)
+        return entry
+
+    def record_compilation(self, query: str, duration: float) -> None:
+        entry = self._get_entry(query)
+        entry.compilations += 1
+        entry.total_compile_time += duration
+
+    def record_execution(
+        self,
+        query: str,
+        duration: float,
+        *,
+        rows: int,
+        cached: bool,
+        error: bool,
+    ) -> None:
+        entry = self._get_entry(query)
+        entry.calls += 1
+        entry.total_exec_time += duration
+        if duration > entry.max_exec_time:
+            entry.max_exec_time = duration
+        if cached:
+            entry.cache_hits += 1
+        if error:
+            entry.errors += 1
+        else:
+            entry.rows += rows
+
+    def reset(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        entries = list(self._entries.values())
+        entries.sort(key=lambda e: e.total_exec_time, reverse=True)
+        return [e.as_dict() for e in entries]
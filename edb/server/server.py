@@ -34,12 +34,15 @@ from edb.server import compiler as edbcompiler
 from edb.server import defines
 from edb.server import http_edgeql_port
 from edb.server import http_graphql_port
+from edb.server import metrics_port
 from edb.server import notebook_port
 from edb.server import mng_port
 from edb.server import pgcon
 
+from . import admission
 from . import baseport
 from . import dbview
+from . import stdcache
 
 
 logger = logging.getLogger('edb.server')
@@ -56,7 +59,12 @@ class Server:
                  nethost, netport,
                  auto_shutdown: bool=False,
                  echo_runtime_info: bool = False,
-                 max_protocol: Tuple[int, int]):
+                 max_protocol: Tuple[int, int],
+                 admission_limits: Optional[
+                     Mapping[str, Tuple[int, int]]] = None,
+                 admission_timeout: float = defines.ADMISSION_TIMEOUT,
+                 compiler_max_requests: int = 0,
+                 compiler_max_rss: int = 0):
 
         self._loop = loop
 
@@ -87,8 +95,22 @@ class Server:
 
         self._echo_runtime_info = echo_runtime_info
 
+        self._admission = admission.AdmissionController(
+            limits=admission_limits or {},
+            timeout=admission_timeout,
+        )
+
+        self._std_cache_dir = None
+
+        self._compiler_max_requests = compiler_max_requests
+        self._compiler_max_rss = compiler_max_rss
+
     async def init(self):
-        self._dbindex = await dbview.DatabaseIndex.init(self)
+        async with taskgroup.TaskGroup() as g:
+            dbindex = g.create_task(dbview.DatabaseIndex.init(self))
+            g.create_task(self._materialize_std_cache())
+
+        self._dbindex = dbindex.result()
         self._populate_sys_auth()
 
         cfg = self._dbindex.get_sys_config()
@@ -112,9 +134,36 @@ class Server:
             self._dbindex.get_sys_config().get('auth', ()),
             key=lambda a: a.priority))
 
+    async def _materialize_std_cache(self):
+        cache_dir = stdcache.get_cache_dir(self._internal_runstate_dir)
+        conn = await self.new_pgcon(defines.EDGEDB_SUPERUSER_DB)
+        try:
+            await stdcache.materialize(conn, cache_dir)
+        except OSError as e:
+            # Compilers will load the data from the backend instead.
+            logger.warning(
+                'could not write the std data cache to %s: %s',
+                cache_dir, e)
+        else:
+            self._std_cache_dir = str(cache_dir)
+        finally:
+            conn.terminate()
+
+    def get_std_cache_dir(self) -> Optional[str]:
+        return self._std_cache_dir
+
     def _get_pgaddr(self):
         return self._cluster.get_connection_spec()
 
+    def get_admission_controller(self):
+        return self._admission
+
+    def get_compiler_worker_limits(self):
+        return {
+            'max_worker_requests': self._compiler_max_requests,
+            'max_worker_rss': self._compiler_max_rss,
+        }
+
     async def new_pgcon(self, dbname):
         return await pgcon.connect(self._get_pgaddr(), dbname)
 
@@ -169,7 +218,7 @@ class Server:
             self._mgmt_port = new_mgmt_port
 
     async def _start_portconf(self, portconf: config.ConfigType, *,
-                              suppress_errors=False):
+                              suppress_errors=False, lazy=False):
         if portconf in self._sys_conf_ports:
             logging.info('port for config %r has been already started',
                          portconf)
@@ -181,6 +230,8 @@ class Server:
             port_cls = http_edgeql_port.HttpEdgeQLPort
         elif portconf.protocol == 'notebook':
             port_cls = notebook_port.NotebookPort
+        elif portconf.protocol == 'metrics+http':
+            port_cls = metrics_port.MetricsPort
         else:
             raise errors.InvalidReferenceError(
                 f'unknown protocol {portconf.protocol!r}')
@@ -192,7 +243,9 @@ class Server:
             database=portconf.database,
             user=portconf.user,
             protocol=portconf.protocol,
-            concurrency=portconf.concurrency)
+            concurrency=portconf.concurrency,
+            min_concurrency=portconf.min_concurrency,
+            lazy=lazy)
 
         try:
             await port.start()
@@ -285,15 +338,18 @@ class Server:
         # it to restore config values.
         ql_parser.preload()
 
+        sys_config = self._dbindex.get_sys_config()
+
         async with taskgroup.TaskGroup() as g:
             g.create_task(self._mgmt_port.start())
             for port in self._ports:
                 g.create_task(port.start())
-
-        sys_config = self._dbindex.get_sys_config()
-        if 'ports' in sys_config:
-            for portconf in sys_config['ports']:
-                await self._start_portconf(portconf, suppress_errors=True)
+            # Ports restored from the system config fill their
+            # compiler and connection pools on first request
+            # to keep restarts fast.
+            for portconf in sys_config.get('ports', ()):
+                g.create_task(self._start_portconf(
+                    portconf, suppress_errors=True, lazy=True))
 
         self._serving = True
 
@@ -317,6 +373,8 @@ class Server:
             g.create_task(self._mgmt_port.stop())
             self._mgmt_port = None
 
+        self._dbindex.log_stats()
+
     async def get_auth_method(self, user, conn):
         authlist = self._sys_auth
 
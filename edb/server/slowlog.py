@@ -0,0 +1,111 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import logging
+import time
+
+
+logger = logging.getLogger('edb.server.slowlog')
+
+
+class SlowQueryLog:
+    """Log queries that took longer than a configured threshold.
+
+    At most *rate_limit* queries are logged (and have their plans
+    captured) per *interval* seconds; the number of queries that were
+    suppressed by the limit is reported with the next logged entry.
+    """
+
+    def __init__(self, *, rate_limit: int, interval: float = 60.0) -> None:
+        if rate_limit <= 0:
+            raise ValueError('rate_limit is expected to be greater than 0')
+        self._rate_limit = rate_limit
+        self._interval = interval
+        self._window_start = 0.0
+        self._window_count = 0
+        self._suppressed = 0
+
+    def is_slow(self, duration: float, threshold_ms: Optional[int]) -> bool:
+        return (
+            threshold_ms is not None
+            and threshold_ms >= 0
+            and duration * 1000 >= threshold_ms
+        )
+
+    def acquire(self) -> bool:
+        now = time.monotonic()
+        if now - self._window_start >= self._interval:
+            self._window_start = now
+            self._window_count = 0
+
+        if self._window_count >= self._rate_limit:
+            self._suppressed += 1
+            return False
+
+        self._window_count += 1
+        return True
+
+    def log(
+        self,
+        *,
+        dbname: str,
+        query: str,
+        sql: Sequence[bytes],
+        duration: float,
+        args: str,
+        plan: Optional[str] = None,
+    ) -> None:
+        suppressed = self._suppressed
+        self._suppressed = 0
+
+        msg = [
+            f'slow query in database {dbname!r}: '
+            f'duration={duration * 1000:.3f}ms',
+        ]
+        if suppressed:
+            msg.append(
+                f'({suppressed} more slow queries were not logged '
+                f'due to the rate limit)')
+        msg.append(f'EdgeQL: {query}')
+        msg.append(f'Arguments: {args}')
+        for stmt in sql:
+            msg.append(f'SQL: {stmt.decode("utf-8", "replace")}')
+        if plan is not None:
+            msg.append(f'Plan:\n{plan}')
+
+        logger.warning('\n'.join(msg))
+
+
+def describe_args(
+    param_names: Sequence[str],
+    extra_count: int,
+    args_size: int,
+) -> str:
+    """Describe the shape of query arguments without their values."""
+    parts = []
+    if param_names:
+        parts.append(', '.join(f'${name}' for name in param_names))
+    if extra_count:
+        parts.append(f'{extra_count} extracted constants')
+    if not parts:
+        return 'none'
+    return f'{"; ".join(parts)} ({args_size} bytes)'
@@ -0,0 +1,110 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Server startup profiling.
+
+Enabled with the ``EDGEDB_DEBUG_STARTUP_PROFILE`` debug flag.  The
+server wraps each startup phase in :func:`phase` and, once it is ready
+to accept connections, logs the time spent in every phase along with
+the cost of importing the heaviest subsystems.
+"""
+
+
+from __future__ import annotations
+from typing import *
+
+import contextlib
+import importlib
+import logging
+import sys
+import time
+
+from edb.common import debug
+
+
+logger = logging.getLogger('edb.server')
+
+
+# Imported in dependency order, so that every entry is only charged
+# with the modules it pulls in on top of the previous ones.
+HEAVY_IMPORTS = (
+    'edb.edgeql.parser',
+    'edb.schema.schema',
+    'edb.ir.ast',
+    'edb.edgeql.compiler',
+    'edb.pgsql.compiler',
+    'edb.server.compiler',
+    'edb.server.server',
+)
+
+
+class StartupProfile:
+
+    def __init__(self) -> None:
+        self._started_at = time.monotonic()
+        self._entries: List[Tuple[str, str, float]] = []
+
+    @property
+    def entries(self) -> List[Tuple[str, str, float]]:
+        return list(self._entries)
+
+    def record(self, kind: str, name: str, duration: float) -> None:
+        self._entries.append((kind, name, duration))
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record('phase', name, time.monotonic() - started)
+
+    def import_modules(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name in sys.modules:
+                continue
+            started = time.monotonic()
+            importlib.import_module(name)
+            self.record('import', name, time.monotonic() - started)
+
+    def format(self) -> str:
+        total = time.monotonic() - self._started_at
+        lines = [f'startup profile (total {total:.3f}s):']
+        for kind, name, duration in self._entries:
+            lines.append(f'  {kind:<6} {name:<40} {duration:8.3f}s')
+        return '\n'.join(lines)
+
+
+_profile = StartupProfile()
+
+
+def phase(name: str) -> ContextManager[None]:
+    if not debug.flags.startup_profile:
+        return contextlib.nullcontext()
+    return _profile.phase(name)
+
+
+def profile_imports() -> None:
+    if debug.flags.startup_profile:
+        _profile.import_modules(HEAVY_IMPORTS)
+
+
+def report() -> None:
+    if debug.flags.startup_profile:
+        logger.info('%s', _profile.format())
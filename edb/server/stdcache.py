@@ -0,0 +1,118 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Local cache of the standard library data stored in the backend.
+
+Every compiler worker needs the pickled std schema, reflection schema
+and class layout, which bootstrap stores in the instance data functions
+of the backend.  Instead of having each worker fetch multiple megabytes
+of pickles over a Postgres connection, the server materializes them once
+into the internal runstate directory and workers map the files into
+memory.  The cache directory is keyed by the catalog version, so data
+from an incompatible server is never picked up.
+"""
+
+
+from __future__ import annotations
+from typing import *
+
+import json
+import mmap
+import os
+import pathlib
+import pickle
+import tempfile
+
+from edb.server import defines
+
+
+PICKLE_KEYS = ('stdschema', 'reflschema', 'classlayout')
+JSON_KEYS = ('introquery',)
+
+
+def get_cache_dir(internal_runstate_dir: os.PathLike) -> pathlib.Path:
+    return (pathlib.Path(internal_runstate_dir) /
+            f'stdcache-{defines.EDGEDB_CATALOG_VERSION}')
+
+
+def _get_path(cache_dir: os.PathLike, key: str) -> pathlib.Path:
+    return pathlib.Path(cache_dir) / key
+
+
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}-')
+    try:
+        with open(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+async def materialize(conn, cache_dir: os.PathLike) -> None:
+    """Copy the std data from the backend into *cache_dir*.
+
+    *conn* is a pgcon connection.  Entries that are already present
+    are left untouched.
+    """
+    cache_dir = pathlib.Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    for key in PICKLE_KEYS + JSON_KEYS:
+        path = _get_path(cache_dir, key)
+        if path.exists():
+            continue
+
+        result = await conn.simple_query(
+            f'SELECT edgedbinstdata.__syscache_{key}()'.encode(),
+            ignore_data=False,
+        )
+        data = result[0][0]
+        if key in PICKLE_KEYS:
+            # bytea values arrive in the hex text format: \x0123...
+            data = bytes.fromhex(data[2:].decode('ascii'))
+
+        _write_atomic(path, data)
+
+
+def load(cache_dir: Optional[os.PathLike], key: str) -> Optional[Any]:
+    """Load the cached std data entry *key*.
+
+    Return None if there is no cache or the entry is missing, in which
+    case the caller is expected to fetch the data from the backend.
+    """
+    if cache_dir is None:
+        return None
+
+    path = _get_path(cache_dir, key)
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+
+    with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        try:
+            if key in JSON_KEYS:
+                return json.loads(buf[:])
+            else:
+                return pickle.loads(buf)
+        except Exception as e:
+            raise RuntimeError(
+                f'could not load cached std data {str(path)!r}') from e
@@ -0,0 +1,104 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import contextlib
+import logging
+import time
+
+from edb.common import histogram
+from edb.server import metrics
+
+
+log_metrics = logging.getLogger('edb.server.metrics')
+
+# Operations that are also exported as server-wide metrics.
+_OPERATION_METRICS = {
+    'Query compilation': metrics.query_compilation_duration,
+    'Query execution': metrics.query_execution_duration,
+}
+
+
+class Timer:
+    """Latency statistics of server operations.
+
+    A single Timer is shared by all connections to a database; every
+    operation is tracked in a fixed-size LogHistogram, so the memory
+    used by a Timer does not grow with the number of measurements.
+    """
+
+    def __init__(self, name: str, *, threshold_seconds: int = 300) -> None:
+        self._name = name
+        self._histograms: Dict[str, histogram.LogHistogram] = {}
+        self._last_report_timestamp: Dict[str, float] = {}
+        self._threshold_seconds = threshold_seconds
+
+    @contextlib.contextmanager
+    def timed(self, operation: str) -> Iterator[None]:
+        ts_start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(operation, time.monotonic() - ts_start)
+
+    def record(self, operation: str, duration: float) -> None:
+        hist = self._histograms.get(operation)
+        if hist is None:
+            hist = self._histograms[operation] = histogram.LogHistogram()
+        hist.record(duration)
+
+        metric = _OPERATION_METRICS.get(operation)
+        if metric is not None:
+            metric.observe(duration)
+
+        self.maybe_log_stats(operation)
+
+    def maybe_log_stats(self, operation: str) -> None:
+        since_last_report = (
+            time.monotonic() - self._last_report_timestamp.get(operation, 0)
+        )
+        if since_last_report < self._threshold_seconds:
+            return
+
+        self.log_operation_stats(operation)
+
+    def log_all_stats(self) -> None:
+        for operation in self._histograms:
+            self.log_operation_stats(operation)
+
+    def log_operation_stats(self, operation: str) -> None:
+        hist = self._histograms[operation]
+        if hist.count < 2:
+            return
+
+        p50, p90, p99 = hist.quantiles((0.5, 0.9, 0.99))
+        log_metrics.info(
+            "%s stats for %r: count=%d, p99=%.4f; p90=%.4f; p50=%.4f; "
+            "max=%.4f",
+            operation,
+            self._name,
+            hist.count,
+            p99,
+            p90,
+            p50,  # median
+            hist.max,
+        )
+        self._last_report_timestamp[operation] = time.monotonic()
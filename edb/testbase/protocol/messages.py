@@ -825,6 +825,13 @@ class Terminate(ClientMessage):
     message_length = MessageLength
 
 
+class CancelRequest(ClientMessage):
+
+    mtype = MessageType('c')
+    message_length = MessageLength
+    key = FixedArrayOf(32, UInt8(), 'Key data from ServerKeyData.')
+
+
 class AuthenticationSASLInitialResponse(ClientMessage):
 
     mtype = MessageType('p')
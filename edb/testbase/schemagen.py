@@ -0,0 +1,130 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Generator of synthetic large schemas."""
+
+
+from __future__ import annotations
+from typing import *
+
+import random
+
+
+SCALARS = ('str', 'int64', 'float64', 'bool', 'datetime', 'decimal')
+
+
+def generate_schema(
+    num_types: int,
+    *,
+    seed: int = 0,
+    migrated: bool = False,
+) -> str:
+    """Generate SDL of a module with *num_types* object types.
+
+    About a tenth of the types are abstract and the rest extend them.
+    Every concrete type has a few properties, an exclusive constraint,
+    links to the types defined before it and occasionally an index
+    and a computable.  Custom constrained scalars are sprinkled in as
+    well.
+
+    The generated text only depends on the arguments.  If *migrated*
+    is true, the schema additionally has a new property on one of the
+    types and a new type, which is what a typical migration of a large
+    schema looks like.
+    """
+    rng = random.Random(seed)
+
+    num_abstract = max(1, num_types // 10)
+    num_concrete = max(1, num_types - num_abstract)
+    num_scalars = max(1, num_types // 50)
+
+    scalars = list(SCALARS)
+    decls = []
+
+    for i in range(num_scalars):
+        decls.append(
+            f'scalar type Scalar{i} extending str {{\n'
+            f'    constraint max_len_value({rng.randint(10, 1000)});\n'
+            f'}}'
+        )
+        scalars.append(f'Scalar{i}')
+
+    for i in range(num_abstract):
+        decls.append(
+            f'abstract type Base{i} {{\n'
+            f'    property base{i}_value -> {rng.choice(scalars)};\n'
+            f'    property base{i}_flag -> bool {{\n'
+            f'        default := false;\n'
+            f'    }}\n'
+            f'}}'
+        )
+
+    for i in range(num_concrete):
+        bases = sorted({
+            f'Base{rng.randrange(num_abstract)}'
+            for _ in range(rng.randint(1, 2))
+        })
+
+        body = [
+            f'required property name -> str {{\n'
+            f'    constraint exclusive;\n'
+            f'}}',
+        ]
+
+        for j in range(rng.randint(1, 4)):
+            body.append(f'property p{j} -> {rng.choice(scalars)};')
+
+        if i > 0:
+            target = f'Type{rng.randrange(i)}'
+            body.append(f'link single_link -> {target};')
+
+            target = f'Type{rng.randrange(i)}'
+            body.append(
+                f'multi link multi_link -> {target} {{\n'
+                f'    property weight -> int64;\n'
+                f'}}'
+            )
+
+        if rng.random() < 0.2:
+            body.append('index on (.name);')
+
+        if rng.random() < 0.2:
+            body.append('property name_len := len(.name);')
+
+        if migrated and i == 0:
+            body.append('property added -> str;')
+
+        decls.append(
+            f'type Type{i} extending {", ".join(bases)} {{\n'
+            + _indent('\n'.join(body)) +
+            f'\n}}'
+        )
+
+    if migrated:
+        decls.append(
+            f'type Added extending Base0 {{\n'
+            f'    link target -> Type{num_concrete - 1};\n'
+            f'}}'
+        )
+
+    return '\n\n'.join(decls) + '\n'
+
+
+def _indent(text: str) -> str:
+    return '\n'.join(f'    {line}' for line in text.split('\n'))
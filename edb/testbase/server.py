@@ -26,6 +26,7 @@ import collections
 import contextlib
 import decimal
 import functools
+import hashlib
 import inspect
 import json
 import math
@@ -686,16 +687,21 @@ class DatabaseTestCase(ClusterTestCase, ConnectedTestCaseMixin):
 
         # Only open an extra admin connection if necessary.
         if not class_set_up:
-            script = f'CREATE DATABASE {dbname};'
             cls.admin_conn = cls.loop.run_until_complete(cls.connect())
-            cls.loop.run_until_complete(cls.admin_conn.execute(script))
 
-        cls.con = cls.loop.run_until_complete(cls.connect(database=dbname))
-
-        if not class_set_up:
             script = cls.get_setup_script()
             if script:
-                cls.loop.run_until_complete(cls.con.execute(script))
+                conn_args = cls.cluster.get_connect_args()
+                tplname = get_setup_template_name(script)
+                cls.loop.run_until_complete(
+                    _setup_template_database(tplname, script, conn_args))
+                cls.loop.run_until_complete(
+                    _setup_database(dbname, script, conn_args))
+            else:
+                script = f'CREATE DATABASE {dbname};'
+                cls.loop.run_until_complete(cls.admin_conn.execute(script))
+
+        cls.con = cls.loop.run_until_complete(cls.connect(database=dbname))
 
     @classmethod
     def get_database_name(cls):
@@ -879,61 +885,145 @@ def get_test_cases_setup(cases):
 def setup_test_cases(cases, conn, num_jobs, verbose=False):
     setup = get_test_cases_setup(cases)
 
+    # Test cases with identical setup scripts share a template
+    # database, which is populated once and then cloned.
+    templates = {}
+    for _case, _dbname, setup_script in setup:
+        templates.setdefault(
+            get_setup_template_name(setup_script), setup_script)
+
     async def _run():
         if num_jobs == 1:
             # Special case for --jobs=1
+            for tplname, setup_script in templates.items():
+                await _setup_template_database(tplname, setup_script, conn)
             for _case, dbname, setup_script in setup:
                 await _setup_database(dbname, setup_script, conn)
                 if verbose:
                     print(f' -> {dbname}: OK', flush=True)
         else:
-            async with taskgroup.TaskGroup(name='setup test cases') as g:
-                # Use a semaphore to limit the concurrency of bootstrap
-                # tasks to the number of jobs (bootstrap is heavy, having
-                # more tasks than `--jobs` won't necessarily make
-                # things faster.)
-                sem = asyncio.BoundedSemaphore(num_jobs)
-
-                async def controller(coro, dbname, *args):
-                    async with sem:
-                        await coro(dbname, *args)
-                        if verbose:
-                            print(f' -> {dbname}: OK', flush=True)
+            # Use a semaphore to limit the concurrency of bootstrap
+            # tasks to the number of jobs (bootstrap is heavy, having
+            # more tasks than `--jobs` won't necessarily make
+            # things faster.)
+            sem = asyncio.BoundedSemaphore(num_jobs)
+
+            async def controller(coro, dbname, *args, verbose=False):
+                async with sem:
+                    await coro(dbname, *args)
+                    if verbose:
+                        print(f' -> {dbname}: OK', flush=True)
+
+            async with taskgroup.TaskGroup(name='setup templates') as g:
+                for tplname, setup_script in templates.items():
+                    g.create_task(controller(
+                        _setup_template_database,
+                        tplname, setup_script, conn))
 
+            async with taskgroup.TaskGroup(name='setup test cases') as g:
                 for _case, dbname, setup_script in setup:
                     g.create_task(controller(
-                        _setup_database, dbname, setup_script, conn))
+                        _setup_database, dbname, setup_script, conn,
+                        verbose=verbose))
 
     return asyncio.run(_run())
 
 
-async def _setup_database(dbname, setup_script, conn_args):
+def get_setup_template_name(setup_script):
+    # The catalog version is a part of the name, so that templates
+    # left by an older server in a reused data directory are ignored.
+    h = hashlib.sha1(setup_script.encode())
+    return f'tpl_{edgedb_defines.EDGEDB_CATALOG_VERSION}_{h.hexdigest()[:20]}'
+
+
+def _get_setup_connect_args(conn_args):
     default_args = {
         'user': edgedb_defines.EDGEDB_SUPERUSER,
         'password': 'test',
     }
 
     default_args.update(conn_args)
+    return default_args
+
+
+async def _execute_on_idle_database(admin_conn, script):
+    # Postgres refuses to clone or drop a database that still has
+    # connections, and the server closes its backend connections
+    # asynchronously after the client disconnects.
+    for _ in range(20):
+        try:
+            return await admin_conn.execute(script)
+        except edgedb.EdgeDBError as ex:
+            if 'is being accessed by other users' not in str(ex):
+                raise
+        await asyncio.sleep(0.25)
+
+    return await admin_conn.execute(script)
+
+
+async def _setup_template_database(tplname, setup_script, conn_args):
+    default_args = _get_setup_connect_args(conn_args)
+    # The setup is done in a scratch database which is only cloned
+    # into the template once it has succeeded, so an interrupted
+    # setup never leaves a broken template behind.
+    scratch = f'{tplname}_new'
 
     admin_conn = await edgedb.async_connect(
         database=edgedb_defines.EDGEDB_SUPERUSER_DB,
         **default_args)
 
     try:
-        await admin_conn.execute(f'CREATE DATABASE {dbname};')
+        existing = await admin_conn.fetchall(
+            'SELECT sys::Database.name FILTER sys::Database.name IN '
+            '{<str>$0, <str>$1}',
+            tplname, scratch)
+
+        if tplname in existing:
+            return
+
+        if scratch in existing:
+            await _execute_on_idle_database(
+                admin_conn, f'DROP DATABASE {scratch};')
+
+        await admin_conn.execute(f'CREATE DATABASE {scratch};')
+
+        dbconn = await edgedb.async_connect(database=scratch, **default_args)
+        try:
+            async with dbconn.transaction():
+                await dbconn.execute(setup_script)
+        except Exception as ex:
+            raise RuntimeError(
+                f'exception during initialization of {tplname!r} '
+                f'template DB: {ex}'
+            ) from ex
+        finally:
+            await dbconn.aclose()
+
+        await _execute_on_idle_database(
+            admin_conn,
+            f"CREATE DATABASE {tplname} {{ SET template := '{scratch}' }};")
+        await _execute_on_idle_database(
+            admin_conn, f'DROP DATABASE {scratch};')
     finally:
         await admin_conn.aclose()
 
-    dbconn = await edgedb.async_connect(database=dbname, **default_args)
+    return tplname
+
+
+async def _setup_database(dbname, setup_script, conn_args):
+    default_args = _get_setup_connect_args(conn_args)
+    tplname = get_setup_template_name(setup_script)
+
+    admin_conn = await edgedb.async_connect(
+        database=edgedb_defines.EDGEDB_SUPERUSER_DB,
+        **default_args)
+
     try:
-        async with dbconn.transaction():
-            await dbconn.execute(setup_script)
-    except Exception as ex:
-        raise RuntimeError(
-            f'exception during initialization of {dbname!r} test DB: {ex}'
-        ) from ex
+        await _execute_on_idle_database(
+            admin_conn,
+            f"CREATE DATABASE {dbname} {{ SET template := '{tplname}' }};")
     finally:
-        await dbconn.aclose()
+        await admin_conn.aclose()
 
     return dbname
 
@@ -0,0 +1,233 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+from typing import *
+
+import json
+import math
+import platform
+import re
+import statistics
+import sys
+import timeit
+
+import click
+
+from edb.server import buildmeta
+from edb.tools.edb import edbcommands
+
+from . import benchmarks
+
+
+TRACKS = ('compiler', 'scaling')
+
+
+def _parse_sizes(ctx, param, value) -> List[int]:
+    try:
+        sizes = sorted({int(v) for v in value.split(',')})
+    except ValueError:
+        raise click.BadParameter(
+            f'expected a comma separated list of numbers: {value!r}'
+        ) from None
+    if not sizes or sizes[0] < 1:
+        raise click.BadParameter('sizes must be positive')
+    return sizes
+
+
+@edbcommands.command()
+@click.option('-t', '--track', type=click.Choice(TRACKS), multiple=True,
+              help='benchmark track to run, can be specified multiple '
+                   'times (defaults to "compiler")')
+@click.option('--sizes', type=str, callback=_parse_sizes,
+              default='100,1000,10000',
+              help='comma separated numbers of object types of the '
+                   'generated schemas used by the "scaling" track')
+@click.option('-k', '--include', type=str, multiple=True, metavar='REGEXP',
+              help='only run benchmarks which match the given regular '
+                   'expression (matched against "benchmark/case")')
+@click.option('-n', '--number', type=int, default=0,
+              help='number of executions per timing run '
+                   '(determined automatically by default)')
+@click.option('-r', '--repeat', type=int, default=5,
+              help='number of timing runs per benchmark')
+@click.option('-o', '--output', type=click.Path(dir_okay=False,
+                                                writable=True),
+              help='file to write the results to as JSON')
+@click.option('--compare', type=click.Path(dir_okay=False, exists=True),
+              help='JSON results of a previous run to compare against')
+@click.option('--introspection-data', type=click.Path(dir_okay=False,
+                                                      exists=True),
+              help='JSON array of the rows returned by the schema '
+                   'introspection query (enables the s_refl.parse_into '
+                   'benchmark)')
+def bench(*, track, sizes, include, number, repeat, output, compare,
+          introspection_data):
+    """Run compiler microbenchmarks.
+
+    Times the individual compiler stages on a fixed corpus of schemas
+    and queries, or, with --track=scaling, schema operations on
+    generated schemas of increasing size.  Results can be saved with
+    --output and compared with a run made on another commit using
+    --compare.
+    """
+    if repeat < 1:
+        click.secho(
+            'Error: --repeat must be a positive non-zero number.', fg='red')
+        sys.exit(1)
+
+    patterns = [re.compile(p) for p in include]
+    tracks = set(track or ['compiler'])
+    ctx = benchmarks.BenchContext(
+        introspection_data=introspection_data,
+        scaling_sizes=sizes,
+    )
+
+    baseline = None
+    if compare:
+        with open(compare, 'rt') as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    growth = {}
+    for bm in benchmarks.BENCHMARKS.values():
+        if bm.track not in tracks:
+            continue
+
+        for case in bm.cases(ctx):
+            key = f'{bm.name}/{case}'
+            if patterns and not any(p.search(key) for p in patterns):
+                continue
+
+            result = _run(bm.func(ctx, case), number=number, repeat=repeat)
+            results[key] = result
+            _print_result(key, result, baseline)
+
+        if bm.track == 'scaling':
+            bm_growth = _get_growth(bm.name, results)
+            if bm_growth:
+                growth[bm.name] = bm_growth
+                _print_growth(bm.name, bm_growth)
+
+    if output:
+        with open(output, 'wt') as f:
+            json.dump({
+                'version': _get_version(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'number': number,
+                'repeat': repeat,
+                'results': results,
+                'growth': growth,
+            }, f, indent=2, sort_keys=True)
+
+
+def _run(
+    runner: benchmarks.Runner,
+    *,
+    number: int,
+    repeat: int,
+) -> Dict[str, Any]:
+    timer = timeit.Timer(runner)
+
+    # Warm up the caches the stage might have.
+    runner()
+
+    if not number:
+        number, _ = timer.autorange()
+
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def _print_result(
+    key: str,
+    result: Dict[str, Any],
+    baseline: Optional[Dict[str, Dict[str, Any]]],
+) -> None:
+    line = f'{key:<56} {_format_time(result["min"]):>10}'
+
+    if baseline is not None:
+        old = baseline.get(key)
+        if old is None:
+            line += '  (new)'
+        else:
+            ratio = result['min'] / old['min']
+            text = f'  {_format_time(old["min"]):>10}  x{ratio:.2f}'
+            if ratio > 1.05:
+                line += click.style(text, fg='red')
+            elif ratio < 0.95:
+                line += click.style(text, fg='green')
+            else:
+                line += text
+
+    click.echo(line)
+
+
+def _get_growth(
+    name: str,
+    results: Dict[str, Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    # The exponent k of the best fitting t = c * n^k between every
+    # two consecutive schema sizes: 1 is linear, 2 is quadratic.
+    timings = sorted(
+        (int(key.rpartition('/')[2]), res['min'])
+        for key, res in results.items()
+        if key.rpartition('/')[0] == name
+    )
+
+    growth = []
+    for (n1, t1), (n2, t2) in zip(timings, timings[1:]):
+        growth.append({
+            'from': n1,
+            'to': n2,
+            'exponent': math.log(t2 / t1) / math.log(n2 / n1),
+        })
+    return growth
+
+
+def _print_growth(name: str, growth: List[Dict[str, Any]]) -> None:
+    parts = []
+    for g in growth:
+        text = f'{g["from"]}->{g["to"]}: n^{g["exponent"]:.2f}'
+        if g['exponent'] > 1.5:
+            text = click.style(text, fg='red')
+        parts.append(text)
+    click.echo(f'{"  growth":<56} {", ".join(parts)}')
+
+
+def _format_time(secs: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if secs * scale >= 1:
+            return f'{secs * scale:.2f}{unit}'
+    return f'{secs * 1e9:.0f}ns'
+
+
+def _get_version() -> Optional[Dict[str, Any]]:
+    try:
+        return dict(buildmeta.get_version_dict())
+    except buildmeta.MetadataError:
+        return None
@@ -0,0 +1,299 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Compiler stage microbenchmarks.
+
+Every benchmark is a function taking a :class:`BenchContext` and a
+case name and returning a zero-argument callable that runs the
+measured stage exactly once.  Inputs of a stage are produced by the
+preceding stages ahead of time, so that only the stage itself is
+timed.
+
+Benchmarks are grouped into tracks.  The "compiler" track times the
+stages on a small fixed schema, while the "scaling" track times schema
+operations on generated schemas of increasing size to expose
+super-linear algorithms.
+"""
+
+
+from __future__ import annotations
+from typing import *
+
+import functools
+import json
+
+from edb import edgeql
+from edb import graphql
+from edb.edgeql import ast as qlast
+from edb.edgeql import compiler as qlcompiler
+from edb.edgeql import parser as qlparser
+
+from edb.ir import ast as irast
+
+from edb.pgsql import ast as pgast
+from edb.pgsql import codegen as pgcodegen
+from edb.pgsql import compiler as pgcompiler
+
+from edb.schema import ddl as s_ddl
+from edb.schema import reflection as s_refl
+from edb.schema import schema as s_schema
+
+from edb.server import tokenizer
+
+from edb.testbase import lang as tb_lang
+from edb.testbase import schemagen
+
+from . import corpus
+
+
+Runner = Callable[[], Any]
+BenchmarkFunc = Callable[['BenchContext', str], Runner]
+
+
+class Benchmark(NamedTuple):
+
+    name: str
+    func: BenchmarkFunc
+    cases: Callable[['BenchContext'], Iterable[str]]
+    track: str
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def _query_cases(ctx: BenchContext) -> Iterable[str]:
+    return corpus.QUERIES.keys()
+
+
+def benchmark(
+    name: str,
+    *,
+    cases: Callable[[BenchContext], Iterable[str]] = _query_cases,
+    track: str = 'compiler',
+) -> Callable[[BenchmarkFunc], BenchmarkFunc]:
+
+    def decorator(func: BenchmarkFunc) -> BenchmarkFunc:
+        if name in BENCHMARKS:
+            raise RuntimeError(f'duplicate benchmark: {name!r}')
+        BENCHMARKS[name] = Benchmark(
+            name=name, func=func, cases=cases, track=track)
+        return func
+
+    return decorator
+
+
+class BenchContext:
+    """Lazily computed inputs shared by the benchmarks."""
+
+    def __init__(
+        self,
+        *,
+        introspection_data: Optional[str] = None,
+        scaling_sizes: Sequence[int] = (),
+    ) -> None:
+        self._introspection_data = introspection_data
+        self.scaling_sizes = scaling_sizes
+
+    @functools.cached_property
+    def std_schema(self) -> s_schema.Schema:
+        return tb_lang._load_std_schema()
+
+    @functools.cached_property
+    def schema(self) -> s_schema.Schema:
+        return self._load_schema(corpus.SCHEMA)
+
+    @functools.cached_property
+    def migrated_schema(self) -> s_schema.Schema:
+        return self._load_schema(corpus.SCHEMA_MIGRATED)
+
+    @functools.cached_property
+    def introspection_data(self) -> Optional[List[str]]:
+        if self._introspection_data is None:
+            return None
+        with open(self._introspection_data, 'rt') as f:
+            return json.load(f)
+
+    def _load_schema(self, source: str) -> s_schema.Schema:
+        # Make sure the std schema is loaded (and possibly cached)
+        # before the SDL is applied on top of it.
+        self.std_schema
+        return tb_lang.BaseSchemaTest.load_schema(
+            source, modname=corpus.MODULE)
+
+    @functools.lru_cache(maxsize=None)
+    def large_sdl(
+        self,
+        size: int,
+        *,
+        migrated: bool = False,
+    ) -> List[Tuple[str, List[qlast.DDL]]]:
+        source = schemagen.generate_schema(size, migrated=migrated)
+        target = qlparser.parse_sdl(
+            f'module {corpus.MODULE} {{ {source} }}')
+        return [(corpus.MODULE, target.declarations[0].declarations)]
+
+    @functools.lru_cache(maxsize=None)
+    def large_schema(
+        self,
+        size: int,
+        *,
+        migrated: bool = False,
+    ) -> s_schema.Schema:
+        return s_ddl.apply_sdl(
+            self.large_sdl(size, migrated=migrated),
+            target_schema=self.std_schema,
+            current_schema=self.std_schema,
+        )
+
+    def source(self, case: str) -> str:
+        return corpus.QUERIES[case]
+
+    @functools.lru_cache(maxsize=None)
+    def ql_tree(self, case: str) -> qlast.Base:
+        return qlparser.parse(self.source(case))
+
+    @functools.lru_cache(maxsize=None)
+    def ir(self, case: str) -> irast.Command:
+        return qlcompiler.compile_ast_to_ir(
+            self.ql_tree(case),
+            self.schema,
+            options=qlcompiler.CompilerOptions(
+                modaliases={None: corpus.MODULE},
+            ),
+        )
+
+    @functools.lru_cache(maxsize=None)
+    def sql_tree(self, case: str) -> pgast.Base:
+        return pgcompiler.compile_ir_to_sql_tree(
+            self.ir(case),
+            output_format=pgcompiler.OutputFormat.NATIVE,
+        )
+
+
+@benchmark('tokenizer.normalize')
+def bench_normalize(ctx: BenchContext, case: str) -> Runner:
+    source = ctx.source(case).encode()
+    return functools.partial(tokenizer.normalize, source)
+
+
+@benchmark('edgeql.parse_block')
+def bench_parse_block(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(edgeql.parse_block, ctx.source(case))
+
+
+@benchmark('qlcompiler.compile_ast_to_ir')
+def bench_compile_ast_to_ir(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(
+        qlcompiler.compile_ast_to_ir,
+        ctx.ql_tree(case),
+        ctx.schema,
+        options=qlcompiler.CompilerOptions(
+            modaliases={None: corpus.MODULE},
+        ),
+    )
+
+
+@benchmark('pgcompiler.compile_ir_to_sql_tree')
+def bench_compile_ir_to_sql_tree(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(
+        pgcompiler.compile_ir_to_sql_tree,
+        ctx.ir(case),
+        output_format=pgcompiler.OutputFormat.NATIVE,
+    )
+
+
+@benchmark('pgcodegen.SQLSourceGenerator')
+def bench_codegen(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(
+        pgcodegen.SQLSourceGenerator.to_source,
+        ctx.sql_tree(case),
+        pretty=False,
+    )
+
+
+@benchmark('s_ddl.delta_schemas', cases=lambda ctx: ['migration'])
+def bench_delta_schemas(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(
+        s_ddl.delta_schemas,
+        ctx.schema,
+        ctx.migrated_schema,
+        included_modules=[corpus.MODULE],
+    )
+
+
+def _parse_into_cases(ctx: BenchContext) -> Iterable[str]:
+    # The introspection data can only be obtained from a running
+    # server, so this benchmark only runs when it is provided.
+    if ctx.introspection_data is None:
+        return []
+    else:
+        return ['introspection']
+
+
+@benchmark('s_refl.parse_into', cases=_parse_into_cases)
+def bench_parse_into(ctx: BenchContext, case: str) -> Runner:
+    _, layout = tb_lang._load_reflection_schema()
+    return functools.partial(
+        s_refl.parse_into,
+        schema=ctx.std_schema,
+        data=ctx.introspection_data,
+        schema_class_layout=layout,
+    )
+
+
+def _scaling_cases(ctx: BenchContext) -> Iterable[str]:
+    return [str(size) for size in ctx.scaling_sizes]
+
+
+@benchmark('scaling.apply_sdl', cases=_scaling_cases, track='scaling')
+def bench_scaling_apply_sdl(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(
+        s_ddl.apply_sdl,
+        ctx.large_sdl(int(case)),
+        target_schema=ctx.std_schema,
+        current_schema=ctx.std_schema,
+    )
+
+
+@benchmark('scaling.delta_schemas', cases=_scaling_cases, track='scaling')
+def bench_scaling_delta_schemas(ctx: BenchContext, case: str) -> Runner:
+    # The initial migration of the whole schema.
+    return functools.partial(
+        s_ddl.delta_schemas,
+        ctx.std_schema,
+        ctx.large_schema(int(case)),
+        included_modules=[corpus.MODULE],
+    )
+
+
+@benchmark('scaling.migration', cases=_scaling_cases, track='scaling')
+def bench_scaling_migration(ctx: BenchContext, case: str) -> Runner:
+    # A small incremental migration of the schema.
+    return functools.partial(
+        s_ddl.delta_schemas,
+        ctx.large_schema(int(case)),
+        ctx.large_schema(int(case), migrated=True),
+        included_modules=[corpus.MODULE],
+    )
+
+
+@benchmark('scaling.GQLCoreSchema', cases=_scaling_cases, track='scaling')
+def bench_scaling_gql_core_schema(ctx: BenchContext, case: str) -> Runner:
+    return functools.partial(
+        graphql.GQLCoreSchema, ctx.large_schema(int(case)))
@@ -0,0 +1,191 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Schemas and queries the compiler benchmarks run on."""
+
+
+from __future__ import annotations
+
+
+MODULE = 'bench'
+
+
+SCHEMA = r'''
+abstract type Named {
+    required property name -> str;
+}
+
+abstract type Dictionary extending Named {
+    overloaded required property name -> str {
+        delegated constraint exclusive;
+    }
+    index on (__subject__.name);
+}
+
+abstract type Text {
+    required property body -> str {
+        constraint max_len_value(10000);
+    }
+}
+
+type User extending Dictionary {
+    property email -> str;
+    multi link friends -> User;
+    multi link todo -> Issue {
+        property rank -> int64 {
+            default := 42;
+        }
+    }
+}
+
+abstract type Owned {
+    required link owner -> User {
+        property note -> str;
+    }
+}
+
+type Status extending Dictionary;
+
+type Priority extending Dictionary;
+
+type LogEntry extending Owned, Text {
+    required property spent_time -> int64;
+}
+
+type Comment extending Text, Owned {
+    required link issue -> Issue;
+    link parent -> Comment;
+}
+
+type Issue extending Named, Owned, Text {
+    required property number -> str {
+        constraint exclusive;
+    }
+    required link status -> Status;
+    link priority -> Priority;
+    multi link watchers -> User;
+    property time_estimate -> int64;
+    multi link time_spent_log -> LogEntry;
+    property start_date -> datetime {
+        default := (SELECT datetime_current());
+    }
+    property due_date -> datetime;
+    multi link related_to -> Issue;
+    property tags -> array<str>;
+    property total_spent := sum(.time_spent_log.spent_time);
+}
+
+function user_issues(name: str) -> SET OF Issue
+    USING (SELECT Issue FILTER .owner.name = name);
+'''
+
+
+# The schema above after a typical incremental migration.
+SCHEMA_MIGRATED = SCHEMA + r'''
+type Milestone extending Dictionary {
+    property due_date -> datetime;
+    multi link issues -> Issue;
+}
+
+type Label extending Dictionary {
+    property color -> str;
+}
+'''
+
+
+QUERIES = {
+    'literal': r'''
+        SELECT 1 + 2;
+    ''',
+
+    'filter': r'''
+        SELECT User { name, email }
+        FILTER .name = 'Elvis';
+    ''',
+
+    'shape': r'''
+        SELECT Issue {
+            number,
+            name,
+            body,
+            owner: { name, @note },
+            status: { name },
+            watchers: { name } ORDER BY .name,
+            total_spent,
+        }
+        FILTER .status.name = 'Open'
+        ORDER BY .number
+        LIMIT 10;
+    ''',
+
+    'nested': r'''
+        SELECT User {
+            name,
+            todo: {
+                number,
+                @rank,
+                comments := (
+                    SELECT .<issue[IS Comment] {
+                        body,
+                        owner: { name },
+                    }
+                    ORDER BY .body
+                ),
+            } ORDER BY @rank DESC,
+        }
+        FILTER count(.todo) > 0;
+    ''',
+
+    'aggregate': r'''
+        WITH
+            open := (SELECT Issue FILTER .status.name = 'Open')
+        SELECT (
+            total := count(open),
+            estimated := sum(open.time_estimate),
+            owners := array_agg(DISTINCT open.owner.name),
+        );
+    ''',
+
+    'for': r'''
+        FOR name IN {'Elvis', 'Yury', 'Victor'}
+        UNION (
+            SELECT user_issues(name) { number, name }
+        );
+    ''',
+
+    'insert': r'''
+        INSERT Issue {
+            number := <str>$number,
+            name := <str>$name,
+            body := <str>$body,
+            owner := (SELECT User FILTER .name = <str>$owner LIMIT 1),
+            status := (SELECT Status FILTER .name = 'Open' LIMIT 1),
+            tags := ['bench', 'insert'],
+        };
+    ''',
+
+    'update': r'''
+        UPDATE Issue
+        FILTER .number = <str>$number
+        SET {
+            status := (SELECT Status FILTER .name = 'Closed' LIMIT 1),
+            watchers += (SELECT User FILTER .name = <str>$watcher),
+        };
+    ''',
+}
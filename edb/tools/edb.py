@@ -54,11 +54,13 @@ def server(version=False, **kwargs):
 
 # Import at the end of the file so that "edb.tools.edb.edbcommands"
 # is defined for all of the below modules when they try to import it.
+from . import bench  # noqa
 from . import dflags  # noqa
 from . import gen_errors  # noqa
 from . import gen_types  # noqa
 from . import gen_meta_grammars  # noqa
 from . import inittestdb  # noqa
+from . import loadgen  # noqa
 from . import test  # noqa
 from . import wipe  # noqa
 from .profiling import cli  # noqa
@@ -0,0 +1,517 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""End-to-end load generator for a local EdgeDB server."""
+
+
+from __future__ import annotations
+from typing import *
+
+import asyncio
+import collections
+import itertools
+import json
+import random
+import sys
+import time
+
+import click
+import edgedb
+import uvloop
+
+from edb.server import cluster as edgedb_cluster
+from edb.testbase import server as tb
+from edb.tools.edb import edbcommands
+
+
+SCHEMA = r'''
+    type Person {
+        required property name -> str {
+            constraint exclusive;
+        }
+        property email -> str;
+        property score -> int64;
+        multi link friends -> Person;
+    }
+
+    type Post {
+        required property title -> str;
+        property body -> str;
+        required link author -> Person;
+        property created -> datetime {
+            default := datetime_current();
+        }
+    }
+'''
+
+
+CACHED_READ = r'''
+    SELECT Person {
+        name,
+        email,
+        score,
+        friends: { name },
+    }
+    FILTER .name = <str>$name
+'''
+
+# The computable name is unique for every query, so it is never
+# found in the compiled query cache.
+UNCACHED_READ = r'''
+    SELECT Person {
+        name,
+        score,
+        c{n} := .score + {n},
+    }
+    FILTER .name = <str>$name
+'''
+
+INSERT = r'''
+    INSERT Post {
+        title := <str>$title,
+        body := <str>$title,
+        author := (SELECT Person FILTER .name = <str>$name LIMIT 1),
+    }
+'''
+
+TX_READ = r'''
+    SELECT Person.score FILTER Person.name = <str>$name
+'''
+
+TX_UPDATE = r'''
+    UPDATE Person
+    FILTER .name = <str>$name
+    SET {
+        score := .score + 1
+    }
+'''
+
+
+OPERATIONS = ('cached_read', 'uncached_read', 'insert', 'transaction')
+
+# Operations that cannot be expressed as a single HTTP request.
+BINARY_ONLY_OPERATIONS = frozenset({'transaction'})
+
+
+def get_setup_script(num_objects: int) -> str:
+    ids = ', '.join(str(i) for i in range(num_objects))
+    return f'''
+        CREATE MIGRATION loadgen TO {{
+            module default {{ {SCHEMA} }}
+        }};
+        COMMIT MIGRATION loadgen;
+
+        FOR i IN {{ {ids} }} UNION (
+            INSERT Person {{
+                name := 'person' ++ <str>i,
+                email := 'person' ++ <str>i ++ '@example.com',
+                score := i,
+            }}
+        );
+
+        UPDATE Person
+        SET {{
+            friends := (
+                SELECT DETACHED Person
+                FILTER .score IN {{
+                    (Person.score + 1) % {num_objects},
+                    (Person.score + 2) % {num_objects},
+                    (Person.score + 3) % {num_objects},
+                }}
+            )
+        }};
+
+        FOR p IN {{ Person }} UNION (
+            INSERT Post {{
+                title := p.name ++ ' post',
+                author := p,
+            }}
+        );
+    '''
+
+
+class Stats:
+
+    def __init__(self) -> None:
+        self.latencies: DefaultDict[
+            Tuple[str, str], List[float]] = collections.defaultdict(list)
+        self.errors: DefaultDict[
+            Tuple[str, str], int] = collections.defaultdict(int)
+        self.recording = False
+
+    def record(self, key: Tuple[str, str], started: float,
+               error: bool) -> None:
+        if not self.recording:
+            return
+        if error:
+            self.errors[key] += 1
+        else:
+            self.latencies[key].append(time.monotonic() - started)
+
+    def summarize(self, duration: float) -> List[Dict[str, Any]]:
+        summary = []
+        for key in sorted(self.latencies.keys() | self.errors.keys()):
+            client, op = key
+            lats = sorted(self.latencies[key])
+            summary.append({
+                'client': client,
+                'operation': op,
+                'count': len(lats),
+                'errors': self.errors[key],
+                'throughput': len(lats) / duration,
+                'p50': _percentile(lats, 50),
+                'p90': _percentile(lats, 90),
+                'p99': _percentile(lats, 99),
+                'max': lats[-1] if lats else None,
+            })
+        return summary
+
+
+def _percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    idx = min(len(values) - 1, int(len(values) * pct / 100))
+    return values[idx]
+
+
+class Workload:
+
+    def __init__(
+        self,
+        *,
+        mix: Mapping[str, int],
+        num_objects: int,
+        stats: Stats,
+        seed: int,
+    ) -> None:
+        self._mix = mix
+        self._num_objects = num_objects
+        self._stats = stats
+        self._rng = random.Random(seed)
+        self._counter = itertools.count()
+        self._stopped = False
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def _ops(self, client: str) -> Tuple[List[str], List[int]]:
+        ops = [
+            op for op, weight in self._mix.items()
+            if weight and not (
+                client == 'http' and op in BINARY_ONLY_OPERATIONS)
+        ]
+        return ops, [self._mix[op] for op in ops]
+
+    def _random_name(self) -> str:
+        return f'person{self._rng.randrange(self._num_objects)}'
+
+    def _query(self, op: str) -> Tuple[str, Dict[str, Any]]:
+        name = self._random_name()
+        if op == 'cached_read':
+            return CACHED_READ, {'name': name}
+        elif op == 'uncached_read':
+            query = UNCACHED_READ.replace('{n}', str(next(self._counter)))
+            return query, {'name': name}
+        elif op == 'insert':
+            return INSERT, {'name': name,
+                            'title': f'post{next(self._counter)}'}
+        else:
+            raise ValueError(f'unsupported operation: {op!r}')
+
+    async def run_binary_client(self, con: edgedb.AsyncIOConnection) -> None:
+        ops, weights = self._ops('binary')
+        while not self._stopped:
+            op = self._rng.choices(ops, weights)[0]
+            started = time.monotonic()
+            try:
+                if op == 'transaction':
+                    name = self._random_name()
+                    async with con.transaction():
+                        await con.fetchone(TX_READ, name=name)
+                        await con.fetchall(TX_UPDATE, name=name)
+                else:
+                    query, args = self._query(op)
+                    await con.fetchall(query, **args)
+            except edgedb.EdgeDBError:
+                self._stats.record(('binary', op), started, error=True)
+            else:
+                self._stats.record(('binary', op), started, error=False)
+
+    async def run_http_client(self, host: str, port: int) -> None:
+        ops, weights = self._ops('http')
+        if not ops:
+            return
+
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while not self._stopped:
+                op = self._rng.choices(ops, weights)[0]
+                query, args = self._query(op)
+                started = time.monotonic()
+                status, body = await _http_request(
+                    reader, writer, host,
+                    {'query': query, 'variables': args})
+                error = status != 200 or 'data' not in json.loads(body)
+                self._stats.record(('http', op), started, error=error)
+        finally:
+            writer.close()
+
+
+async def _http_request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    host: str,
+    data: Dict[str, Any],
+) -> Tuple[int, bytes]:
+    body = json.dumps(data).encode()
+    writer.write(
+        b'POST / HTTP/1.1\r\n'
+        b'Host: ' + host.encode() + b'\r\n'
+        b'Content-Type: application/json\r\n'
+        b'Content-Length: ' + str(len(body)).encode() + b'\r\n'
+        b'\r\n' + body)
+
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            length = int(value)
+
+    return status, await reader.readexactly(length)
+
+
+async def _run(
+    *,
+    cluster: edgedb_cluster.BaseCluster,
+    dbname: str,
+    concurrency: int,
+    http_concurrency: int,
+    mix: Mapping[str, int],
+    num_objects: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Dict[str, Any]:
+    conn_args = tb.ClusterTestCase.get_connect_args(cluster=cluster)
+
+    setup_script = get_setup_script(num_objects)
+    tplname = tb.get_setup_template_name(setup_script)
+    await tb._setup_template_database(tplname, setup_script, conn_args)
+
+    admin_conn = await edgedb.async_connect(**conn_args)
+    http_host = '127.0.0.1'
+    http_port = None
+
+    try:
+        existing = await admin_conn.fetchall(
+            'SELECT sys::Database.name FILTER sys::Database.name = <str>$0',
+            dbname)
+        if existing:
+            # Left over from an interrupted run.
+            await tb._execute_on_idle_database(
+                admin_conn, f'DROP DATABASE {dbname};')
+        await tb._setup_database(dbname, setup_script, conn_args)
+
+        if http_concurrency:
+            http_port = edgedb_cluster.find_available_port()
+            await admin_conn.execute(f'''
+                CONFIGURE SYSTEM INSERT Port {{
+                    protocol := "edgeql+http",
+                    database := "{dbname}",
+                    address := "{http_host}",
+                    port := {http_port},
+                    user := "http",
+                    concurrency := 4,
+                }};
+            ''')
+
+        db_conn_args = dict(conn_args, database=dbname)
+        cons = [
+            await edgedb.async_connect(**db_conn_args)
+            for _ in range(concurrency)
+        ]
+
+        stats = Stats()
+        workload = Workload(
+            mix=mix, num_objects=num_objects, stats=stats, seed=seed)
+
+        clients = [
+            asyncio.create_task(workload.run_binary_client(con))
+            for con in cons
+        ]
+        clients.extend(
+            asyncio.create_task(
+                workload.run_http_client(http_host, http_port))
+            for _ in range(http_concurrency)
+        )
+
+        try:
+            await asyncio.sleep(warmup)
+            stats.recording = True
+            started = time.monotonic()
+            await asyncio.sleep(duration)
+            stats.recording = False
+            elapsed = time.monotonic() - started
+        finally:
+            workload.stop()
+            await asyncio.gather(*clients)
+            for con in cons:
+                await con.aclose()
+
+        if http_port is not None:
+            await admin_conn.execute(f'''
+                CONFIGURE SYSTEM RESET Port FILTER .port = {http_port};
+            ''')
+
+        await tb._execute_on_idle_database(
+            admin_conn, f'DROP DATABASE {dbname};')
+    finally:
+        await admin_conn.aclose()
+
+    return {
+        'concurrency': concurrency,
+        'http_concurrency': http_concurrency,
+        'mix': dict(mix),
+        'duration': elapsed,
+        'results': stats.summarize(elapsed),
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    def ms(val: Optional[float]) -> str:
+        return '-' if val is None else f'{val * 1000:.2f}'
+
+    click.echo(
+        f'{"client":<8}{"operation":<16}{"count":>9}{"errors":>8}'
+        f'{"req/s":>10}{"p50 ms":>10}{"p90 ms":>10}{"p99 ms":>10}'
+        f'{"max ms":>10}')
+
+    total = 0
+    for res in report['results']:
+        total += res['count']
+        click.echo(
+            f'{res["client"]:<8}{res["operation"]:<16}{res["count"]:>9}'
+            f'{res["errors"]:>8}{res["throughput"]:>10.1f}'
+            f'{ms(res["p50"]):>10}{ms(res["p90"]):>10}'
+            f'{ms(res["p99"]):>10}{ms(res["max"]):>10}')
+
+    click.echo(
+        f'\nTotal: {total} requests in {report["duration"]:.1f}s, '
+        f'{total / report["duration"]:.1f} req/s')
+
+
+def _parse_mix(ctx, param, value) -> Dict[str, int]:
+    mix = dict.fromkeys(OPERATIONS, 0)
+    for item in value.split(','):
+        op, _, weight = item.partition('=')
+        op = op.strip()
+        if op not in mix:
+            raise click.BadParameter(
+                f'unknown operation {op!r}, expected one of: '
+                f'{", ".join(OPERATIONS)}')
+        try:
+            mix[op] = int(weight)
+        except ValueError:
+            raise click.BadParameter(
+                f'invalid weight for {op!r}: {weight!r}') from None
+        if mix[op] < 0:
+            raise click.BadParameter(
+                f'weight for {op!r} must not be negative')
+
+    if not any(mix.values()):
+        raise click.BadParameter('at least one weight must be positive')
+
+    return mix
+
+
+@edbcommands.command()
+@click.option('-D', '--data-dir', type=str,
+              help='database cluster directory to use (a temporary '
+                   'cluster is created by default; see also '
+                   'EDGEDB_TEST_CLUSTER_ADDR)')
+@click.option('-c', '--concurrency', type=int, default=10,
+              help='number of concurrent binary protocol clients')
+@click.option('--http-concurrency', type=int, default=0,
+              help='number of concurrent EdgeQL over HTTP clients')
+@click.option('--mix', type=str, callback=_parse_mix,
+              default='cached_read=70,uncached_read=5,insert=15,'
+                      'transaction=10',
+              help='relative weights of the operations, as a comma '
+                   'separated list of OPERATION=WEIGHT, where OPERATION '
+                   f'is one of: {", ".join(OPERATIONS)}')
+@click.option('-d', '--duration', type=float, default=10,
+              help='duration of the measured run in seconds')
+@click.option('--warmup', type=float, default=3,
+              help='duration of the unmeasured warmup in seconds')
+@click.option('--objects', 'num_objects', type=int, default=1000,
+              help='number of objects in the synthetic database')
+@click.option('--seed', type=int, default=0,
+              help='random seed of the workload')
+@click.option('-o', '--output', type=click.Path(dir_okay=False,
+                                                writable=True),
+              help='file to write the results to as JSON')
+def loadgen(*, data_dir, concurrency, http_concurrency, mix, duration,
+            warmup, num_objects, seed, output):
+    """Generate load against a local EdgeDB server.
+
+    Populates a database with a synthetic schema and data, runs a mix
+    of operations over concurrent connections and reports the throughput
+    and latency percentiles of every operation.
+    """
+    if concurrency < 0 or http_concurrency < 0:
+        click.secho('Error: concurrency must not be negative.', fg='red')
+        sys.exit(1)
+
+    if not concurrency and not http_concurrency:
+        click.secho('Error: no clients to run.', fg='red')
+        sys.exit(1)
+
+    if num_objects < 1:
+        click.secho('Error: --objects must be positive.', fg='red')
+        sys.exit(1)
+
+    if data_dir:
+        cluster = tb._init_cluster(data_dir=data_dir, cleanup_atexit=True)
+    else:
+        cluster = tb._start_cluster(cleanup_atexit=True)
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    report = asyncio.run(_run(
+        cluster=cluster,
+        dbname=f'loadgen_{seed}',
+        concurrency=concurrency,
+        http_concurrency=http_concurrency,
+        mix=mix,
+        num_objects=num_objects,
+        duration=duration,
+        warmup=warmup,
+        seed=seed,
+    ))
+
+    _print_report(report)
+
+    if output:
+        with open(output, 'wt') as f:
+            json.dump(report, f, indent=2)
@@ -78,8 +78,17 @@ __all__ = ('not_implemented', 'xfail', 'skip')
               help='package name to measure code coverage for, '
                    'can be specified multiple times '
                    '(e.g --cov edb.common --cov edb.server)')
+@click.option('--running-times-log', 'running_times_log_file',
+              type=click.Path(dir_okay=False, writable=True),
+              help='file to record test running times to and use them '
+                   'to schedule the longest tests first (defaults to '
+                   'build/cache/test-running-times.json in dev mode)')
+@click.option('--slowest', type=int, default=10, metavar='N',
+              help='list N slowest tests and test classes after the '
+                   'run, 0 to disable')
 def test(*, files, jobs, include, exclude, verbose, quiet, debug,
-         output_format, warnings, failfast, cov, repeat):
+         output_format, warnings, failfast, cov, repeat,
+         running_times_log_file, slowest):
     """Run EdgeDB test suite.
 
     Discovers and runs tests in the specified files or directories.
@@ -126,6 +135,12 @@ def test(*, files, jobs, include, exclude, verbose, quiet, debug,
                 f'Error: test path {file!r} does not exist', fg='red')
             sys.exit(1)
 
+    if running_times_log_file is None and devmode.is_in_dev_mode():
+        running_times_log_file = (
+            pathlib.Path(devmode.get_dev_mode_cache_dir()) /
+            'test-running-times.json'
+        )
+
     run = functools.partial(
         _run,
         include=include,
@@ -137,6 +152,8 @@ def test(*, files, jobs, include, exclude, verbose, quiet, debug,
         warnings=warnings,
         failfast=failfast,
         repeat=repeat,
+        running_times_log_file=running_times_log_file,
+        slowest=slowest,
     )
 
     if cov:
@@ -211,7 +228,7 @@ def _coverage_wrapper(paths):
 
 
 def _run(*, include, exclude, verbosity, files, jobs, output_format,
-         warnings, failfast, repeat):
+         warnings, failfast, repeat, running_times_log_file, slowest):
     suite = unittest.TestSuite()
 
     total = 0
@@ -260,7 +277,9 @@ def _run(*, include, exclude, verbosity, files, jobs, output_format,
 
         test_runner = runner.ParallelTextTestRunner(
             verbosity=verbosity, output_format=output_format,
-            warnings=warnings, num_workers=jobs, failfast=failfast)
+            warnings=warnings, num_workers=jobs, failfast=failfast,
+            running_times_log_file=running_times_log_file,
+            slowest=slowest)
 
         result = test_runner.run(suite)
 
@@ -20,6 +20,7 @@
 from __future__ import annotations
 from typing import *
 
+import collections
 import collections.abc
 import enum
 import io
@@ -29,9 +30,12 @@ import multiprocessing
 import multiprocessing.reduction
 import multiprocessing.util
 import os
+import pathlib
 import random
 import re
+import statistics
 import sys
+import tempfile
 import threading
 import time
 import types
@@ -701,18 +705,22 @@ class ParallelTextTestRunner:
 
     def __init__(self, *, stream=None, num_workers=1, verbosity=1,
                  output_format=OutputFormat.auto, warnings=True,
-                 failfast=False):
+                 failfast=False, running_times_log_file=None,
+                 slowest=0):
         self.stream = stream if stream is not None else sys.stderr
         self.num_workers = num_workers
         self.verbosity = verbosity
         self.warnings = warnings
         self.failfast = failfast
         self.output_format = output_format
+        self.running_times_log_file = running_times_log_file
+        self.slowest = slowest
 
     def run(self, test):
         session_start = time.monotonic()
         cases = tb.get_test_cases([test])
         setup = tb.get_test_cases_setup(cases)
+        running_times = self._read_running_times()
         bootstrap_time_taken = 0
         tests_time_taken = 0
         result = None
@@ -764,12 +772,12 @@ class ParallelTextTestRunner:
 
             if self.num_workers > 1:
                 suite = ParallelTestSuite(
-                    self._sort_tests(cases),
+                    self._sort_tests(cases, running_times),
                     conn,
                     self.num_workers)
             else:
                 suite = SequentialTestSuite(
-                    self._sort_tests(cases),
+                    self._sort_tests(cases, running_times),
                     conn
                 )
 
@@ -801,6 +809,7 @@ class ParallelTextTestRunner:
         if result is not None:
             self._render_result(
                 result, bootstrap_time_taken, tests_time_taken)
+            self._write_running_times(running_times, result)
 
         return result
 
@@ -901,24 +910,103 @@ class ParallelTextTestRunner:
 
         self._echo()
 
+        if self.slowest > 0 and result.test_stats:
+            self._print_slowest(result)
+
         return result
 
-    def _sort_tests(self, cases):
-        serialized_suites = {
-            casecls: unittest.TestSuite(tests)
-            for casecls, tests in cases.items()
-            if getattr(casecls, 'SERIALIZED', False)
-        }
+    def _print_slowest(self, result):
+        test_times = [
+            (stats['running-time'], test.id())
+            for test, stats in result.test_stats
+        ]
+        class_times = collections.defaultdict(float)
+        for elapsed, test_id in test_times:
+            class_times[test_id.rpartition('.')[0]] += elapsed
+
+        for title, times in [
+            ('Slowest tests', test_times),
+            ('Slowest test classes',
+             [(elapsed, name) for name, elapsed in class_times.items()]),
+        ]:
+            self._echo(f'{title}: ')
+            times.sort(reverse=True)
+            for elapsed, name in times[:self.slowest]:
+                self._echo(f'  {self._format_time(elapsed)} ', nl=False)
+                self._echo(name, bold=True)
+            self._echo()
 
-        tests = itertools.chain(
-            serialized_suites.values(),
-            itertools.chain.from_iterable(
-                tests for casecls, tests in cases.items()
-                if casecls not in serialized_suites
-            )
-        )
+    def _read_running_times(self):
+        if self.running_times_log_file is None:
+            return {}
+
+        try:
+            with open(self.running_times_log_file, 'rt') as f:
+                return json.load(f)['tests']
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            self._echo(
+                f'Warning: could not read running times log '
+                f'{str(self.running_times_log_file)!r}: {e}', fg='yellow')
+            return {}
+        except (ValueError, KeyError, TypeError):
+            self._echo(
+                f'Warning: ignoring malformed running times log '
+                f'{str(self.running_times_log_file)!r}', fg='yellow')
+            return {}
+
+    def _write_running_times(self, running_times, result):
+        if self.running_times_log_file is None or not result.test_stats:
+            return
+
+        running_times = dict(running_times)
+        for test, stats in result.test_stats:
+            running_times[test.id()] = stats['running-time']
 
-        return list(tests)
+        path = pathlib.Path(self.running_times_log_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    mode='wt', dir=path.parent, delete=False) as f:
+                json.dump(
+                    {'tests': running_times}, f, indent=2, sort_keys=True)
+            os.replace(f.name, path)
+        except OSError as e:
+            self._echo(
+                f'Warning: could not write running times log '
+                f'{str(path)!r}: {e}', fg='yellow')
+
+    def _sort_tests(self, cases, running_times):
+        # Tests without a recorded running time are assumed to take
+        # as long as an average test.
+        if running_times:
+            default_time = statistics.mean(running_times.values())
+        else:
+            default_time = 0.0
+
+        units = []
+        for casecls, tests in cases.items():
+            total_time = sum(
+                running_times.get(test.id(), default_time)
+                for test in tests
+            )
+            serialized = getattr(casecls, 'SERIALIZED', False)
+            if serialized:
+                workload = [unittest.TestSuite(tests)]
+            else:
+                workload = list(tests)
+            units.append((total_time, serialized, workload))
+
+        # Workers pick up tests in order, so scheduling the longest
+        # test classes first keeps a few giant ones from becoming the
+        # long tail of the run.  Tests of a class stay together to
+        # avoid repeating the class setup in every worker.  Without
+        # recorded times, serialized suites go first.
+        units.sort(key=lambda u: (-u[0], not u[1]))
+
+        return list(itertools.chain.from_iterable(
+            workload for _, _, workload in units))
 
 
 # Disable pickling of traceback objects in multiprocessing.
@@ -626,6 +626,12 @@ setuptools.setup(
             ["edb/server/notebook_port/protocol.pyx"],
             extra_compile_args=EXT_CFLAGS,
             extra_link_args=EXT_LDFLAGS),
+
+        distutils_extension.Extension(
+            "edb.server.metrics_port.protocol",
+            ["edb/server/metrics_port/protocol.pyx"],
+            extra_compile_args=EXT_CFLAGS,
+            extra_link_args=EXT_LDFLAGS),
     ],
     rust_extensions=rust_extensions,
     install_requires=RUNTIME_DEPS,
@@ -84,6 +84,86 @@ class ASTBaseTests(unittest.TestCase):
         assert ctree22.left.args[0].node['lconst'] is not lconst
         assert ctree22.left.args[0].node['lconst'].value == lconst.value
 
+    def test_common_ast_copy_tree(self):
+        lconst = tast.Constant(value='foo')
+        ctx = object()
+        call = tast.FunctionCall(name=('std', 'len'), args=[lconst])
+        call.context = ctx
+        tree = tast.BinOp(op='+', left=call, right=lconst)
+
+        ctree = ast.copy_tree(tree)
+        assert ctree is not tree
+        assert ast.nodes_equal(ctree, tree)
+        assert ctree.left is not call
+        assert ctree.left.args is not call.args
+        assert ctree.left.args[0] is not lconst
+        # A node referenced twice is copied once.
+        assert ctree.left.args[0] is ctree.right
+        assert ctree.left.name == ('std', 'len')
+        # Non-AST values are shared.
+        assert ctree.left.context is ctx
+
+        ctree.left.args.append(tast.Constant(value='bar'))
+        assert len(call.args) == 1
+
+    def test_common_ast_init(self):
+        class Base(ast.AST):
+            __ast_frozen_fields__ = frozenset({'frozen'})
+
+        class Node(Base):
+            items: list
+            label: str = 'node'
+            frozen: object
+            computed: object
+
+        class Derived(Node):
+            @property
+            def computed(self):
+                return self.label.upper()
+
+        n1 = Node(items=[1], unknown=2)
+        n2 = Node()
+        self.assertEqual(n1.items, [1])
+        self.assertEqual(n1.label, 'node')
+        self.assertIsNone(n1.computed)
+        self.assertFalse(hasattr(n1, 'unknown'))
+        # Default factories are called for every instance.
+        self.assertEqual(n2.items, [])
+        self.assertIsNot(n2.items, Node().items)
+
+        d = Derived(label='derived', computed='ignored')
+        self.assertEqual(d.computed, 'DERIVED')
+        self.assertEqual(d.items, [])
+
+        d.label = 'changed'
+        with self.assertRaisesRegex(TypeError, 'cannot set immutable'):
+            d.frozen = 1
+
+    def test_common_ast_visitor_dispatch(self):
+        class Visitor(ast.NodeVisitor):
+            def visit_Base(self, node):
+                return 'base'
+
+            def visit_BinOp(self, node):
+                return ['binop'] + self.generic_visit(node)
+
+        class ConstVisitor(Visitor):
+            def visit_Constant(self, node):
+                return 'const'
+
+        tree = tast.BinOp(
+            op='+',
+            left=tast.Constant(value=1),
+            right=tast.FunctionCall(args=[tast.Constant(value=2)]),
+        )
+
+        for _ in range(2):
+            self.assertEqual(Visitor.run(tree), ['binop', 'base', 'base'])
+            self.assertEqual(
+                ConstVisitor.run(tree), ['binop', 'const', 'base'])
+
+        self.assertEqual(ast.NodeVisitor.run(tree), [[], [[]]])
+
     @unittest.mock.patch(
         'edb.common.ast.base._check_type',
         ast.base._check_type_real,
@@ -0,0 +1,75 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+
+import random
+import unittest
+
+from edb.common import histogram
+
+
+class LogHistogramTests(unittest.TestCase):
+
+    def test_histogram_01(self):
+        h = histogram.LogHistogram()
+        values = [random.uniform(0.0001, 2.0) for _ in range(10000)]
+        for v in values:
+            h.record(v)
+
+        values.sort()
+        self.assertEqual(h.count, len(values))
+        self.assertEqual(h.min, values[0])
+        self.assertEqual(h.max, values[-1])
+        self.assertAlmostEqual(h.sum, sum(values))
+
+        for q, approx in zip((0.5, 0.9, 0.99), h.quantiles((0.5, 0.9, 0.99))):
+            exact = values[int(q * len(values)) - 1]
+            self.assertLess(abs(approx - exact) / exact, 0.05)
+
+    def test_histogram_02(self):
+        a = histogram.LogHistogram()
+        b = histogram.LogHistogram()
+        for _ in range(10):
+            a.record(0.001)
+            b.record(1.0)
+
+        a.merge(b)
+        self.assertEqual(a.count, 20)
+        self.assertEqual(a.min, 0.001)
+        self.assertEqual(a.max, 1.0)
+        self.assertAlmostEqual(a.quantile(0.25), 0.001, places=4)
+        self.assertAlmostEqual(a.quantile(0.75), 1.0, delta=0.01)
+
+        a.reset()
+        self.assertEqual(a.count, 0)
+        self.assertEqual(a.quantiles((0.5, 0.9)), [0.0, 0.0])
+
+        with self.assertRaisesRegex(ValueError, 'different layouts'):
+            a.merge(histogram.LogHistogram(precision=0.1))
+
+    def test_histogram_03(self):
+        h = histogram.LogHistogram(min_value=0.001, max_value=1.0)
+        # Out of range values are clamped to the edge buckets,
+        # but min and max are tracked exactly.
+        h.record(0.0)
+        h.record(100.0)
+        self.assertEqual(h.min, 0.0)
+        self.assertEqual(h.max, 100.0)
+        self.assertEqual(h.quantile(0.0), 0.001)
+        self.assertLessEqual(h.quantile(1.0), 100.0)
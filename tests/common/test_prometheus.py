@@ -0,0 +1,83 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+
+import unittest
+
+from edb.common import prometheus as prom
+
+
+class PrometheusTests(unittest.TestCase):
+
+    def test_prometheus_01(self):
+        r = prom.Registry(prefix='edgedb')
+        c = r.new_counter('conns_total', 'Total connections')
+        g = r.new_gauge('conns', 'Current "connections"', labels=('port',))
+
+        c.inc()
+        c.inc(2)
+        g.inc(1, 'mng')
+        g.inc(2, 'http')
+        g.dec(1, 'http')
+
+        self.assertEqual(c.get(), 3)
+        self.assertEqual(
+            r.generate(),
+            '# HELP edgedb_conns_total Total connections\n'
+            '# TYPE edgedb_conns_total counter\n'
+            'edgedb_conns_total 3\n'
+            '# HELP edgedb_conns Current "connections"\n'
+            '# TYPE edgedb_conns gauge\n'
+            'edgedb_conns{port="http"} 1\n'
+            'edgedb_conns{port="mng"} 1\n'
+        )
+
+    def test_prometheus_02(self):
+        r = prom.Registry()
+        h = r.new_histogram(
+            'latency', 'Latency', unit='seconds', buckets=[0.1, 1.0])
+
+        h.observe(0.05)
+        h.observe(0.1)
+        h.observe(0.5)
+        h.observe(5)
+
+        self.assertEqual(
+            r.generate(),
+            '# HELP latency_seconds Latency\n'
+            '# TYPE latency_seconds histogram\n'
+            'latency_seconds_bucket{le="0.1"} 2\n'
+            'latency_seconds_bucket{le="1.0"} 3\n'
+            'latency_seconds_bucket{le="+Inf"} 4\n'
+            'latency_seconds_sum 5.65\n'
+            'latency_seconds_count 4\n'
+        )
+
+    def test_prometheus_03(self):
+        r = prom.Registry()
+        c = r.new_counter('c', 'C', labels=('a',))
+
+        with self.assertRaisesRegex(ValueError, 'expects 1 label'):
+            c.inc(1)
+
+        with self.assertRaisesRegex(ValueError, 'cannot be decremented'):
+            c.inc(-1, 'x')
+
+        with self.assertRaisesRegex(ValueError, 'already registered'):
+            r.new_gauge('c', 'C')
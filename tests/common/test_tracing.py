@@ -0,0 +1,154 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from edb.common import tracing
+
+
+class ListExporter(tracing.Exporter):
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(list(spans))
+
+
+class TracingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = ListExporter()
+        tracing.configure(sample_rate=1.0, exporter=self.exporter)
+
+    def tearDown(self):
+        tracing.configure(sample_rate=0.0, exporter=None)
+
+    def test_tracing_01(self):
+        with tracing.trace('root', db='main') as root:
+            with tracing.span('child') as child:
+                with tracing.span('grandchild') as grandchild:
+                    pass
+
+        self.assertEqual(len(self.exporter.traces), 1)
+        spans = {s.name: s for s in self.exporter.traces[0]}
+        self.assertEqual(set(spans), {'root', 'child', 'grandchild'})
+
+        self.assertIsNone(root.parent_id)
+        self.assertEqual(child.parent_id, root.span_id)
+        self.assertEqual(grandchild.parent_id, child.span_id)
+        self.assertEqual(root.attributes, {'db': 'main'})
+        for s in spans.values():
+            self.assertEqual(s.trace_id, root.trace_id)
+            self.assertGreaterEqual(s.duration_ns, 0)
+        self.assertLessEqual(root.start_ns, child.start_ns)
+        self.assertGreaterEqual(root.end_ns, child.end_ns)
+
+    def test_tracing_02(self):
+        # Spans outside of a trace and unsampled traces are not recorded.
+        with tracing.span('orphan') as s:
+            self.assertIsNone(s)
+
+        tracing.configure(sample_rate=0.0, exporter=self.exporter)
+        with tracing.trace('root') as root:
+            self.assertIsNone(root)
+            self.assertIsNone(tracing.get_context())
+            with tracing.span('child') as child:
+                self.assertIsNone(child)
+
+        self.assertEqual(self.exporter.traces, [])
+
+    def test_tracing_03(self):
+        with self.assertRaises(ZeroDivisionError):
+            with tracing.trace('root'):
+                with tracing.span('child'):
+                    1 / 0
+
+        spans = {s.name: s for s in self.exporter.traces[0]}
+        self.assertEqual(spans['child'].attributes,
+                         {'error': 'ZeroDivisionError'})
+        self.assertEqual(spans['root'].attributes,
+                         {'error': 'ZeroDivisionError'})
+
+    def test_tracing_04(self):
+        # Propagate the context to a "remote" collector, as the
+        # compiler pool does.
+        with tracing.trace('root') as root:
+            with tracing.span('call') as call:
+                ctx = pickle.loads(pickle.dumps(tracing.get_context()))
+
+                with tracing.collect(ctx) as collected:
+                    with tracing.span('remote'):
+                        pass
+                with tracing.collect(None) as unsampled:
+                    with tracing.span('remote'):
+                        pass
+
+                self.assertEqual(unsampled.spans, [])
+                spans = pickle.loads(pickle.dumps(collected.spans))
+                tracing.add_remote_spans(spans)
+
+        self.assertEqual(len(spans), 1)
+        exported = {s.name: s for s in self.exporter.traces[0]}
+        self.assertEqual(set(exported), {'root', 'call', 'remote'})
+
+        remote = exported['remote']
+        self.assertEqual(remote.trace_id, root.trace_id)
+        self.assertEqual(remote.parent_id, call.span_id)
+
+    def test_tracing_05(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, 'trace.json')
+            tracing.configure(
+                sample_rate=1.0, exporter=tracing.JSONFileExporter(path))
+
+            with tracing.trace('root', db='main'):
+                with tracing.span('child', rows=3):
+                    pass
+            with tracing.trace('root'):
+                pass
+
+            tracing.configure(sample_rate=0.0, exporter=None)
+
+            with open(path) as f:
+                docs = [json.loads(line) for line in f]
+
+        self.assertEqual(len(docs), 2)
+        spans = docs[0]['resourceSpans'][0]['scopeSpans'][0]['spans']
+        spans = {s['name']: s for s in spans}
+        root, child = spans['root'], spans['child']
+        self.assertEqual(len(root['traceId']), 32)
+        self.assertEqual(len(root['spanId']), 16)
+        self.assertEqual(root['parentSpanId'], '')
+        self.assertEqual(child['parentSpanId'], root['spanId'])
+        self.assertEqual(child['traceId'], root['traceId'])
+        self.assertEqual(
+            root['attributes'],
+            [{'key': 'db', 'value': {'stringValue': 'main'}}])
+        self.assertEqual(
+            child['attributes'],
+            [{'key': 'rows', 'value': {'intValue': '3'}}])
+        self.assertLessEqual(
+            int(root['startTimeUnixNano']), int(child['startTimeUnixNano']))
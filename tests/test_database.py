@@ -53,3 +53,47 @@ class TestDatabase(tb.ConnectedTestCase):
                                     r'characters are not supported'):
             await self.con.execute(
                 f'CREATE DATABASE mytestdb_{"x" * s_def.MAX_NAME_LENGTH};')
+
+    async def test_database_create_03(self):
+        await self.con.execute('CREATE DATABASE mytestdb_tpl;')
+
+        try:
+            conn = await self.connect(database='mytestdb_tpl')
+            try:
+                await conn.execute('''
+                    CREATE TYPE test::Foo {
+                        CREATE PROPERTY name -> str;
+                    };
+                    INSERT test::Foo { name := 'foo' };
+                ''')
+            finally:
+                await conn.aclose()
+
+            await self.con.execute('''
+                CREATE DATABASE mytestdb_copy {
+                    SET template := 'mytestdb_tpl'
+                };
+            ''')
+
+            try:
+                conn = await self.connect(database='mytestdb_copy')
+                try:
+                    names = await conn.fetchall('SELECT test::Foo.name;')
+                    self.assertEqual(names, ['foo'])
+                finally:
+                    await conn.aclose()
+            finally:
+                await self.con.execute('DROP DATABASE mytestdb_copy;')
+        finally:
+            await self.con.execute('DROP DATABASE mytestdb_tpl;')
+
+    async def test_database_create_04(self):
+        for template in ('edgedb0', 'template1'):
+            with self.assertRaisesRegex(
+                    edgedb.InvalidDatabaseDefinitionError,
+                    f'{template!r} cannot be used as a template database'):
+                await self.con.execute(f'''
+                    CREATE DATABASE mytestdb_bad {{
+                        SET template := {template!r}
+                    }};
+                ''')
@@ -0,0 +1,91 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2012-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os.path
+
+import edgedb
+
+from edb.testbase import server as tb
+
+
+class TestEdgeQLExplain(tb.QueryTestCase):
+    SCHEMA = os.path.join(os.path.dirname(__file__), 'schemas',
+                          'issues.esdl')
+
+    SETUP = os.path.join(os.path.dirname(__file__), 'schemas',
+                         'issues_setup.edgeql')
+
+    async def test_edgeql_explain_01(self):
+        plan = await self.con.fetchall(r'''
+            EXPLAIN
+            WITH MODULE test
+            SELECT User { name } FILTER .name = 'Elvis';
+        ''')
+
+        self.assertTrue(plan)
+        self.assertIn('cost=', plan[0])
+        self.assertNotIn('actual time=', plan[0])
+        self.assertTrue(
+            any(line.strip() == 'EdgeQL: User' for line in plan),
+            'no EdgeQL annotations in the plan:\n' + '\n'.join(plan))
+
+    async def test_edgeql_explain_02(self):
+        plan = await self.con.fetchall(r'''
+            EXPLAIN ANALYZE
+            WITH MODULE test
+            SELECT Issue {
+                name,
+                owner: { name },
+                watchers: { name },
+            } FILTER .number = <str>$number;
+        ''', number='1')
+
+        self.assertIn('actual time=', plan[0])
+        self.assertTrue(plan[-1].startswith('Execution Time: '))
+
+    async def test_edgeql_explain_03(self):
+        async with self._run_and_rollback():
+            await self.con.fetchall(r'''
+                EXPLAIN ANALYZE
+                WITH MODULE test
+                INSERT User { name := 'Explained' };
+            ''')
+
+            await self.assert_query_result(
+                r'''
+                    WITH MODULE test
+                    SELECT User { name } FILTER .name = 'Explained';
+                ''',
+                [{'name': 'Explained'}],
+            )
+
+        await self.assert_query_result(
+            r'''
+                WITH MODULE test
+                SELECT User FILTER .name = 'Explained';
+            ''',
+            [],
+        )
+
+    async def test_edgeql_explain_04(self):
+        with self.assertRaisesRegex(
+                edgedb.ResultCardinalityMismatchError,
+                r'EXPLAIN returns a set of plan lines'):
+            await self.con.fetchone(r'''
+                EXPLAIN SELECT 1;
+            ''')
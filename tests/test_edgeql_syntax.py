@@ -3923,3 +3923,26 @@ aa';
         """
         DESCRIBE TYPE foo::Bar AS DDL VERBOSE;
         """
+
+    def test_edgeql_syntax_explain_01(self):
+        """
+        EXPLAIN SELECT User { name } FILTER (.name = 'Alice');
+        """
+
+    def test_edgeql_syntax_explain_02(self):
+        """
+        EXPLAIN ANALYZE WITH x := 1 SELECT x;
+        """
+
+    def test_edgeql_syntax_explain_03(self):
+        """
+        EXPLAIN ANALYZE INSERT User { name := 'Bob' };
+        """
+
+    @tb.must_fail(errors.EdgeQLSyntaxError,
+                  r"Unexpected 'CREATE'",
+                  line=2, col=17)
+    def test_edgeql_syntax_explain_04(self):
+        """
+        EXPLAIN CREATE TYPE Foo;
+        """
@@ -2525,3 +2525,53 @@ class TestGraphQLSchema(tb.GraphQLTestCase):
                 "description": 'Test type "Foo"',
             }
         })
+
+    def test_graphql_schema_introspection_cache_01(self):
+        # The same introspection query with different literals must
+        # not be answered from the same cached response.
+        for _ in range(2):
+            self.assert_graphql_query_result(r"""
+                query {
+                    __type(name: "User") {
+                        name
+                        kind
+                    }
+                }
+            """, {
+                "__type": {
+                    "kind": "INTERFACE",
+                    "name": "User",
+                }
+            })
+
+            self.assert_graphql_query_result(r"""
+                query {
+                    __type(name: "User_Type") {
+                        name
+                        kind
+                    }
+                }
+            """, {
+                "__type": {
+                    "kind": "OBJECT",
+                    "name": "User_Type",
+                }
+            })
+
+    def test_graphql_schema_introspection_cache_02(self):
+        for name in ['User', 'other__Foo', 'User']:
+            self.assert_graphql_query_result(r"""
+                query q($name: String!) {
+                    ...TypeInfo
+                }
+
+                fragment TypeInfo on Query {
+                    __type(name: $name) {
+                        name
+                    }
+                }
+            """, {
+                "__type": {
+                    "name": name,
+                }
+            }, variables={'name': name})
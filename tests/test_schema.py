@@ -23,6 +23,7 @@ from edb import errors
 
 from edb.common import markup
 from edb.testbase import lang as tb
+from edb.testbase import schemagen
 
 from edb import edgeql
 from edb.edgeql import compiler as qlcompiler
@@ -32,7 +33,10 @@ from edb.edgeql import qltypes
 from edb.schema import delta as s_delta
 from edb.schema import ddl as s_ddl
 from edb.schema import links as s_links
+from edb.schema import modules as s_mod
+from edb.schema import objects as s_obj
 from edb.schema import objtypes as s_objtypes
+from edb.schema import types as s_types
 
 from edb.tools import test
 
@@ -1067,6 +1071,64 @@ _123456789_123456789_123456789 -> str
             )
         )
 
+    def test_schema_get_objects_indexes(self):
+        schema = self.load_schema("""
+            type A {
+                property name -> str;
+            }
+            type B extending A;
+            scalar type S extending str;
+        """)
+
+        schema = self.run_ddl(schema, '''
+            CREATE MODULE other;
+            DROP TYPE test::B;
+            ALTER TYPE test::A RENAME TO test::C;
+            CREATE TYPE other::D;
+        ''')
+
+        def names(objs):
+            return {str(obj.get_name(schema)) for obj in objs}
+
+        def scan(*filters):
+            return names(schema.get_objects(extra_filters=filters))
+
+        def in_module(module):
+            return lambda schema, obj: (
+                isinstance(obj, s_obj.QualifiedObject)
+                and obj.get_name(schema).module == module
+            )
+
+        def of_type(cls):
+            return lambda schema, obj: isinstance(obj, cls)
+
+        # The indexed lookups must agree with a full scan.
+        for module in ('test', 'other', 'std'):
+            self.assertEqual(
+                names(schema.get_objects(included_modules=[module])),
+                scan(in_module(module)),
+            )
+            self.assertEqual(
+                names(schema.get_objects(
+                    type=s_objtypes.ObjectType, included_modules=[module])),
+                scan(in_module(module), of_type(s_objtypes.ObjectType)),
+            )
+
+        for cls in (s_objtypes.ObjectType, s_types.Type, s_mod.Module):
+            self.assertEqual(
+                names(schema.get_objects(type=cls)),
+                scan(of_type(cls)),
+            )
+
+        self.assertEqual(
+            names(schema.get_objects(
+                type=s_objtypes.ObjectType,
+                included_modules=['test', 'other'],
+            )),
+            {'test::C', 'other::D'},
+        )
+        self.assertIn('other', names(schema.get_modules()))
+
 
 class TestGetMigration(tb.BaseSchemaLoadTest):
     """Test migration deparse consistency.
@@ -3839,6 +3901,13 @@ class TestGetMigration(tb.BaseSchemaLoadTest):
             alias CollAlias := (a := Base.name, b := Base.foo);
         """])
 
+    def test_migrations_equivalence_large_01(self):
+        # generated schema exercising many interdependent objects
+        self._assert_migration_equivalence([
+            schemagen.generate_schema(50),
+            schemagen.generate_schema(50, migrated=True),
+        ])
+
 
 class TestDescribe(tb.BaseSchemaLoadTest):
     """Test the DESCRIBE command."""
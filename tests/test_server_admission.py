@@ -0,0 +1,161 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import unittest
+import unittest.mock
+
+from edb import errors
+from edb.server import admission
+
+
+class TestAdmission(unittest.TestCase):
+
+    def run_async(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_admission_priority(self):
+        async def test():
+            slots = admission.Slots(1)
+            order = []
+
+            async def worker(name, priority):
+                self.assertTrue(await slots.acquire(priority, 10))
+                order.append(name)
+                await asyncio.sleep(0)
+                slots.release()
+
+            self.assertTrue(await slots.acquire(admission.Priority.NORMAL, 0))
+            tasks = [
+                asyncio.ensure_future(worker('n1', admission.Priority.NORMAL)),
+                asyncio.ensure_future(worker('h1', admission.Priority.HIGH)),
+                asyncio.ensure_future(worker('n2', admission.Priority.NORMAL)),
+                asyncio.ensure_future(worker('h2', admission.Priority.HIGH)),
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual(slots.queued, 4)
+            slots.release()
+            await asyncio.gather(*tasks)
+
+            self.assertEqual(order, ['h1', 'h2', 'n1', 'n2'])
+            self.assertTrue(slots.is_idle())
+
+        self.run_async(test())
+
+    def test_admission_timeout(self):
+        async def test():
+            ctl = admission.AdmissionController(
+                limits={'execute': (2, 1)}, timeout=0.05)
+
+            async with ctl.admit('execute', dbname='db', role='r1'):
+                # Limited by the role.
+                with self.assertRaises(errors.BackendUnavailableError):
+                    async with ctl.admit('execute', dbname='db', role='r1'):
+                        pass
+
+                async with ctl.admit('execute', dbname='db', role='r2'):
+                    # Limited by the database.
+                    with self.assertRaisesRegex(
+                            errors.BackendUnavailableError, "database 'db'"):
+                        async with ctl.admit(
+                                'execute', dbname='db', role='r3'):
+                            pass
+
+                # Other databases and kinds are not affected.
+                async with ctl.admit('execute', dbname='db2', role='r3'):
+                    pass
+                async with ctl.admit('compile', dbname='db', role='r1'):
+                    pass
+
+                # Exempt work is neither queued nor counted.
+                async with ctl.admit(
+                        'execute', dbname='db', role='r1', exempt=True):
+                    self.assertEqual(
+                        [s['active'] for s in ctl.get_stats()], [1, 1])
+
+            self.assertEqual(ctl.get_stats(), [])
+
+        self.run_async(test())
+
+    def test_admission_slots_timeout(self):
+        async def test():
+            slots = admission.Slots(1)
+            self.assertTrue(await slots.acquire(admission.Priority.NORMAL, 0))
+
+            self.assertFalse(
+                await slots.acquire(admission.Priority.NORMAL, 0.01))
+            self.assertEqual(slots.queued, 0)
+            self.assertEqual(slots.active, 1)
+
+            # The timed out waiter must not be handed the slot.
+            slots.release()
+            self.assertTrue(slots.is_idle())
+
+        self.run_async(test())
+
+    def test_admission_slots_timeout_race(self):
+        async def test():
+            slots = admission.Slots(1)
+            self.assertTrue(await slots.acquire(admission.Priority.NORMAL, 0))
+
+            async def wait_for(fut, timeout):
+                # The slot is handed over right as the wait times out.
+                slots.release()
+                raise asyncio.TimeoutError
+
+            with unittest.mock.patch.object(
+                    admission.asyncio, 'wait_for', wait_for):
+                self.assertTrue(
+                    await slots.acquire(admission.Priority.NORMAL, 10))
+
+            self.assertEqual(slots.queued, 0)
+            self.assertEqual(slots.active, 1)
+            slots.release()
+            self.assertTrue(slots.is_idle())
+
+        self.run_async(test())
+
+    def test_admission_cancel(self):
+        async def test():
+            ctl = admission.AdmissionController(
+                limits={'compile': (1, 0)}, timeout=10)
+            entered = []
+
+            async def admit(name):
+                async with ctl.admit('compile', dbname='db', role='r'):
+                    entered.append(name)
+                    await asyncio.sleep(0)
+
+            async with ctl.admit('compile', dbname='db', role='r'):
+                t1 = asyncio.ensure_future(admit('t1'))
+                t2 = asyncio.ensure_future(admit('t2'))
+                await asyncio.sleep(0)
+                t1.cancel()
+                await asyncio.sleep(0)
+
+            await t2
+            self.assertTrue(t1.cancelled())
+            self.assertEqual(entered, ['t2'])
+            self.assertEqual(ctl.get_stats(), [])
+
+        self.run_async(test())
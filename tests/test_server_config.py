@@ -28,6 +28,7 @@ import edgedb
 
 from edb import errors
 
+from edb.testbase import lang as tb_lang
 from edb.testbase import server as tb
 from edb.schema import objects as s_obj
 
@@ -312,6 +313,19 @@ class TestServerConfigUtils(unittest.TestCase):
             }
         )
 
+    def test_server_config_06(self):
+        # Load the actual config spec from the standard library.
+        cfgspec = spec.load_spec_from_schema(tb_lang._load_std_schema())
+        config.set_settings(cfgspec)
+
+        port_type = cfgspec['ports'].type
+        port = port_type.from_pyvalue(make_port_value(min_concurrency=2))
+        self.assertEqual(port.min_concurrency, 2)
+        self.assertEqual(port.address, frozenset({'localhost'}))
+
+        port = port_type.from_pyvalue(make_port_value())
+        self.assertIsNone(port.min_concurrency)
+
 
 class TestServerConfig(tb.QueryTestCase, tb.OldCLITestCaseMixin):
 
@@ -740,6 +754,40 @@ class TestServerConfig(tb.QueryTestCase, tb.OldCLITestCaseMixin):
                 CONFIGURE SYSTEM RESET multiprop;
             ''')
 
+    async def test_server_proto_configure_07(self):
+        try:
+            await self.con.execute('''
+                CONFIGURE SESSION SET statement_timeout := '100ms';
+            ''')
+
+            await self.assert_query_result(
+                '''
+                SELECT cfg::Config.statement_timeout
+                ''',
+                [
+                    '100ms'
+                ],
+            )
+
+            with self.assertRaisesRegex(
+                    edgedb.QueryTimeoutError,
+                    'canceling statement due to statement timeout'):
+                await self.con.fetchall('SELECT sys::sleep(10)')
+
+            # The connection is still usable.
+            await self.assert_query_result(
+                '''
+                SELECT sys::sleep(0.01)
+                ''',
+                [
+                    True
+                ],
+            )
+        finally:
+            await self.con.execute('''
+                CONFIGURE SESSION RESET statement_timeout;
+            ''')
+
     async def test_server_version(self):
         srv_ver = await self.con.fetchone(r"""
             SELECT sys::get_version()
@@ -0,0 +1,226 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import itertools
+
+from edb.server.http import pool
+from edb.testbase import server as tb
+
+
+class TestElasticPool(tb.TestCase):
+
+    def make_pool(self, *, min_size, max_size,
+                  grow_after=0.01, idle_timeout=60, recycle=None):
+        counter = itertools.count()
+        closed = []
+
+        async def connect():
+            return next(counter)
+
+        async def disconnect(obj):
+            closed.append(obj)
+
+        p = pool.ElasticPool(
+            name='test',
+            min_size=min_size,
+            max_size=max_size,
+            connect=connect,
+            disconnect=disconnect,
+            grow_after=grow_after,
+            idle_timeout=idle_timeout,
+            recycle=recycle,
+        )
+        return p, closed
+
+    async def test_server_pool_01(self):
+        p, closed = self.make_pool(min_size=2, max_size=2)
+        await p.start()
+        try:
+            self.assertEqual(p.size, 2)
+
+            a = await p.get()
+            b = await p.get()
+            self.assertNotEqual(a, b)
+
+            waiter = asyncio.create_task(p.get())
+            await asyncio.sleep(0.05)
+            # The pool is at its max size, so it must not grow.
+            self.assertFalse(waiter.done())
+            self.assertEqual(p.size, 2)
+
+            p.put_nowait(a)
+            self.assertEqual(await waiter, a)
+            p.put_nowait(a)
+            p.put_nowait(b)
+        finally:
+            await p.stop()
+
+        self.assertEqual(sorted(closed), [0, 1])
+
+    async def test_server_pool_02(self):
+        p, closed = self.make_pool(min_size=1, max_size=3)
+        await p.start()
+        try:
+            a = await p.get()
+            # No free objects: the pool grows after a short wait.
+            b = await asyncio.wait_for(p.get(), timeout=5)
+            self.assertNotEqual(a, b)
+            self.assertEqual(p.size, 2)
+            self.assertEqual(p.get_stats()['wait_count'], 1)
+
+            p.put_nowait(a)
+            p.put_nowait(b)
+            # LIFO: the most recently released object is reused first.
+            self.assertEqual(await p.get(), b)
+            p.put_nowait(b)
+        finally:
+            await p.stop()
+
+    async def test_server_pool_03(self):
+        p, closed = self.make_pool(min_size=1, max_size=3, idle_timeout=0.1)
+        await p.start()
+        try:
+            a = await p.get()
+            b = await asyncio.wait_for(p.get(), timeout=5)
+            p.put_nowait(a)
+            p.put_nowait(b)
+            self.assertEqual(p.size, 2)
+
+            await asyncio.sleep(0.3)
+            # Idle objects are closed down to the minimum size.
+            self.assertEqual(p.size, 1)
+            self.assertEqual(len(closed), 1)
+        finally:
+            await p.stop()
+
+    async def test_server_pool_04(self):
+        with self.assertRaisesRegex(ValueError, 'invalid test pool'):
+            self.make_pool(min_size=3, max_size=2)
+
+    async def test_server_pool_05(self):
+        recycled = set()
+        p, closed = self.make_pool(
+            min_size=2, max_size=2, recycle=lambda obj: obj in recycled)
+        await p.start()
+        try:
+            a = await p.get()
+            b = await p.get()
+
+            # An idle object is closed once its replacement is ready.
+            recycled.add(a)
+            p.put_nowait(a)
+            await asyncio.sleep(0.05)
+            c = await p.get()
+            self.assertEqual(c, 2)
+            self.assertEqual(closed, [a])
+            self.assertEqual(p.size, 2)
+
+            # An object that is in use when its replacement becomes
+            # ready is closed when it's put back.
+            recycled.add(b)
+            p.put_nowait(b)
+            b = await p.get()
+            self.assertIn(b, recycled)
+            await asyncio.sleep(0.05)
+            self.assertEqual(p.idle, 1)
+            p.put_nowait(b)
+            await asyncio.sleep(0)
+            self.assertEqual(closed, [a, b])
+            self.assertEqual(p.size, 2)
+
+            p.put_nowait(c)
+        finally:
+            await p.stop()
+
+    async def test_server_pool_06(self):
+        p, closed = self.make_pool(min_size=2, max_size=3)
+        await p.start(lazy=True)
+        try:
+            self.assertEqual(p.size, 0)
+
+            # The first get() fills the pool up to its min size.
+            a = await p.get()
+            await asyncio.sleep(0)
+            self.assertEqual(p.size, 2)
+            self.assertEqual(p.idle, 1)
+            p.put_nowait(a)
+        finally:
+            await p.stop()
+
+        self.assertEqual(sorted(closed), [0, 1])
+
+    async def test_server_pool_07(self):
+        async def connect():
+            raise RuntimeError('cannot connect')
+
+        async def disconnect(obj):
+            pass
+
+        p = pool.ElasticPool(
+            name='test',
+            min_size=1,
+            max_size=1,
+            connect=connect,
+            disconnect=disconnect,
+            grow_after=0.01,
+            idle_timeout=60,
+        )
+        await p.start(lazy=True)
+        try:
+            with self.assertRaisesRegex(RuntimeError, 'cannot connect'):
+                await p.get()
+            self.assertEqual(p.waiting, 0)
+        finally:
+            await p.stop()
+
+    async def test_server_pool_08(self):
+        attempts = 0
+
+        async def connect():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise asyncio.CancelledError
+            return attempts
+
+        async def disconnect(obj):
+            pass
+
+        p = pool.ElasticPool(
+            name='test',
+            min_size=1,
+            max_size=1,
+            connect=connect,
+            disconnect=disconnect,
+            grow_after=0.01,
+            idle_timeout=60,
+        )
+        await p.start(lazy=True)
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(p.get(), timeout=0.1)
+            # A cancelled connection attempt must not count against
+            # the max size of the pool.
+            a = await asyncio.wait_for(p.get(), timeout=5)
+            self.assertEqual(a, 2)
+            self.assertEqual(p.size, 1)
+            p.put_nowait(a)
+        finally:
+            await p.stop()
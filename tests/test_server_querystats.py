@@ -0,0 +1,75 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from edb.server import querystats
+
+
+class TestQueryStats(unittest.TestCase):
+
+    def test_querystats_aggregate(self):
+        stats = querystats.QueryStats(maxsize=10)
+
+        stats.record_compilation('SELECT 1', 0.5)
+        stats.record_execution(
+            'SELECT 1', 0.1, rows=1, cached=False, error=False)
+        stats.record_execution(
+            'SELECT 1', 0.3, rows=1, cached=True, error=False)
+        stats.record_execution(
+            'SELECT 1', 0.2, rows=0, cached=True, error=True)
+
+        [entry] = stats.as_list()
+        self.assertEqual(entry['query'], 'SELECT 1')
+        self.assertEqual(entry['calls'], 3)
+        self.assertEqual(entry['errors'], 1)
+        self.assertEqual(entry['rows'], 2)
+        self.assertEqual(entry['compilations'], 1)
+        self.assertAlmostEqual(entry['total_compile_time'], 0.5)
+        self.assertAlmostEqual(entry['total_exec_time'], 0.6)
+        self.assertAlmostEqual(entry['mean_exec_time'], 0.2)
+        self.assertAlmostEqual(entry['max_exec_time'], 0.3)
+        self.assertAlmostEqual(entry['cache_hit_ratio'], 2 / 3)
+
+    def test_querystats_order(self):
+        stats = querystats.QueryStats(maxsize=10)
+        stats.record_execution(
+            'fast', 0.1, rows=0, cached=True, error=False)
+        stats.record_execution(
+            'slow', 1.0, rows=0, cached=True, error=False)
+
+        self.assertEqual(
+            [e['query'] for e in stats.as_list()], ['slow', 'fast'])
+
+    def test_querystats_bounded(self):
+        stats = querystats.QueryStats(maxsize=2)
+        for q in ('a', 'b', 'a', 'c'):
+            stats.record_execution(
+                q, 0.1, rows=0, cached=True, error=False)
+
+        # 'b' is the least recently executed query.
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(
+            {e['query'] for e in stats.as_list()}, {'a', 'c'})
+
+    def test_querystats_reset(self):
+        stats = querystats.QueryStats(maxsize=2)
+        stats.record_compilation('a', 0.1)
+        stats.reset()
+        self.assertEqual(len(stats), 0)
+        self.assertEqual(stats.as_list(), [])
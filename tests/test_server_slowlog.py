@@ -0,0 +1,60 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from edb.server import slowlog
+
+
+class TestSlowQueryLog(unittest.TestCase):
+
+    def test_slowlog_threshold(self):
+        log = slowlog.SlowQueryLog(rate_limit=1)
+        self.assertFalse(log.is_slow(10.0, None))
+        self.assertFalse(log.is_slow(10.0, -1))
+        self.assertFalse(log.is_slow(0.099, 100))
+        self.assertTrue(log.is_slow(0.1, 100))
+        self.assertTrue(log.is_slow(0.0, 0))
+
+    def test_slowlog_rate_limit(self):
+        log = slowlog.SlowQueryLog(rate_limit=2, interval=3600)
+        self.assertTrue(log.acquire())
+        self.assertTrue(log.acquire())
+        self.assertFalse(log.acquire())
+        self.assertFalse(log.acquire())
+
+        with self.assertLogs('edb.server.slowlog') as cm:
+            log.log(dbname='db', query='SELECT 1', sql=[b'SELECT 1'],
+                    duration=0.5, args='none')
+        self.assertIn('2 more slow queries', cm.output[0])
+
+        with self.assertLogs('edb.server.slowlog') as cm:
+            log.log(dbname='db', query='SELECT 1', sql=[b'SELECT 1'],
+                    duration=0.5, args='none', plan='Result')
+        self.assertNotIn('more slow queries', cm.output[0])
+        self.assertIn('Plan:\nResult', cm.output[0])
+
+        log = slowlog.SlowQueryLog(rate_limit=1, interval=0)
+        self.assertTrue(log.acquire())
+        self.assertTrue(log.acquire())
+
+    def test_slowlog_describe_args(self):
+        self.assertEqual(slowlog.describe_args([], 0, 4), 'none')
+        self.assertEqual(
+            slowlog.describe_args(['name', 'age'], 2, 40),
+            '$name, $age; 2 extracted constants (40 bytes)')
@@ -0,0 +1,86 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import json
+import pickle
+import tempfile
+import unittest
+
+from edb.server import stdcache
+
+
+class FakeConnection:
+
+    def __init__(self, data):
+        self.data = data
+        self.queries = []
+
+    async def simple_query(self, sql, ignore_data):
+        self.queries.append(sql)
+        key = sql.decode().split('__syscache_')[1].split('(')[0]
+        value = self.data[key]
+        if key in stdcache.PICKLE_KEYS:
+            return [[b'\\x' + value.hex().encode()]]
+        else:
+            return [[value]]
+
+
+class TestStdCache(unittest.TestCase):
+
+    def test_server_stdcache_01(self):
+        data = {
+            'stdschema': pickle.dumps({'std': 1}),
+            'reflschema': pickle.dumps({'refl': 2}),
+            'classlayout': pickle.dumps([1, 2, 3]),
+            'introquery': json.dumps('SELECT 1').encode(),
+        }
+
+        with tempfile.TemporaryDirectory() as td:
+            cache_dir = stdcache.get_cache_dir(td)
+            self.assertIsNone(stdcache.load(cache_dir, 'stdschema'))
+
+            conn = FakeConnection(data)
+            asyncio.run(stdcache.materialize(conn, cache_dir))
+            self.assertEqual(len(conn.queries), 4)
+
+            self.assertEqual(
+                stdcache.load(cache_dir, 'stdschema'), {'std': 1})
+            self.assertEqual(
+                stdcache.load(cache_dir, 'reflschema'), {'refl': 2})
+            self.assertEqual(
+                stdcache.load(cache_dir, 'classlayout'), [1, 2, 3])
+            self.assertEqual(
+                stdcache.load(cache_dir, 'introquery'), 'SELECT 1')
+
+            # Existing entries are not fetched again.
+            conn = FakeConnection(data)
+            asyncio.run(stdcache.materialize(conn, cache_dir))
+            self.assertEqual(conn.queries, [])
+
+    def test_server_stdcache_02(self):
+        self.assertIsNone(stdcache.load(None, 'stdschema'))
+
+        with tempfile.TemporaryDirectory() as td:
+            cache_dir = stdcache.get_cache_dir(td)
+            cache_dir.mkdir()
+            (cache_dir / 'stdschema').write_bytes(b'garbage')
+
+            with self.assertRaisesRegex(RuntimeError, 'cached std data'):
+                stdcache.load(cache_dir, 'stdschema')
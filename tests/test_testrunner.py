@@ -0,0 +1,155 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2020-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import io
+import os
+import tempfile
+import types
+import unittest
+
+from edb.tools.test import runner
+
+
+# Not defined at the module level, so that they are not collected.
+class tcases:
+
+    class Fast(unittest.TestCase):
+
+        def test_1(self):
+            pass
+
+        def test_2(self):
+            pass
+
+    class Slow(unittest.TestCase):
+
+        def test_1(self):
+            pass
+
+        def test_2(self):
+            pass
+
+    class Serialized(unittest.TestCase):
+
+        SERIALIZED = True
+
+        def test_1(self):
+            pass
+
+
+def _tests(casecls):
+    loader = unittest.TestLoader()
+    return [casecls(name) for name in loader.getTestCaseNames(casecls)]
+
+
+class TestTestRunner(unittest.TestCase):
+
+    def make_runner(self, running_times_log_file=None):
+        return runner.ParallelTextTestRunner(
+            stream=io.StringIO(),
+            verbosity=0,
+            running_times_log_file=running_times_log_file,
+        )
+
+    def test_testrunner_sort_tests(self):
+        fast = _tests(tcases.Fast)
+        slow = _tests(tcases.Slow)
+        serialized = _tests(tcases.Serialized)
+        cases = {
+            tcases.Fast: fast,
+            tcases.Slow: slow,
+            tcases.Serialized: serialized,
+        }
+
+        running_times = {
+            fast[0].id(): 1.0,
+            fast[1].id(): 1.0,
+            slow[0].id(): 10.0,
+            slow[1].id(): 5.0,
+        }
+
+        ordered = self.make_runner()._sort_tests(cases, running_times)
+
+        # The longest classes go first, the tests of a class stay
+        # together, and serialized classes become a single suite.
+        # A class without recorded times is assumed to take the
+        # average test time.
+        self.assertEqual(ordered[:2], slow)
+        self.assertIsInstance(ordered[2], unittest.TestSuite)
+        self.assertEqual(list(ordered[2]), serialized)
+        self.assertEqual(ordered[3:], fast)
+
+    def test_testrunner_sort_tests_no_times(self):
+        fast = _tests(tcases.Fast)
+        serialized = _tests(tcases.Serialized)
+        cases = {tcases.Fast: fast, tcases.Serialized: serialized}
+
+        ordered = self.make_runner()._sort_tests(cases, {})
+
+        # Without recorded times, serialized suites go first.
+        self.assertIsInstance(ordered[0], unittest.TestSuite)
+        self.assertEqual(ordered[1:], fast)
+
+    def test_testrunner_running_times_log(self):
+        fast = _tests(tcases.Fast)
+        slow = _tests(tcases.Slow)
+
+        with tempfile.TemporaryDirectory() as td:
+            # The parent directory of the log is created on write.
+            path = os.path.join(td, 'logs', 'running-times.json')
+            test_runner = self.make_runner(path)
+            self.assertEqual(test_runner._read_running_times(), {})
+
+            result = types.SimpleNamespace(test_stats=[
+                (fast[0], {'running-time': 1.5}),
+                (slow[0], {'running-time': 3.0}),
+            ])
+            test_runner._write_running_times(
+                {fast[0].id(): 1.0, fast[1].id(): 2.0}, result)
+
+            self.assertEqual(
+                test_runner._read_running_times(),
+                {
+                    fast[0].id(): 1.5,
+                    fast[1].id(): 2.0,
+                    slow[0].id(): 3.0,
+                },
+            )
+
+            with open(path, 'wt') as f:
+                f.write('not json')
+            self.assertEqual(test_runner._read_running_times(), {})
+
+    def test_testrunner_running_times_log_unwritable(self):
+        fast = _tests(tcases.Fast)
+
+        with tempfile.TemporaryDirectory() as td:
+            # A file in place of the parent directory makes the write
+            # fail, which must not fail the test run.
+            blocker = os.path.join(td, 'blocker')
+            with open(blocker, 'wt'):
+                pass
+
+            test_runner = self.make_runner(
+                os.path.join(blocker, 'running-times.json'))
+            result = types.SimpleNamespace(test_stats=[
+                (fast[0], {'running-time': 1.5}),
+            ])
+            test_runner._write_running_times({}, result)
+            self.assertEqual(test_runner._read_running_times(), {})